@@ -1,13 +1,9 @@
 """Backend application package."""
 
 import logging
-import os
 
-# Set up basic logging
-logging.basicConfig(
-    level=getattr(logging, os.getenv('LOG_LEVEL', 'INFO').upper()),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Handlers are installed by backend.config.logging, which routes all output
+# through a queue listener thread so request handlers never block on I/O
 logger = logging.getLogger(__name__)
 
 # Package version
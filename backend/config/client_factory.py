@@ -2,26 +2,82 @@
 
 import os
 import logging
+import threading
 from typing import Optional
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Fail fast on unreachable hosts; leave room for long completions
+OPENAI_TIMEOUT_SECONDS = 30.0
+OPENAI_CONNECT_TIMEOUT_SECONDS = 5.0
+OPENAI_MAX_RETRIES = 2
+
+# One outbound connection pool shared by every API client built here
+HTTP_MAX_CONNECTIONS = 100
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
+
+_shared_http_client = None
+_shared_http_lock = threading.Lock()
+
+def get_shared_http_client():
+    """Return the process-wide httpx.AsyncClient, creating it on first use."""
+    global _shared_http_client
+    if _shared_http_client is not None and not _shared_http_client.is_closed:
+        return _shared_http_client
+    with _shared_http_lock:
+        if _shared_http_client is None or _shared_http_client.is_closed:
+            import httpx
+
+            _shared_http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                ),
+                timeout=httpx.Timeout(
+                    OPENAI_TIMEOUT_SECONDS, connect=OPENAI_CONNECT_TIMEOUT_SECONDS
+                ),
+            )
+    return _shared_http_client
+
+def discard_shared_http_client() -> None:
+    """Forget the shared client without closing it (its loop is gone)."""
+    global _shared_http_client
+    _shared_http_client = None
+
+async def close_shared_http_client() -> None:
+    """Close the shared httpx client if one was created."""
+    global _shared_http_client
+    client, _shared_http_client = _shared_http_client, None
+    if client is not None:
+        await client.aclose()
+
 def create_openai_client():
-    """Create an OpenAI client with compatibility fixes for different versions."""
+    """Create an OpenAI client with compatibility fixes for different versions.
+
+    The openai package is imported here rather than at module level so its
+    import cost is only paid once a client is actually needed.
+    """
     try:
+        import httpx
         from openai import AsyncOpenAI
         
-        # First try to create client with no http_client (avoids proxies issue)
+        options = {
+            'api_key': os.getenv('OPENAI_API_KEY'),
+            'max_retries': OPENAI_MAX_RETRIES,
+            'timeout': httpx.Timeout(
+                OPENAI_TIMEOUT_SECONDS, connect=OPENAI_CONNECT_TIMEOUT_SECONDS
+            ),
+        }
+        
+        # Pass our own http_client: shares the connection pool and avoids the
+        # proxies argument mismatch between openai and newer httpx releases
         try:
-            return AsyncOpenAI(
-                api_key=os.getenv('OPENAI_API_KEY'),
-                http_client=None
-            )
+            return AsyncOpenAI(http_client=get_shared_http_client(), **options)
         except TypeError:
             # Fallback to standard initialization if http_client param not supported
             logger.debug("Using standard OpenAI client initialization")
-            return AsyncOpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+            return AsyncOpenAI(**options)
             
     except ImportError as e:
         logger.error("Failed to import AsyncOpenAI: %s", e)
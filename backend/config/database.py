@@ -1,9 +1,12 @@
 """Database configuration and connection management."""
 
+import asyncio
 import logging
 import os
+import time
+from contextlib import asynccontextmanager
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Optional, Union
 from urllib.parse import urlparse
 
 import asyncpg
@@ -23,6 +26,46 @@ class DatabaseType(Enum):
     METADATA = "metadata"  # For metadata
 
 
+# Hot queries prepared once on every new pool connection, keyed by name.
+# Modules register their SQL at import time with register_statement().
+PREPARED_STATEMENTS: Dict[str, str] = {}
+
+
+def register_statement(name: str, sql: str) -> str:
+    """Register a query to be prepared on each pool connection."""
+    PREPARED_STATEMENTS[name] = sql
+    return name
+
+
+class PreparedConnection(asyncpg.Connection):
+    """Connection carrying the statements prepared by ``_init_connection``."""
+
+    __slots__ = ("prepared",)
+
+
+async def _init_connection(conn: PreparedConnection) -> None:
+    """Prepare registered statements on a fresh connection."""
+    conn.prepared = {}
+    for name, sql in PREPARED_STATEMENTS.items():
+        try:
+            conn.prepared[name] = await conn.prepare(sql)
+        except asyncpg.PostgresError as e:
+            # A missing table/column must not make the connection unusable
+            logger.warning("Could not prepare statement %s: %s", name, e)
+
+
+async def fetch_prepared(conn, name: str, *args) -> list:
+    """Run a registered query through its prepared statement when available."""
+    statement = getattr(conn, "prepared", {}).get(name)
+    if statement is not None:
+        try:
+            return await statement.fetch(*args)
+        except asyncpg.exceptions.InvalidCachedStatementError:
+            # Schema changed under the statement; drop it and re-run as plain SQL
+            conn.prepared.pop(name, None)
+    return await conn.fetch(PREPARED_STATEMENTS[name], *args)
+
+
 class DatabaseConfig:
     """Database configuration and pool management.
 
@@ -38,6 +81,8 @@ class DatabaseConfig:
             DatabaseType.VECTOR: None,
             DatabaseType.METADATA: None,
         }
+        # Semaphores bounding background work so it cannot starve request handlers
+        self._background_slots: Dict[DatabaseType, asyncio.Semaphore] = {}
         # Get all possible database URLs
         self.database_urls = {
             "default": os.getenv("DATABASE_URL"),
@@ -195,6 +240,8 @@ class DatabaseConfig:
             )
 
             # Create the connection pool
+            pool_settings = config_manager.get_database_config()
+            max_size = pool_settings["max_connections"]
             self._pools[db_type] = await asyncpg.create_pool(
                 user=config["user"],
                 password=config["password"],
@@ -202,11 +249,27 @@ class DatabaseConfig:
                 host=config["host"],
                 port=config["port"],
                 ssl=ssl,
-                min_size=1,
-                max_size=10,
-                command_timeout=60,
-                server_settings={"application_name": f"bartleby_{db_type.value}"},
+                min_size=min(pool_settings["min_connections"], max_size),
+                max_size=max_size,
+                max_inactive_connection_lifetime=pool_settings["idle_lifetime"],
+                # Recycle connections periodically to bound server-side memory growth
+                max_queries=pool_settings["max_queries"],
+                statement_cache_size=1024,
+                # Cached statements stay valid for the life of the connection
+                max_cached_statement_lifetime=0,
+                command_timeout=pool_settings["command_timeout"],
+                # Startup parameters survive the RESET ALL asyncpg runs on
+                # release; a session SET would not. Every query here is a
+                # short OLTP statement, where JIT compilation only adds latency
+                server_settings={
+                    "application_name": f"bartleby_{db_type.value}",
+                    "jit": "off",
+                },
+                connection_class=PreparedConnection,
+                init=_init_connection,
             )
+            # Keep two connections free for request handlers
+            self._background_slots[db_type] = asyncio.Semaphore(max(1, max_size - 2))
             logger.info("%s database pool created successfully", db_type.value)
             return self._pools[db_type]
         except (
@@ -232,6 +295,34 @@ class DatabaseConfig:
             )
             return None
 
+    @asynccontextmanager
+    async def acquire_background(
+        self, db_type: DatabaseType = DatabaseType.METADATA
+    ) -> AsyncIterator[asyncpg.Connection]:
+        """Acquire a connection for background work.
+
+        Background acquisitions share a semaphore sized below the pool maximum,
+        so long-running processing cannot hold every connection.
+        """
+        pool = await self.get_pool(db_type)
+        if pool is None:
+            raise RuntimeError(f"{db_type.value} database pool is not available.")
+        async with self._background_slots[db_type]:
+            async with pool.acquire() as conn:
+                yield conn
+
+    def open_pool(self, db_type: DatabaseType) -> Optional[asyncpg.Pool]:
+        """Return the pool for ``db_type`` if it has been created, without creating it."""
+        return self._pools[db_type]
+
+    def pool_stats(self) -> Dict[str, Dict[str, int]]:
+        """Return current and idle connection counts for each open pool."""
+        return {
+            db_type.value: {"size": pool.get_size(), "idle": pool.get_idle_size()}
+            for db_type, pool in self._pools.items()
+            if pool is not None
+        }
+
     async def close_pools(self) -> None:
         """Close all database connection pools."""
         for db_type, pool in self._pools.items():
@@ -263,12 +354,15 @@ async def get_db_pool() -> Optional[asyncpg.Pool]:
     return pool
 
 
-async def get_vector_pool() -> Optional[Union[asyncpg.Pool, "QdrantService"]]:
-    """Get the vector database connection.
+# Seconds a vector backend decision is reused before Qdrant is checked again
+VECTOR_BACKEND_TTL = 30.0
 
-    Returns Qdrant service instance for vector operations.
-    Falls back to PostgreSQL pool if Qdrant is unavailable.
-    """
+# [monotonic expiry, healthy Qdrant service or None] for the last decision
+_vector_backend = [0.0, None]
+
+
+async def _healthy_qdrant() -> Optional["QdrantService"]:
+    """Return the Qdrant service if it reports healthy, else None."""
     try:
         # Try to import and use Qdrant service
         from backend.services.vector.qdrant_service import qdrant_service
@@ -285,6 +379,23 @@ async def get_vector_pool() -> Optional[Union[asyncpg.Pool, "QdrantService"]]:
 
     except (ImportError, ModuleNotFoundError, ConnectionError) as e:
         logger.warning("Qdrant service unavailable, falling back to PostgreSQL: %s", e)
+    return None
+
+
+async def get_vector_pool() -> Optional[Union[asyncpg.Pool, "QdrantService"]]:
+    """Get the vector database connection.
+
+    Returns Qdrant service instance for vector operations.
+    Falls back to PostgreSQL pool if Qdrant is unavailable. The choice is
+    reused for VECTOR_BACKEND_TTL seconds rather than health-checking
+    Qdrant on every call.
+    """
+    now = time.monotonic()
+    if now >= _vector_backend[0]:
+        _vector_backend[1] = await _healthy_qdrant()
+        _vector_backend[0] = now + VECTOR_BACKEND_TTL
+    if _vector_backend[1] is not None:
+        return _vector_backend[1]
 
     # Fallback to PostgreSQL vector pool
     pool = await db_config.get_pool(DatabaseType.VECTOR)
@@ -298,26 +409,16 @@ async def get_vector_pool() -> Optional[Union[asyncpg.Pool, "QdrantService"]]:
 
 
 class DatabaseManager:
-    def __init__(self):
-        self._metadata_pool = None
-        self._vector_pool = None
+    """Thin accessor that shares the pools owned by ``db_config``."""
 
     async def get_metadata_pool(self):
-        if not self._metadata_pool:
-            config = config_manager.get_database_config()
-            self._metadata_pool = await asyncpg.create_pool(
-                config["metadata_url"],
-                min_size=config["min_connections"],
-                max_size=config["max_connections"],
-            )
-        return self._metadata_pool
+        return await db_config.get_pool(DatabaseType.METADATA)
 
     async def get_vector_pool(self):
-        if not self._vector_pool:
-            config = config_manager.get_database_config()
-            if config["vector_url"]:
-                self._vector_pool = await asyncpg.create_pool(config["vector_url"])
-        return self._vector_pool
+        config = config_manager.get_database_config()
+        if not config["vector_url"]:
+            return None
+        return await db_config.get_pool(DatabaseType.VECTOR)
 
 
 # Global instance
@@ -328,6 +429,11 @@ async def get_metadata_pool():
     return await db_manager.get_metadata_pool()
 
 
+def background_connection(db_type: DatabaseType = DatabaseType.METADATA):
+    """Acquire a connection for background work with bounded concurrency."""
+    return db_config.acquire_background(db_type)
+
+
 def is_qdrant_service(vector_client) -> bool:
     """Check if the vector client is a Qdrant service instance."""
     try:
@@ -1,8 +1,11 @@
 """Logging configuration and setup."""
 
+import atexit
 import os
+import queue
 import sys
 import logging
+import logging.handlers
 from pathlib import Path
 from typing import Optional, Dict, Any
 import json
@@ -52,6 +55,19 @@ class LogConfig:
             print(f"Failed to create log directory: {e}", file=sys.stderr)
             self.log_file = None
 
+        self._listener: Optional[logging.handlers.QueueListener] = None
+        # Registered once; it stops whichever listener is current at exit
+        atexit.register(self._stop_listener)
+
+    def _stop_listener(self) -> None:
+        """Flush and stop the current listener, closing its handlers."""
+        listener, self._listener = self._listener, None
+        if listener is None:
+            return
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
     def setup_logging(self) -> None:
         """Configure logging with file and console handlers."""
         # Create formatter
@@ -63,24 +79,35 @@ class LogConfig:
         root_logger = logging.getLogger()
         root_logger.setLevel(self.log_level)
 
-        # Remove existing handlers
+        # Remove existing handlers; a repeated setup replaces the previous
+        # listener instead of leaving it running alongside the new one
         for handler in root_logger.handlers[:]:
             root_logger.removeHandler(handler)
+        self._stop_listener()
 
         # Add console handler
         console_handler = logging.StreamHandler()
         console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
+        handlers = [console_handler]
 
         # Add file handler if log file is available
         if self.log_file:
             try:
                 file_handler = logging.FileHandler(str(self.log_file))
                 file_handler.setFormatter(formatter)
-                root_logger.addHandler(file_handler)
+                handlers.append(file_handler)
             except Exception as e:
                 print(f"Failed to create file handler: {e}", file=sys.stderr)
 
+        # Stream and file writes happen on the listener thread, so logging
+        # from a request handler never blocks the event loop on I/O
+        log_queue = queue.SimpleQueue()
+        self._listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        self._listener.start()
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
     def get_logger(self, name: str) -> logging.Logger:
         """Get a logger with the specified name."""
         return logging.getLogger(name)
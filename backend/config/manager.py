@@ -36,6 +36,13 @@ class ConfigManager:
         except (ValueError, TypeError):
             return default
 
+    def get_float(self, key: str, default: float = 0.0) -> float:
+        """Get float configuration value."""
+        try:
+            return float(self.get(key, default))
+        except (ValueError, TypeError):
+            return default
+
     def get_bool(self, key: str, default: bool = False) -> bool:
         """Get boolean configuration value."""
         value = self.get(key, str(default)).lower()
@@ -65,11 +72,21 @@ class ConfigManager:
     @lru_cache(maxsize=1)
     def get_database_config(self) -> Dict[str, Optional[Union[str, int]]]:
         """Get database configuration."""
+        # Pool sizes default from the core count (cores * 2 + 1 warm connections)
+        cpu_count = os.cpu_count() or 1
         return {
             'metadata_url': self.get('DATABASE_URL'),
             'vector_url': self.get('NEON_DATABASE_URL') or self.get('VECTOR_DATABASE_URL'),
-            'min_connections': self.get_int('DB_MIN_CONNECTIONS', 1),
-            'max_connections': self.get_int('DB_MAX_CONNECTIONS', 10),
+            # DB_POOL_MIN/DB_POOL_MAX take precedence over the older DB_*_CONNECTIONS names
+            'min_connections': self.get_int(
+                'DB_POOL_MIN', self.get_int('DB_MIN_CONNECTIONS', max(4, cpu_count * 2 + 1))
+            ),
+            'max_connections': self.get_int(
+                'DB_POOL_MAX', self.get_int('DB_MAX_CONNECTIONS', max(25, cpu_count * 4 + 1))
+            ),
+            'max_queries': self.get_int('DB_POOL_MAX_QUERIES', 50000),
+            'idle_lifetime': self.get_float('DB_POOL_IDLE_LIFETIME', 300.0),
+            'command_timeout': self.get_int('DB_COMMAND_TIMEOUT', 60),
             'connection_timeout': self.get_int('DB_CONNECTION_TIMEOUT', 30)
         }
 
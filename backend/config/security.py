@@ -1,11 +1,15 @@
 """Security configuration for the application."""
 
+import functools
+import logging
 import os
 import urllib.parse  # Import for URL encoding in GoogleOAuthConfig
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 from .manager import config_manager
 
+logger = logging.getLogger(__name__)
+
 
 class CORSConfig:
     """Production-ready CORS configuration with environment-aware origin management."""
@@ -39,12 +43,59 @@ class CORSConfig:
         "https://*.hocomnia.com",
         "https://*.onrender.com",
     ]
+    # Domain suffixes of the https://*. patterns, matched with one endswith()
+    _WILDCARD_SUFFIXES = tuple(
+        "." + pattern[len("https://*."):]
+        for pattern in WILDCARD_PATTERNS
+        if pattern.startswith("https://*.")
+    )
 
     @staticmethod
-    def get_environment_origins() -> List[str]:
-        """Get origins based on current environment."""
-        env = os.getenv("ENVIRONMENT", "development").lower()
-        
+    def is_valid_origin(origin: str) -> bool:
+        """Check that an origin is a bare scheme://host[:port] with nothing after it.
+
+        Catches malformed entries such as two origins fused together by a
+        missing separator (``https://a.comhttps://b.com``).
+        """
+        try:
+            parsed = urllib.parse.urlsplit(origin)
+        except ValueError:
+            return False
+        return (
+            parsed.scheme in ("http", "https")
+            and bool(parsed.hostname)
+            and not parsed.path
+            and not parsed.query
+            and not parsed.fragment
+        )
+
+    @staticmethod
+    def _parse_origin_list(value: str, source: str) -> List[str]:
+        """Split a comma-separated origin list, dropping invalid entries."""
+        origins = []
+        for origin in value.split(","):
+            origin = origin.strip()
+            if not origin:
+                continue
+            if CORSConfig.is_valid_origin(origin):
+                origins.append(origin)
+            else:
+                logger.warning("Ignoring invalid CORS origin in %s: %r", source, origin)
+        return origins
+
+    @staticmethod
+    def _origin_env() -> Tuple[str, str, str]:
+        """Environment values that determine the allowed origin list."""
+        return (
+            os.getenv("ENVIRONMENT", "development").lower(),
+            os.getenv("CORS_ORIGINS", ""),
+            os.getenv("ALLOWED_ORIGINS", ""),
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=16)
+    def _resolve_origins(env: str, env_origins: str, additional_origins: str) -> Tuple[str, ...]:
+        """Build the ordered, de-duplicated origin list for one set of env values."""
         if env == "production":
             base_origins = CORSConfig.PRODUCTION_ORIGINS.copy()
         elif env in ["staging", "preview"]:
@@ -53,26 +104,26 @@ class CORSConfig:
             base_origins = CORSConfig.DEVELOPMENT_ORIGINS.copy()
         
         # Add environment-specific origins from config
-        env_origins = os.getenv("CORS_ORIGINS", "")
         if env_origins:
-            additional_origins = [origin.strip() for origin in env_origins.split(",") if origin.strip()]
-            base_origins.extend(additional_origins)
+            base_origins.extend(CORSConfig._parse_origin_list(env_origins, "CORS_ORIGINS"))
         
         # Add additional allowed origins if specified
-        additional_origins = os.getenv("ALLOWED_ORIGINS", "")
         if additional_origins:
-            extra_origins = [origin.strip() for origin in additional_origins.split(",") if origin.strip()]
-            base_origins.extend(extra_origins)
+            base_origins.extend(CORSConfig._parse_origin_list(additional_origins, "ALLOWED_ORIGINS"))
         
         # Remove duplicates while preserving order
-        seen = set()
-        unique_origins = []
-        for origin in base_origins:
-            if origin not in seen:
-                seen.add(origin)
-                unique_origins.append(origin)
-        
-        return unique_origins
+        return tuple(dict.fromkeys(base_origins))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=16)
+    def _origin_set(env: str, env_origins: str, additional_origins: str) -> FrozenSet[str]:
+        """Exact-match lookup set for one set of env values."""
+        return frozenset(CORSConfig._resolve_origins(env, env_origins, additional_origins))
+
+    @staticmethod
+    def get_environment_origins() -> List[str]:
+        """Get origins based on current environment."""
+        return list(CORSConfig._resolve_origins(*CORSConfig._origin_env()))
 
     @staticmethod
     def get_origins() -> List[str]:
@@ -137,21 +188,15 @@ class CORSConfig:
         if not origin:
             return False
 
-        # Get environment-specific allowed origins
-        allowed_origins = CORSConfig.get_environment_origins()
-
-        # Check for exact match first
-        if origin in allowed_origins:
+        # Check for exact match first (env values are read each call, the
+        # origin set is only rebuilt when they change)
+        origin_env = CORSConfig._origin_env()
+        if origin in CORSConfig._origin_set(*origin_env):
             return True
 
         # Check for wildcard patterns
-        for pattern in CORSConfig.WILDCARD_PATTERNS:
-            if pattern.startswith("https://*."):
-                # Extract the domain part after the asterisk
-                domain_suffix = pattern.replace("https://*.", "")
-                # Check if the origin ends with this domain suffix
-                if origin.startswith("https://") and origin.endswith(f".{domain_suffix}"):
-                    return True
+        if origin.startswith("https://") and origin.endswith(CORSConfig._WILDCARD_SUFFIXES):
+            return True
 
         # Enhanced hocomnia.com support - allow all subdomains and the main domain
         if origin.startswith("https://") and (
@@ -162,7 +207,7 @@ class CORSConfig:
             return True
 
         # Support for Vercel preview deployments (environment permitting)
-        env = os.getenv("ENVIRONMENT", "development").lower()
+        env = origin_env[0]
         if env in ["development", "staging", "preview"]:
             if origin.startswith("https://") and ".vercel.app" in origin:
                 return True
@@ -282,11 +327,13 @@ class SecurityConfig:
         return headers
 
 
+@functools.cache
 def get_security_config() -> SecurityConfig:
     """Get security configuration instance."""
     return SecurityConfig()
 
 
+@functools.cache
 def get_cors_config() -> CORSConfig:
     """Get CORS configuration instance."""
     return CORSConfig()
@@ -375,6 +422,7 @@ class GoogleOAuthConfig:
         return f"https://accounts.google.com/o/oauth2/v2/auth?{query_string}"
 
 
+@functools.cache
 def get_google_oauth_config() -> GoogleOAuthConfig:
     """Get Google OAuth configuration instance."""
     return GoogleOAuthConfig()
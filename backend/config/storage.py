@@ -174,23 +174,35 @@ class StorageConfig:
         return user_thumb_dir / filename
 
     def cleanup_temp_files(self, user_id: Optional[int] = None) -> None:
-        """Clean up temporary files for a user or all users."""
+        """Clean up temporary files for a user or all users (blocking)."""
         try:
+            temp_root = self.paths["TEMP_DIR"]
             if user_id:
-                temp_dir = self.paths["TEMP_DIR"] / str(user_id)
-                if temp_dir.exists():
-                    for item in temp_dir.iterdir():
-                        if item.is_file():
-                            item.unlink()
+                self._remove_files(temp_root / str(user_id))
             else:
-                for user_dir in self.paths["TEMP_DIR"].iterdir():
-                    if user_dir.is_dir():
-                        for item in user_dir.iterdir():
-                            if item.is_file():
-                                item.unlink()
+                with os.scandir(temp_root) as entries:
+                    user_dirs = [
+                        entry.path for entry in entries
+                        if entry.is_dir(follow_symlinks=False)
+                    ]
+                for user_dir in user_dirs:
+                    self._remove_files(user_dir)
         except Exception as e:
             logger.error(f"Error cleaning up temporary files: {e}")
 
+    @staticmethod
+    def _remove_files(directory) -> None:
+        """Unlink the regular files directly inside a directory, if it exists."""
+        # DirEntry type checks come from the directory listing itself, so
+        # each file costs one unlink rather than extra stat calls
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False):
+                        os.unlink(entry.path)
+        except FileNotFoundError:
+            pass
+
     async def cleanup(self) -> None:
         """Clean up resources on shutdown."""
         # Currently a no-op, but included for compatibility with the app's lifecycle
@@ -4,7 +4,7 @@ This file has been optimized to eliminate code duplication by delegating to cent
 
 import logging
 from .config.manager import config_manager
-from .services import get_storage_manager, get_document_processor
+from .services import aget_document_processor, get_storage_manager, get_document_processor
 
 logger = logging.getLogger(__name__)
 
@@ -65,10 +65,12 @@ async def delete_document(document_url: str) -> bool:
 
 async def process_document(doc_id: int, file_path: str):
     """Process a document using centralized document processor."""
-    if document_processor:
+    # Not built at import time if the metadata pool was not open yet
+    processor = document_processor or await aget_document_processor()
+    if processor:
         # The correct method is likely 'process', not 'process_document'
         # If this is incorrect, update to the actual method name of your processor
-        return await document_processor.process(doc_id, file_path)
+        return await processor.process(doc_id, file_path)
     logger.error("Document processor not available")
 
 
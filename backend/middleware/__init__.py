@@ -1,11 +1,13 @@
 """Middleware components for the backend application."""
 
 from .auth_security import AuthSecurityMiddleware
+from .compression import setup_compression
 from .error_handlers import setup_error_handlers
 from .request_logger import setup_request_logging as setup_request_logger
 
 __all__ = [
     'AuthSecurityMiddleware',
+    'setup_compression',
     'setup_error_handlers',
     'setup_request_logger'
 ]
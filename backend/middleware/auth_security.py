@@ -4,6 +4,7 @@ Consolidates security concerns into a single module
 """
 
 import asyncio
+import functools
 import logging
 import os
 import time
@@ -15,12 +16,24 @@ import jwt
 from quart import Quart, Request, Response, current_app, request, jsonify
 
 from backend.config.manager import config_manager
+from backend.config.security import CORSConfig, SecurityConfig
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Browsers may cache an answered preflight for this long (seconds)
+PREFLIGHT_MAX_AGE = 86400
+PREFLIGHT_ALLOW_METHODS = "GET, POST, PUT, DELETE, OPTIONS, PATCH"
+PREFLIGHT_ALLOW_HEADERS = ", ".join([
+    "Content-Type", "Authorization", "Accept", "X-Requested-With",
+    "Content-Length", "Accept-Encoding", "X-CSRF-Token",
+    "google-oauth-token", "google-client-id", "g-csrf-token",
+    "X-Google-OAuth-Token", "X-Google-Client-ID", "Accept-Language",
+    "Cache-Control", "X-API-Key", "X-Auth-Token",
+])
+
+@dataclass(slots=True)
 class RateLimitInfo:
-    """Rate limiting information for an IP"""
+    """Rate limiting information for an IP (one per client, so slotted)"""
     count: int = 0
     reset_time: datetime = datetime.now()
 
@@ -39,12 +52,33 @@ class AuthSecurityMiddleware:
         self.rate_window = rate_window
         self.max_body_size = max_body_size
         self.rate_limits: Dict[str, RateLimitInfo] = {}
+        self._cleanup_task: Optional[asyncio.Task] = None
 
         # Get configuration
         self.cors_origins = self._get_cors_origins()
         self.cors_enabled = os.getenv("CORS_ENABLED", "true").lower() == "true"
         self.allow_credentials = os.getenv("ALLOW_CREDENTIALS", "true").lower() == "true"
 
+        # Origin checks run on every request: exact matches hit the frozenset,
+        # wildcard/pattern decisions are memoized per origin
+        self._allowed_origins = frozenset(self.cors_origins)
+        self._origin_matches_pattern = functools.lru_cache(maxsize=1024)(
+            CORSConfig.is_origin_allowed
+        )
+        self._preflight_headers = functools.lru_cache(maxsize=1024)(
+            self._build_preflight_headers
+        )
+        # Same for every allowed-origin response, so built once here
+        self._cors_response_headers = {
+            "Access-Control-Allow-Methods": PREFLIGHT_ALLOW_METHODS,
+            "Access-Control-Allow-Headers": PREFLIGHT_ALLOW_HEADERS,
+        }
+        if self.allow_credentials:
+            self._cors_response_headers["Access-Control-Allow-Credentials"] = "true"
+        # Security headers (including the CSP string) depend only on the
+        # environment, so they are resolved once rather than per response
+        self._security_headers = tuple(SecurityConfig.get_security_headers().items())
+
         # Setup cleanup and middleware
         self._setup_cleanup_task()
         self._setup_middleware(app)
@@ -53,18 +87,23 @@ class AuthSecurityMiddleware:
 
     def _get_cors_origins(self) -> List[str]:
         """Get CORS origins from centralized configuration"""
-        from backend.config.security import CORSConfig
         return CORSConfig.get_environment_origins()
 
     def _is_origin_allowed(self, origin: str) -> bool:
         """Check if origin is allowed using centralized configuration"""
-        from backend.config.security import CORSConfig
-        return CORSConfig.is_origin_allowed(origin)
-
-    def _get_security_headers(self) -> Dict[str, str]:
-        """Get security headers from centralized configuration"""
-        from backend.config.security import SecurityConfig
-        return SecurityConfig.get_security_headers()
+        return origin in self._allowed_origins or self._origin_matches_pattern(origin)
+
+    def _build_preflight_headers(self, origin: str) -> Dict[str, str]:
+        """Build the full preflight response header set for an allowed origin"""
+        return {
+            "Access-Control-Allow-Origin": origin,
+            "Access-Control-Allow-Methods": PREFLIGHT_ALLOW_METHODS,
+            "Access-Control-Allow-Headers": PREFLIGHT_ALLOW_HEADERS,
+            "Access-Control-Allow-Credentials": "true" if self.allow_credentials else "false",
+            "Access-Control-Max-Age": str(PREFLIGHT_MAX_AGE),
+            "Cache-Control": f"public, max-age={PREFLIGHT_MAX_AGE}",
+            "Vary": "Origin",
+        }
 
     def _setup_middleware(self, app: Quart) -> None:
         """Setup all middleware functions"""
@@ -76,27 +115,11 @@ class AuthSecurityMiddleware:
 
             # Handle CORS preflight requests
             if request.method == "OPTIONS" and self.cors_enabled:
-                logger.info(f"🔍 CORS Preflight - Origin: {origin}")
-
                 if origin and self._is_origin_allowed(origin):
-                    logger.info(f"✅ CORS Preflight - Origin allowed: {origin}")
-                    headers = {
-                        "Access-Control-Allow-Origin": origin,
-                        "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE, OPTIONS, PATCH",
-                        "Access-Control-Allow-Headers": ", ".join([
-                            "Content-Type", "Authorization", "Accept", "X-Requested-With",
-                            "Content-Length", "Accept-Encoding", "X-CSRF-Token",
-                            "google-oauth-token", "google-client-id", "g-csrf-token",
-                            "X-Google-OAuth-Token", "X-Google-Client-ID", "Accept-Language",
-                            "Cache-Control", "X-API-Key", "X-Auth-Token",
-                        ]),
-                        "Access-Control-Allow-Credentials": "true" if self.allow_credentials else "false",
-                        "Access-Control-Max-Age": "3600",
-                        "Vary": "Origin",
-                    }
-                    return "", 204, headers
-                else:
-                    logger.warning(f"❌ CORS Preflight - Origin not allowed: {origin}")
+                    return current_app.response_class(
+                        "", status=204, headers=self._preflight_headers(origin)
+                    )
+                logger.warning("❌ CORS Preflight - Origin not allowed: %s", origin)
 
             # Skip other security checks for OPTIONS requests
             if request.method == "OPTIONS":
@@ -105,44 +128,44 @@ class AuthSecurityMiddleware:
             # Security checks
             content_length = request.content_length
             if content_length and content_length > self.max_body_size:
-                logger.warning(f"Request too large: {content_length} bytes")
+                logger.warning("Request too large: %d bytes", content_length)
                 return current_app.response_class("Request entity too large", status=413)
 
             # Rate limiting (skip for auth routes)
             path = request.path.lower()
             if not path.startswith("/api/auth/"):
                 if not await self._check_rate_limit():
-                    logger.warning(f"Rate limit exceeded for IP: {request.remote_addr}")
+                    logger.warning("Rate limit exceeded for IP: %s", request.remote_addr)
                     return current_app.response_class("Rate limit exceeded", status=429)
 
         @app.after_request
         async def add_cors_and_security_headers(response: Response) -> Response:
             """Add CORS and security headers to all responses"""
+            # Answered preflights already carry their complete header set
+            if request.method == "OPTIONS" and response.status_code == 204:
+                return response
+
             origin = request.headers.get("Origin")
 
             # Add security headers
-            headers = self._get_security_headers()
-            response.headers.update(headers)
+            for name, value in self._security_headers:
+                response.headers[name] = value
 
             # Add CORS headers if enabled
             if self.cors_enabled:
-                logger.info(f"🔍 CORS Response - Origin: {origin}, Path: {request.path}")
-
                 if origin and self._is_origin_allowed(origin):
-                    logger.info(f"✅ CORS Response - Setting headers for origin: {origin}")
-                    response.headers.set("Access-Control-Allow-Origin", origin)
-                    if self.allow_credentials:
-                        response.headers.set("Access-Control-Allow-Credentials", "true")
-                    response.headers.set("Vary", "Origin")
+                    response.headers["Access-Control-Allow-Origin"] = origin
+                    for name, value in self._cors_response_headers.items():
+                        response.headers.setdefault(name, value)
+                    response.vary.add("Origin")
                 elif origin:
-                    logger.warning(f"❌ CORS Response - Origin not allowed: {origin}")
+                    logger.warning("❌ CORS Response - Origin not allowed: %s", origin)
                 else:
                     # For requests without Origin header
                     logger.debug("🔍 CORS Response - No Origin header, setting basic headers")
                     response.headers.set("Access-Control-Allow-Origin", "*")
-                    response.headers.set(
-                        "Access-Control-Allow-Methods",
-                        "GET, POST, PUT, DELETE, OPTIONS, PATCH"
+                    response.headers.setdefault(
+                        "Access-Control-Allow-Methods", PREFLIGHT_ALLOW_METHODS
                     )
 
             # Add rate limit headers for non-auth routes
@@ -200,8 +223,10 @@ class AuthSecurityMiddleware:
                     await asyncio.sleep(60)
 
         try:
-            loop = asyncio.get_running_loop()
-            loop.create_task(cleanup_rate_limits())
+            # Keep a reference so the task is not garbage collected mid-run
+            self._cleanup_task = asyncio.get_running_loop().create_task(
+                cleanup_rate_limits()
+            )
         except RuntimeError:
             logger.warning("No event loop running, skipping rate limit cleanup task")
 
@@ -211,7 +236,6 @@ def require_auth():
     """Decorator to require authentication for routes"""
     def decorator(f):
         async def decorated_function(*args, **kwargs):
-            from quart import jsonify  # Import within function context
             try:
                 # Get access token from cookies or Authorization header
                 access_token = request.cookies.get("access_token")
@@ -254,7 +278,6 @@ def require_admin():
     """Decorator to require admin privileges for routes"""
     def decorator(f):
         async def decorated_function(*args, **kwargs):
-            from quart import jsonify  # Import within function context
             try:
                 # First require authentication
                 auth_decorator = require_auth()
@@ -0,0 +1,62 @@
+"""Response compression middleware for JSON payloads."""
+import gzip
+import logging
+
+from quart import Quart, Response, request
+
+logger = logging.getLogger(__name__)
+
+# Bodies below roughly one TCP segment are not worth compressing
+DEFAULT_MIN_SIZE = 1400
+# Level 1 favours speed over ratio; JSON still shrinks several-fold
+DEFAULT_LEVEL = 1
+
+
+class CompressionMiddleware:
+    """Gzip-compress JSON responses for clients that accept it."""
+
+    def __init__(self, app: Quart,
+                 min_size: int = DEFAULT_MIN_SIZE,
+                 level: int = DEFAULT_LEVEL):
+        self.app = app
+        self.min_size = min_size
+        self.level = level
+
+        self._setup_middleware(app)
+        logger.info("Response compression middleware initialized")
+
+    def _should_compress(self, response: Response) -> bool:
+        """Check whether a response is eligible for compression."""
+        if request.method == "HEAD" or response.status_code < 200 or response.status_code == 204:
+            return False
+        if "Content-Encoding" in response.headers:
+            return False
+        if not (response.mimetype or "").startswith("application/json"):
+            return False
+        return "gzip" in request.headers.get("Accept-Encoding", "").lower()
+
+    def _setup_middleware(self, app: Quart) -> None:
+        """Register the compression hook."""
+
+        @app.after_request
+        async def compress_response(response: Response) -> Response:
+            """Compress eligible JSON bodies in place."""
+            if not self._should_compress(response):
+                return response
+
+            data = await response.get_data()
+            if len(data) < self.min_size:
+                return response
+
+            response.set_data(gzip.compress(data, compresslevel=self.level))
+            response.headers["Content-Encoding"] = "gzip"
+            response.vary.add("Accept-Encoding")
+            return response
+
+
+def setup_compression(app: Quart,
+                      min_size: int = DEFAULT_MIN_SIZE,
+                      level: int = DEFAULT_LEVEL) -> Quart:
+    """Set up gzip compression for JSON responses."""
+    CompressionMiddleware(app, min_size=min_size, level=level)
+    return app
@@ -11,7 +11,7 @@ from quart import Blueprint, jsonify, request
 
 from backend.config.database import get_metadata_pool
 from backend.routes.auth_routes import verify_token
-from backend.services.openai_service import openai_service
+from backend.services import get_openai_service
 from backend.utils.decorators import async_error_handler
 
 logger = logging.getLogger(__name__)
@@ -90,7 +90,7 @@ async def get_dashboard_summary():
             }
         
         # Generate AI insights if requested
-        if include_insights and openai_service.is_available:
+        if include_insights and get_openai_service().is_available:
             try:
                 logger.info("🔄 Generating AI insights for dashboard summary")
                 
@@ -100,7 +100,7 @@ async def get_dashboard_summary():
                     "date_range": summary["date_range"]
                 }
                 
-                insights_result = await openai_service.generate_insights(
+                insights_result = await get_openai_service().generate_insights(
                     data_type="dashboard",
                     data=insight_data,
                     context=f"Dashboard summary for {period} period"
@@ -178,7 +178,7 @@ async def get_document_stats():
 async def get_trend_insights():
     """Get AI-powered trend insights"""
     try:
-        if not openai_service.is_available:
+        if not get_openai_service().is_available:
             return jsonify({
                 "error": "AI insights service not available",
                 "trends": []
@@ -192,7 +192,7 @@ async def get_trend_insights():
             trend_data = await _get_trend_data(conn, start_date)
         
         # Generate AI insights
-        insights_result = await openai_service.generate_insights(
+        insights_result = await get_openai_service().generate_insights(
             data_type="trends",
             data=trend_data,
             context=f"Trend analysis for {period} period"
@@ -1,55 +1,117 @@
 """Document routes and storage logic for document management."""
 
+import asyncio
 import os
 import logging
 from io import BytesIO
-from quart import Blueprint, request, jsonify, send_file
+from pathlib import Path
+from quart import Blueprint, redirect, request, send_file
 from asyncpg import PostgresError
-from backend.config.database import get_vector_pool, get_metadata_pool
+from pydantic import ValidationError
+from backend.config.database import (
+    fetch_prepared,
+    get_metadata_pool,
+    get_vector_pool,
+    register_statement,
+)
 from backend.config.storage import storage_config
+from backend.services import get_openai_client
 from backend.services.storage.manager import storage_manager
-from backend.config.client_factory import create_openai_client
+from backend.services.listing_cache import DOCUMENTS_CHANNEL, listing_cache
+from backend.utils.pagination import get_pagination
+from backend.utils.responses import encode_rows, ojson, raw_json
+from backend.utils.schemas import SearchDocumentsRequest, parse_body, validation_details
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-# Initialize OpenAI client for vector embeddings safely
-openai_client = create_openai_client()
-
 # Create blueprint
 documents_bp = Blueprint('documents', __name__)
 
+# Excerpt computed in SQL so search never ships full extracted_text over the wire.
+HEADLINE_SQL = """ts_headline(
+                    'english', COALESCE(extracted_text, ''),
+                    plainto_tsquery('english', {query_param}),
+                    'MaxFragments=1, MaxWords=30, MinWords=15'
+                )"""
+
+# Full-text predicates keyed by the request's ``field`` option. search_tsv is
+# weighted A (title/author), B (thesis/summary), C (extracted_text); the GIN
+# index narrows candidates and ts_filter rechecks the requested weights.
+# hashtags is TEXT[] and cannot feed the generated column, so metadata/all
+# match it as a whole tag through idx_documents_hashtags instead: "#ml"
+# finds a document tagged "#ml", but a partial tag no longer matches as it
+# did under the old ILIKE search.
+_TSV_MATCH = "search_tsv @@ plainto_tsquery('english', $2)"
+_TAG_MATCH = "hashtags @> ARRAY[$2]"
+_TEXT_SEARCH_WHERE = {
+    'content': f"{_TSV_MATCH} AND ts_filter(search_tsv, '{{c}}') @@ plainto_tsquery('english', $2)",
+    'metadata': f"(({_TSV_MATCH} AND ts_filter(search_tsv, '{{a,b}}') @@ plainto_tsquery('english', $2)) OR {_TAG_MATCH})",
+    'all': f"({_TSV_MATCH} OR {_TAG_MATCH})",
+}
+
+# Built once so every request sends byte-identical SQL and hits asyncpg's
+# per-connection prepared statement cache instead of re-parsing.
+TEXT_SEARCH_SQL = {
+    field: f"""
+                SELECT id, title, author, summary,
+                {HEADLINE_SQL.format(query_param='$2')} AS excerpt
+                FROM user_documents
+                WHERE user_id = $1 AND {predicate}
+                ORDER BY ts_rank(search_tsv, plainto_tsquery('english', $2)) DESC
+                LIMIT 100
+            """
+    for field, predicate in _TEXT_SEARCH_WHERE.items()
+}
+
+LIST_DOCUMENTS_STMT = register_statement('documents.list', """
+    SELECT id, title, author, journal_publisher, publication_year,
+    page_length, thesis, issue, summary, category, field,
+    hashtags, influenced_by, file_path, file_type, created_at
+    FROM user_documents
+    WHERE user_id = $1
+    ORDER BY created_at DESC
+    LIMIT $2 OFFSET $3
+""")
+
+# One prepared statement per search field option
+TEXT_SEARCH_STMTS = {
+    field: register_statement(f'documents.search.{field}', sql)
+    for field, sql in TEXT_SEARCH_SQL.items()
+}
+
 @documents_bp.route('/api/documents', methods=['GET'])
 async def get_documents():
-    """Get all documents for a user."""
+    """Get a page of documents for a user (``?limit=&offset=``)."""
     try:
         metadata_pool = await get_metadata_pool()
         if not metadata_pool:
-            return jsonify({"error": "Database unavailable"}), 503
+            return ojson({"error": "Database unavailable"}, 503)
             
+        # Get user_id from request or headers
+        user_id = getattr(request, 'user_id', request.headers.get('X-User-ID'))
+        if not user_id:
+            return ojson({"error": "User ID is required"}, 400)
+        limit, offset = get_pagination(request.args)
+        cache_key = (int(user_id), limit, offset)
+        cached = listing_cache.get(DOCUMENTS_CHANNEL, cache_key)
+        if cached is not None:
+            return raw_json(cached)
+        generation = listing_cache.generation(DOCUMENTS_CHANNEL)
+
         async with metadata_pool.acquire() as conn:
-                # Get user_id from request or headers
-                user_id = getattr(request, 'user_id', request.headers.get('X-User-ID'))
-                if not user_id:
-                    return jsonify({"error": "User ID is required"}), 400
-                rows = await conn.fetch(
-                    """
-                    SELECT id, title, author, journal_publisher, publication_year,
-                    page_length, thesis, issue, summary, category, field,
-                    hashtags, influenced_by, file_path, file_type, created_at
-                    FROM user_documents
-                    WHERE user_id = $1 
-                    ORDER BY created_at DESC
-                    """,
-                    int(user_id)
+                rows = await fetch_prepared(
+                    conn, LIST_DOCUMENTS_STMT, int(user_id), limit, offset
                 )
-                return jsonify([dict(row) for row in rows])
+                payload = await encode_rows(rows)
+                listing_cache.set(DOCUMENTS_CHANNEL, cache_key, payload, generation)
+                return raw_json(payload)
     except PostgresError as e:
         logger.error("Error fetching documents: %s", e)
-        return jsonify({"error": "Failed to fetch documents"}), 500
+        return ojson({"error": "Failed to fetch documents"}, 500)
     except Exception as e:
         logger.error("Unexpected error fetching documents: %s", e)
-        return jsonify({"error": "Failed to fetch documents"}), 500
+        return ojson({"error": "Failed to fetch documents"}, 500)
 
 @documents_bp.route('/api/documents/content', methods=['GET'])
 async def get_document_content():
@@ -59,13 +121,13 @@ async def get_document_content():
         document_id = request.args.get('id')
         
         if not document_url and not document_id:
-            return jsonify({"error": "URL or ID parameter is required"}), 400
+            return ojson({"error": "URL or ID parameter is required"}, 400)
 
         # If document_id is provided, get the URL from the database
         if document_id:
             metadata_pool = await get_metadata_pool()
             if not metadata_pool:
-                return jsonify({"error": "Database unavailable"}), 503
+                return ojson({"error": "Database unavailable"}, 503)
                 
             async with metadata_pool.acquire() as conn:
                 row = await conn.fetchrow(
@@ -76,16 +138,19 @@ async def get_document_content():
                     int(document_id)
                 )
                 if not row:
-                    return jsonify({"error": "Document not found in database"}), 404
+                    return ojson({"error": "Document not found in database"}, 404)
                 document_url = row['file_path']
 
-        # Retrieve document content from the appropriate storage backend
-        content = await storage_manager.get_file(document_url)
-        if not content:
-            return jsonify({"error": "Document content not found in storage"}), 404
-
-        # Prepare file in-memory
-        file_obj = BytesIO(content)
+        # Blob-hosted documents are served by the CDN, not proxied through us.
+        # Only stored file paths are redirected to: a caller-supplied URL
+        # would make this an open redirect.
+        if document_url.startswith(('http://', 'https://')):
+            if not document_id:
+                return ojson({"error": "Remote documents must be requested by ID"}, 400)
+            response = redirect(document_url, 302)
+            # Per-user content: browsers may cache it, shared caches may not
+            response.headers['Cache-Control'] = 'private, max-age=86400'
+            return response
 
         # Determine content type based on file extension
         content_type = 'application/octet-stream'
@@ -96,6 +161,17 @@ async def get_document_content():
         elif document_url.lower().endswith('.txt'):
             content_type = 'text/plain'
 
+        if document_url.startswith('s3://'):
+            content = await storage_manager.get_file(document_url)
+            if not content:
+                return ojson({"error": "Document content not found in storage"}, 404)
+            file_obj = BytesIO(content)
+        else:
+            # Local files are streamed from disk in chunks by send_file
+            file_obj = Path(document_url)
+            if not await asyncio.to_thread(file_obj.is_file):
+                return ojson({"error": "Document content not found in storage"}, 404)
+
         return await send_file(
             file_obj,
             mimetype=content_type,
@@ -104,7 +180,7 @@ async def get_document_content():
         )
     except Exception as e:
         logger.error(f"Error retrieving document content: {e}")
-        return jsonify({"error": "Failed to retrieve document content"}), 500
+        return ojson({"error": "Failed to retrieve document content"}, 500)
 
 @documents_bp.route('/api/documents', methods=['POST'])
 async def create_document():
@@ -113,11 +189,11 @@ async def create_document():
         data = await request.get_json()
         user_id = data.get('user_id')
         if not user_id:
-            return jsonify({'error': 'User ID required'}), 400
+            return ojson({'error': 'User ID required'}, 400)
 
         metadata_pool = await get_metadata_pool()
         if not metadata_pool:
-            return jsonify({"error": "Database unavailable"}), 503
+            return ojson({"error": "Database unavailable"}, 503)
             
         async with metadata_pool.acquire() as conn:
             row = await conn.fetchrow("""
@@ -146,10 +222,12 @@ async def create_document():
                 data.get('file_type'),
                 data.get('extracted_text')
             )
-            return jsonify(dict(row))
+            # Don't wait for the NOTIFY round trip to drop this process's copy
+            listing_cache.invalidate(DOCUMENTS_CHANNEL)
+            return ojson(dict(row))
     except Exception as e:
         logger.error(f"Error creating document: {e}")
-        return jsonify({'error': str(e)}), 500
+        return ojson({'error': str(e)}, 500)
 
 @documents_bp.route('/api/documents/<int:doc_id>', methods=['PUT'])
 async def update_document(doc_id):
@@ -158,11 +236,11 @@ async def update_document(doc_id):
         data = await request.get_json()
         user_id = data.get('user_id')
         if not user_id:
-            return jsonify({'error': 'User ID required'}), 400
+            return ojson({'error': 'User ID required'}, 400)
 
         metadata_pool = await get_metadata_pool()
         if not metadata_pool:
-            return jsonify({"error": "Database unavailable"}), 503
+            return ojson({"error": "Database unavailable"}, 503)
             
         async with metadata_pool.acquire() as conn:
             row = await conn.fetchrow("""
@@ -199,11 +277,12 @@ async def update_document(doc_id):
                 int(user_id)
             )
             if not row:
-                return jsonify({'error': 'Document not found'}), 404
-            return jsonify(dict(row))
+                return ojson({'error': 'Document not found'}, 404)
+            listing_cache.invalidate(DOCUMENTS_CHANNEL)
+            return ojson(dict(row))
     except Exception as e:
         logger.error(f"Error updating document {doc_id}: {e}")
-        return jsonify({'error': str(e)}), 500
+        return ojson({'error': str(e)}, 500)
 
 @documents_bp.route('/api/documents/<int:doc_id>', methods=['DELETE'])
 async def delete_document(doc_id):
@@ -211,12 +290,12 @@ async def delete_document(doc_id):
     try:
         metadata_pool = await get_metadata_pool()
         if not metadata_pool:
-            return jsonify({"error": "Database unavailable"}), 503
+            return ojson({"error": "Database unavailable"}, 503)
             
         async with metadata_pool.acquire() as conn:
             user_id = getattr(request, 'user_id', request.headers.get('X-User-ID'))
             if not user_id:
-                return jsonify({"error": "User ID is required"}), 400
+                return ojson({"error": "User ID is required"}, 400)
 
             # Get document URL before deletion
             row = await conn.fetchrow("""
@@ -224,7 +303,7 @@ async def delete_document(doc_id):
                 WHERE id = $1 AND user_id = $2
             """, doc_id, int(user_id))
             if not row:
-                return jsonify({"error": "Document not found"}), 404
+                return ojson({"error": "Document not found"}, 404)
 
             document_url = row['file_path']
 
@@ -233,15 +312,16 @@ async def delete_document(doc_id):
                 DELETE FROM user_documents 
                 WHERE id = $1 AND user_id = $2
             """, doc_id, int(user_id))
+            listing_cache.invalidate(DOCUMENTS_CHANNEL)
 
             # Delete from storage if URL exists
             if document_url:
                 await storage_manager.delete_file(document_url)
 
-            return jsonify({"message": "Document deleted successfully"})
+            return ojson({"message": "Document deleted successfully"})
     except Exception as e:
         logger.error(f"Error deleting document: {e}")
-        return jsonify({"error": "Failed to delete document"}), 500
+        return ojson({"error": "Failed to delete document"}, 500)
 
 @documents_bp.route('/api/documents/search', methods=['GET'])
 async def get_search_documents():
@@ -249,28 +329,28 @@ async def get_search_documents():
     try:
         query = request.args.get('q')
         if not query:
-            return jsonify({"results": [], "message": "No search query provided"}), 200
+            return ojson({"results": [], "message": "No search query provided"}, 200)
 
         # Generate vector embedding for the query
         try:
-            response = await openai_client.embeddings.create(
+            response = await get_openai_client().embeddings.create(
                 model="text-embedding-3-small",
                 input=query
             )
             query_vector = response.data[0].embedding
         except Exception as e:
             logger.error(f"Error generating query embedding: {e}")
-            return jsonify({"error": "Failed to process query"}), 500
+            return ojson({"error": "Failed to process query"}, 500)
 
         # Search in vector database for similar documents
         vector_pool = await get_vector_pool()
         if not vector_pool:
-            return jsonify({"error": "Vector database unavailable"}), 503
+            return ojson({"error": "Vector database unavailable"}, 503)
             
         async with vector_pool.acquire() as conn:
                 user_id = getattr(request, 'user_id', request.headers.get('X-User-ID'))
                 if not user_id:
-                    return jsonify({"error": "User ID is required"}), 400
+                    return ojson({"error": "User ID is required"}, 400)
 
                 rows = await conn.fetch("""
                     SELECT document_id, 1 - (content_vector <=> $1) as similarity
@@ -283,12 +363,12 @@ async def get_search_documents():
                 # Get metadata for the matching documents
                 document_ids = [row['document_id'] for row in rows]
                 if not document_ids:
-                    return jsonify({"results": [], "message": "No similar documents found"}), 200
+                    return ojson({"results": [], "message": "No similar documents found"}, 200)
 
                 # Get document details from metadata database
                 metadata_pool = await get_metadata_pool()
                 if not metadata_pool:
-                    return jsonify({"error": "Database unavailable"}), 503
+                    return ojson({"error": "Database unavailable"}, 503)
                     
                 async with metadata_pool.acquire() as metadata_conn:
                     doc_rows = await metadata_conn.fetch("""
@@ -308,29 +388,22 @@ async def get_search_documents():
                                 break
                         results.append(doc_dict)
 
-                    return jsonify({"results": results})
+                    return ojson({"results": results})
     except Exception as e:
         logger.error(f"Error searching documents: {e}")
-        return jsonify({"error": "Failed to search documents"}), 500
+        return ojson({"error": "Failed to search documents"}, 500)
 
 @documents_bp.route('/api/documents/search', methods=['POST'])
 async def search_documents():
     """Search documents by content or metadata."""
     try:
-        data = await request.get_json()
-        user_id = data.get('user_id')
-        query = data.get('query', '').strip()
-        field = data.get('field', 'all')  # options: 'all', 'content', 'metadata'
-
-        if not user_id:
-            return jsonify({'error': 'User ID required'}), 400
-        if not query:
-            return jsonify({'error': 'Search query is required'}), 400
+        body = await parse_body(SearchDocumentsRequest)
+        user_id, query, field = body.user_id, body.query, body.field
 
         # Try vector search first
         try:
             # Generate embedding for the query
-            response = await openai_client.embeddings.create(
+            response = await get_openai_client().embeddings.create(
                 model="text-embedding-3-small",
                 input=query
             )
@@ -356,21 +429,21 @@ async def search_documents():
                         
                         metadata_pool = await get_metadata_pool()
                         if not metadata_pool:
-                            return jsonify({"error": "Database unavailable"}), 503
+                            return ojson({"error": "Database unavailable"}, 503)
                             
                         async with metadata_pool.acquire() as metadata_conn:
                             # Get full document details
-                            doc_rows = await metadata_conn.fetch("""
-                                SELECT id, title, author, summary, category, extracted_text
+                            doc_rows = await metadata_conn.fetch(f"""
+                                SELECT id, title, author, summary, category,
+                                {HEADLINE_SQL.format(query_param='$3')} AS excerpt
                                 FROM user_documents 
                                 WHERE id = ANY($1) AND user_id = $2
-                            """, document_ids, int(user_id))
+                            """, document_ids, int(user_id), query)
 
                             # Combine results with similarity scores and excerpts
                             results = []
                             for doc in doc_rows:
                                 doc_dict = dict(doc)
-                                doc_dict['excerpt'] = extract_matching_excerpt(doc_dict.get('extracted_text', ''), query)
                                 # Find matching similarity score
                                 for row in rows:
                                     if row['document_id'] == doc_dict['id']:
@@ -378,7 +451,7 @@ async def search_documents():
                                         break
                                 results.append(doc_dict)
 
-                            return jsonify({'results': results, 'search_type': 'vector'})
+                            return ojson({'results': results, 'search_type': 'vector'})
         except Exception as vector_error:
             logger.warning(f"Vector search failed, falling back to text search: {vector_error}")
             # Fall through to text search below
@@ -386,66 +459,26 @@ async def search_documents():
         # Fallback to traditional text search
         metadata_pool = await get_metadata_pool()
         if not metadata_pool:
-            return jsonify({"error": "Database unavailable"}), 503
+            return ojson({"error": "Database unavailable"}, 503)
             
         async with metadata_pool.acquire() as conn:
-            where_clause = "user_id = $1"
-            params = [int(user_id)]
-            
-            if field == 'content':
-                where_clause += " AND extracted_text ILIKE $2"
-            elif field == 'metadata':
-                where_clause += " AND (title ILIKE $2 OR author ILIKE $2 OR summary ILIKE $2 OR thesis ILIKE $2 OR hashtags ILIKE $2)"
-            else:  # 'all'
-                where_clause += " AND (title ILIKE $2 OR author ILIKE $2 OR summary ILIKE $2 OR thesis ILIKE $2 OR hashtags ILIKE $2 OR extracted_text ILIKE $2)"
-            
-            params.append(f"%{query}%")
+            statement = TEXT_SEARCH_STMTS.get(field, TEXT_SEARCH_STMTS['all'])
+            rows = await fetch_prepared(conn, statement, int(user_id), query)
             
-            sql = f"""
-                SELECT id, title, author, summary, extracted_text, created_at
-                FROM user_documents
-                WHERE {where_clause}
-                ORDER BY created_at DESC
-                LIMIT 100
-            """
-            
-            rows = await conn.fetch(sql, *params)
-            
-            results = []
-            for row in rows:
-                excerpt = extract_matching_excerpt(row['extracted_text'], query)
-                results.append({
+            results = [
+                {
                     'id': row['id'],
                     'title': row['title'],
                     'author': row['author'],
                     'summary': row['summary'],
-                    'excerpt': excerpt
-                })
+                    'excerpt': row['excerpt']
+                }
+                for row in rows
+            ]
                 
-            return jsonify({'results': results, 'search_type': 'text'})
+            return ojson({'results': results, 'search_type': 'text'})
+    except ValidationError as e:
+        return ojson({'error': 'Invalid request body', 'details': validation_details(e)}, 400)
     except Exception as e:
         logger.error(f"Error searching documents: {e}")
-        return jsonify({'error': str(e)}), 500
-
-def extract_matching_excerpt(text: str, query: str, context_chars: int = 150) -> str:
-    """Extract an excerpt around the query match."""
-    if not text or not query:
-        return ""
-    
-    query_lower = query.lower()
-    text_lower = text.lower()
-    
-    pos = text_lower.find(query_lower)
-    if pos == -1:
-        return text[:300] + "..."
-    
-    start = max(0, pos - context_chars)
-    end = min(len(text), pos + len(query) + context_chars)
-    
-    excerpt = text[start:end]
-    if start > 0:
-        excerpt = "..." + excerpt
-    if end < len(text):
-        excerpt = excerpt + "..."
-        
-    return excerpt
+        return ojson({'error': str(e)}, 500)
@@ -1,16 +1,15 @@
 import aiohttp
+import asyncio
 import io
 import logging
-import os
 import uuid
 from pathlib import Path
 
 from quart import Blueprint, jsonify, request, send_file
-from PIL import Image
 
 # Import with fallbacks to handle different execution contexts
 try:
-    from backend.services.storage.manager import storage_manager
+    from backend.services.storage.manager import render_thumbnail, storage_manager
     from backend.config.database import get_db_pool
 except ImportError:
     # Alternative import path for when running as a module
@@ -37,7 +36,7 @@ except ImportError:
                 logger.error("Storage manager not available")
                 return False
                 
-            def cleanup_temp_files(self, *args, **kwargs):
+            async def cleanup_temp_files(self, *args, **kwargs):
                 logger.error("Storage manager not available")
                 
         # Try to get storage manager from app context
@@ -66,29 +65,40 @@ MAX_FILE_SIZE_MB = 25
 MAX_FILE_SIZE_BYTES = MAX_FILE_SIZE_MB * 1024 * 1024
 
 # Allowed file types
+_IMAGE_EXTS = frozenset({'png', 'jpg', 'jpeg', 'gif', 'webp'})
+_DOC_EXTS = frozenset({'pdf', 'doc', 'docx', 'txt', 'rtf'})
+_ALLOWED_EXTS = _IMAGE_EXTS | _DOC_EXTS
+# Single lookup from extension to upload bucket
+_EXT_TO_BUCKET = {ext: 'images' for ext in _IMAGE_EXTS} | {ext: 'documents' for ext in _DOC_EXTS}
+
 ALLOWED_EXTENSIONS = {
-    'images': {'png', 'jpg', 'jpeg', 'gif', 'webp'},
-    'documents': {'pdf', 'doc', 'docx', 'txt', 'rtf'}
+    'images': _IMAGE_EXTS,
+    'documents': _DOC_EXTS
 }
 
+def _get_extension(filename: str) -> str:
+    """Return the lowercased extension without the leading dot.
+
+    Follows os.path.splitext: leading dots of the final path component
+    (".jpg", ".env") start a name, not an extension.
+    """
+    head, dot, ext = filename.rpartition('.')
+    if not dot or '/' in ext or not head.rpartition('/')[2].strip('.'):
+        return ''
+    return ext.lower()
+
 def is_allowed_file(filename: str) -> bool:
     """Check if file has an allowed extension."""
-    ext = filename.rsplit('.', 1)[-1].lower() if '.' in filename else ''
-    return ext in (ALLOWED_EXTENSIONS['images'] | ALLOWED_EXTENSIONS['documents'])
+    return _get_extension(filename) in _ALLOWED_EXTS
 
 def get_file_type(filename: str) -> str:
     """Return file type category ('images' or 'documents') or None if invalid."""
-    ext = filename.rsplit('.', 1)[1].lower() if '.' in filename else ''
-    if ext in ALLOWED_EXTENSIONS['images']:
-        return 'images'
-    if ext in ALLOWED_EXTENSIONS['documents']:
-        return 'documents'
-    return None
+    return _EXT_TO_BUCKET.get(_get_extension(filename))
 
 def get_content_type(filename: str) -> str:
     """Get MIME type based on file extension."""
-    ext = filename.lower().rsplit('.', 1)[-1]
-    if ext in {'png', 'jpg', 'jpeg', 'gif', 'webp'}:
+    ext = _get_extension(filename)
+    if ext in _IMAGE_EXTS:
         return f"image/{'jpeg' if ext == 'jpg' else ext}"
     elif ext == 'pdf':
         return 'application/pdf'
@@ -134,22 +144,22 @@ async def get_upload_url():
         )
 
         # Record in the database for tracking
-        async with get_db_pool() as pool:
-            async with pool.acquire() as conn:
-                if file_type == 'image':
-                    # Track the image upload in progress
-                    await conn.execute("""
-                        INSERT INTO upload_tracking (
-                            user_id, filename, temp_url, status, file_type
-                        ) VALUES ($1, $2, $3, $4, $5)
-                    """, int(user_id), unique_filename, temp_url, 'pending', 'image')
-                else:
-                    # Track the document upload in progress
-                    await conn.execute("""
-                        INSERT INTO upload_tracking (
-                            user_id, filename, temp_url, status, file_type
-                        ) VALUES ($1, $2, $3, $4, $5)
-                    """, int(user_id), unique_filename, temp_url, 'pending', 'document')
+        pool = await get_db_pool()
+        async with pool.acquire() as conn:
+            if file_type == 'image':
+                # Track the image upload in progress
+                await conn.execute("""
+                    INSERT INTO upload_tracking (
+                        user_id, filename, temp_url, status, file_type
+                    ) VALUES ($1, $2, $3, $4, $5)
+                """, int(user_id), unique_filename, temp_url, 'pending', 'image')
+            else:
+                # Track the document upload in progress
+                await conn.execute("""
+                    INSERT INTO upload_tracking (
+                        user_id, filename, temp_url, status, file_type
+                    ) VALUES ($1, $2, $3, $4, $5)
+                """, int(user_id), unique_filename, temp_url, 'pending', 'document')
 
         return jsonify({
             'filename': unique_filename,
@@ -175,13 +185,13 @@ async def finalize_upload():
             return jsonify({'error': 'Missing required parameters'}), 400
 
         # Update tracking status
-        async with get_db_pool() as pool:
-            async with pool.acquire() as conn:
-                await conn.execute("""
-                    UPDATE upload_tracking
-                    SET status = 'processing'
-                    WHERE user_id = $1 AND temp_url = $2
-                """, int(user_id), temp_url)
+        pool = await get_db_pool()
+        async with pool.acquire() as conn:
+            await conn.execute("""
+                UPDATE upload_tracking
+                SET status = 'processing'
+                WHERE user_id = $1 AND temp_url = $2
+            """, int(user_id), temp_url)
 
         # Move file to permanent storage (either Vercel Blob or fallback)
         content_type = get_content_type(filename)
@@ -194,52 +204,52 @@ async def finalize_upload():
 
         if not permanent_url:
             # Update tracking with error
-            async with get_db_pool() as pool:
-                async with pool.acquire() as conn:
-                    await conn.execute("""
-                        UPDATE upload_tracking
-                        SET status = 'error', error_message = 'Failed to move to permanent storage'
-                        WHERE user_id = $1 AND temp_url = $2
-                    """, int(user_id), temp_url)
+            pool = await get_db_pool()
+            async with pool.acquire() as conn:
+                await conn.execute("""
+                    UPDATE upload_tracking
+                    SET status = 'error', error_message = 'Failed to move to permanent storage'
+                    WHERE user_id = $1 AND temp_url = $2
+                """, int(user_id), temp_url)
             return jsonify({'error': 'Failed to move file to permanent storage'}), 500
 
         # Update database with permanent URL based on file type
-        async with get_db_pool() as pool:
-            async with pool.acquire() as conn:
-                async with conn.transaction():
-                    # Update tracking record
-                    await conn.execute("""
-                        UPDATE upload_tracking
-                        SET status = 'complete', permanent_url = $1
-                        WHERE user_id = $2 AND temp_url = $3
-                    """, permanent_url, int(user_id), temp_url)
+        pool = await get_db_pool()
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                # Update tracking record
+                await conn.execute("""
+                    UPDATE upload_tracking
+                    SET status = 'complete', permanent_url = $1
+                    WHERE user_id = $2 AND temp_url = $3
+                """, permanent_url, int(user_id), temp_url)
                     
-                    # Update relevant data table based on file type
-                    if file_type == 'image':
-                        # If this is an inventory item image
-                        inventory_id = metadata.get('inventory_id')
-                        if inventory_id:
-                            await conn.execute("""
-                                UPDATE user_inventory
-                                SET original_image_url = $1
-                                WHERE id = $2 AND user_id = $3
-                            """, permanent_url, inventory_id, int(user_id))
+                # Update relevant data table based on file type
+                if file_type == 'image':
+                    # If this is an inventory item image
+                    inventory_id = metadata.get('inventory_id')
+                    if inventory_id:
+                        await conn.execute("""
+                            UPDATE user_inventory
+                            SET original_image_url = $1
+                            WHERE id = $2 AND user_id = $3
+                        """, permanent_url, inventory_id, int(user_id))
+                else:
+                    # For documents, update or insert into user_documents
+                    doc_id = metadata.get('document_id')
+                    if doc_id:
+                        # Update existing document
+                        await conn.execute("""
+                            UPDATE user_documents
+                            SET file_path = $1, file_type = $2
+                            WHERE id = $3 AND user_id = $4
+                        """, permanent_url, content_type, doc_id, int(user_id))
                     else:
-                        # For documents, update or insert into user_documents
-                        doc_id = metadata.get('document_id')
-                        if doc_id:
-                            # Update existing document
-                            await conn.execute("""
-                                UPDATE user_documents
-                                SET file_path = $1, file_type = $2
-                                WHERE id = $3 AND user_id = $4
-                            """, permanent_url, content_type, doc_id, int(user_id))
-                        else:
-                            # Create minimal document entry - additional metadata will be added later
-                            await conn.execute("""
-                                INSERT INTO user_documents (user_id, title, file_path, file_type)
-                                VALUES ($1, $2, $3, $4)
-                            """, int(user_id), filename, permanent_url, content_type)
+                        # Create minimal document entry - additional metadata will be added later
+                        await conn.execute("""
+                            INSERT INTO user_documents (user_id, title, file_path, file_type)
+                            VALUES ($1, $2, $3, $4)
+                        """, int(user_id), filename, permanent_url, content_type)
 
         return jsonify({'url': permanent_url}), 200
 
@@ -247,13 +257,13 @@ async def finalize_upload():
         logger.error(f"Error finalizing upload: {e}")
         # Update tracking with error
         try:
-            async with get_db_pool() as pool:
-                async with pool.acquire() as conn:
-                    await conn.execute("""
-                        UPDATE upload_tracking
-                        SET status = 'error', error_message = $1
-                        WHERE user_id = $2 AND temp_url = $3
-                    """, str(e)[:500], int(user_id), temp_url)
+            pool = await get_db_pool()
+            async with pool.acquire() as conn:
+                await conn.execute("""
+                    UPDATE upload_tracking
+                    SET status = 'error', error_message = $1
+                    WHERE user_id = $2 AND temp_url = $3
+                """, str(e)[:500], int(user_id), temp_url)
         except Exception as db_error:
             logger.error(f"Failed to update error status: {db_error}")
             
@@ -272,20 +282,20 @@ async def download_file(filename):
             return jsonify({'error': 'Invalid file type'}), 400
 
         # Verify ownership
-        async with get_db_pool() as pool:
-            async with pool.acquire() as conn:
-                if file_type == 'images':
-                    row = await conn.fetchrow(
-                        "SELECT image_url as file_url FROM user_inventory WHERE user_id = $1 AND image_url LIKE $2",
-                        int(user_id), f"%{filename}"
-                    )
-                else:
-                    row = await conn.fetchrow(
-                        "SELECT file_path as file_url FROM user_documents WHERE user_id = $1 AND file_path LIKE $2",
-                        int(user_id), f"%{filename}"
-                    )
-                if not row:
-                    return jsonify({'error': 'File not found or unauthorized'}), 404
+        pool = await get_db_pool()
+        async with pool.acquire() as conn:
+            if file_type == 'images':
+                row = await conn.fetchrow(
+                    "SELECT image_url as file_url FROM user_inventory WHERE user_id = $1 AND image_url LIKE $2",
+                    int(user_id), f"%{filename}"
+                )
+            else:
+                row = await conn.fetchrow(
+                    "SELECT file_path as file_url FROM user_documents WHERE user_id = $1 AND file_path LIKE $2",
+                    int(user_id), f"%{filename}"
+                )
+            if not row:
+                return jsonify({'error': 'File not found or unauthorized'}), 404
 
         content = await storage_manager.get_file(row['file_url'])
         if not content:
@@ -316,27 +326,22 @@ async def get_thumbnail(filename):
             return jsonify({'error': 'Not an image file'}), 400
 
         # Get original image
-        async with get_db_pool() as pool:
-            async with pool.acquire() as conn:
-                row = await conn.fetchrow(
-                    "SELECT image_url as file_url FROM user_inventory WHERE user_id = $1 AND image_url LIKE $2",
-                    int(user_id), f"%{filename}"
-                )
-                if not row:
-                    return jsonify({'error': 'Image not found or unauthorized'}), 404
+        pool = await get_db_pool()
+        async with pool.acquire() as conn:
+            row = await conn.fetchrow(
+                "SELECT image_url as file_url FROM user_inventory WHERE user_id = $1 AND image_url LIKE $2",
+                int(user_id), f"%{filename}"
+            )
+            if not row:
+                return jsonify({'error': 'Image not found or unauthorized'}), 404
 
         content = await storage_manager.get_file(row['file_url'])
         if not content:
             return jsonify({'error': 'Image not found'}), 404
 
-        # Generate thumbnail
-        with Image.open(io.BytesIO(content)) as img:
-            if img.mode == 'RGBA':
-                img = img.convert('RGB')
-            img.thumbnail((200, 200), Image.Resampling.LANCZOS)
-            img_byte_arr = io.BytesIO()
-            img.save(img_byte_arr, format='JPEG', quality=85)
-            img_byte_arr.seek(0)
+        # Generate thumbnail off the event loop
+        thumbnail = await asyncio.to_thread(render_thumbnail, content, (200, 200))
+        img_byte_arr = io.BytesIO(thumbnail)
 
         return await send_file(
             img_byte_arr,
@@ -357,7 +362,7 @@ async def cleanup_files():
         if not user_id:
             return jsonify({'error': 'User ID required'}), 400
 
-        storage_manager.cleanup_temp_files(int(user_id))
+        await storage_manager.cleanup_temp_files(int(user_id))
         return jsonify({'message': 'Cleanup completed'})
 
     except Exception as e:
@@ -377,20 +382,20 @@ async def delete_file(filename):
             return jsonify({'error': 'Invalid file type'}), 400
 
         # Verify ownership and get file URL
-        async with get_db_pool() as pool:
-            async with pool.acquire() as conn:
-                if file_type == 'images':
-                    row = await conn.fetchrow(
-                        "SELECT image_url as file_url FROM user_inventory WHERE user_id = $1 AND image_url LIKE $2",
-                        int(user_id), f"%{filename}"
-                    )
-                else:
-                    row = await conn.fetchrow(
-                        "SELECT file_path as file_url FROM user_documents WHERE user_id = $1 AND file_path LIKE $2",
-                        int(user_id), f"%{filename}"
-                    )
-                if not row:
-                    return jsonify({'error': 'File not found or unauthorized'}), 404
+        pool = await get_db_pool()
+        async with pool.acquire() as conn:
+            if file_type == 'images':
+                row = await conn.fetchrow(
+                    "SELECT image_url as file_url FROM user_inventory WHERE user_id = $1 AND image_url LIKE $2",
+                    int(user_id), f"%{filename}"
+                )
+            else:
+                row = await conn.fetchrow(
+                    "SELECT file_path as file_url FROM user_documents WHERE user_id = $1 AND file_path LIKE $2",
+                    int(user_id), f"%{filename}"
+                )
+            if not row:
+                return jsonify({'error': 'File not found or unauthorized'}), 404
 
         # Delete the file
         success = await storage_manager.delete_file(row['file_url'])
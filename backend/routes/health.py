@@ -1,9 +1,12 @@
 """Health check routes for monitoring system health."""
 
+import asyncio
 import logging
 import os
+import time
 from quart import Blueprint, jsonify
 from backend.config.database import get_vector_pool, get_metadata_pool
+from backend.services import HEALTHY_STATUSES, check_service_health, check_services_health
 from backend.services.storage.manager import storage_manager
 
 # Configure logging
@@ -12,9 +15,36 @@ logger = logging.getLogger(__name__)
 # Create blueprint
 health_bp = Blueprint('health', __name__)
 
+# Probes arrive every few seconds per replica; reuse a recent result rather
+# than re-running database and storage round trips for each one
+HEALTH_CACHE_TTL = 5.0
+_health_cache = {'checked_at': 0.0, 'response': None}
+_health_lock = asyncio.Lock()
+
 @health_bp.route('/api/health', methods=['GET'])
 async def health_check():
     """Check overall system health."""
+    result, status_code = await _cached_health()
+    return jsonify(result), status_code
+
+async def _cached_health():
+    """Return the last health result if fresh, otherwise run the checks once.
+
+    Concurrent callers wait on the lock and reuse the result the first
+    caller produced instead of each running the checks.
+    """
+    async with _health_lock:
+        now = time.monotonic()
+        if (_health_cache['response'] is not None
+                and now - _health_cache['checked_at'] < HEALTH_CACHE_TTL):
+            return _health_cache['response']
+        response = await _run_health_checks()
+        _health_cache['response'] = response
+        _health_cache['checked_at'] = time.monotonic()
+        return response
+
+async def _run_health_checks():
+    """Probe databases and storage, returning (result, status_code)."""
     result = {
         "status": "healthy",
         "components": {}
@@ -75,7 +105,7 @@ async def health_check():
     elif result["status"] == "degraded":
         status_code = 207  # Multi-Status
         
-    return jsonify(result), status_code
+    return result, status_code
 
 @health_bp.route('/api/health/storage', methods=['GET'])
 async def storage_health_check():
@@ -90,3 +120,38 @@ async def storage_health_check():
             "status": "error",
             "error": str(e)
         }), 500
+
+@health_bp.route('/api/health/services', methods=['GET'])
+async def services_health_check():
+    """Report each service probe, served from the shared probe cache.
+
+    The background monitor keeps the cache warm, so this normally answers
+    without touching the database, Qdrant or OpenAI.
+    """
+    try:
+        services = await check_services_health()
+        healthy = all(s.get("status") in HEALTHY_STATUSES for s in services.values())
+        return jsonify({
+            "status": "healthy" if healthy else "degraded",
+            "services": services
+        }), 200 if healthy else 207
+    except Exception as e:
+        logger.error(f"Error checking service health: {e}")
+        return jsonify({
+            "status": "error",
+            "error": str(e)
+        }), 500
+
+@health_bp.route('/api/health/openai', methods=['GET'])
+async def openai_health_check():
+    """Check OpenAI API reachability, sharing the monitor's probe cache."""
+    try:
+        health = await check_service_health("openai")
+        status_code = 200 if health.get("status") in HEALTHY_STATUSES else 503
+        return jsonify(health), status_code
+    except Exception as e:
+        logger.error(f"Error checking OpenAI health: {e}")
+        return jsonify({
+            "status": "error",
+            "error": str(e)
+        }), 500
@@ -10,7 +10,8 @@ from typing import Any, Dict
 from quart import Blueprint, jsonify, request
 
 from backend.routes.auth_routes import verify_token
-from backend.services.openai_service import openai_service
+from backend.services import get_openai_service
+from backend.utils.clock import iso_now
 from backend.utils.decorators import async_error_handler, validate_json
 
 logger = logging.getLogger(__name__)
@@ -22,10 +23,11 @@ openai_bp = Blueprint('openai', __name__, url_prefix='/api/openai')
 async def openai_health():
     """Check OpenAI service health and availability"""
     try:
+        openai_service = get_openai_service()
         health_status = {
             "service": "openai",
             "available": openai_service.is_available,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": iso_now(),
             "config": {
                 "model": openai_service.config.get("model", "not-configured"),
                 "api_key_configured": bool(openai_service.config.get("api_key"))
@@ -42,7 +44,7 @@ async def openai_health():
             "service": "openai",
             "available": False,
             "error": str(e),
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": iso_now()
         }), 500
 
 @openai_bp.route('/process-document', methods=['POST'])
@@ -77,7 +79,7 @@ async def process_document():
         
         logger.info(f"🔄 Processing document: {file_name or 'unnamed'} (type: {document_type})")
         
-        result = await openai_service.process_document(
+        result = await get_openai_service().process_document(
             content=content,
             file_name=file_name,
             document_type=document_type,
@@ -135,7 +137,7 @@ async def analyze_inventory():
         
         logger.info(f"🔄 Analyzing {len(items)} inventory items (type: {analysis_type})")
         
-        result = await openai_service.analyze_inventory(items)
+        result = await get_openai_service().analyze_inventory(items)
         
         # Add analysis context to result
         if result["success"]:
@@ -185,7 +187,7 @@ async def generate_insights():
         
         logger.info(f"🔄 Generating insights for {data_type} data")
         
-        result = await openai_service.generate_insights(
+        result = await get_openai_service().generate_insights(
             data_type=data_type,
             data=analysis_data,
             context=context
@@ -234,7 +236,7 @@ async def process_image_description():
         
         logger.info("🔄 Processing image description for inventory extraction")
         
-        result = await openai_service.process_image_description(
+        result = await get_openai_service().process_image_description(
             image_description=description,
             context=context
         )
@@ -304,14 +306,14 @@ async def batch_process():
                 metadata = item.get('metadata', {})
                 
                 if item_type == 'document':
-                    result = await openai_service.process_document(
+                    result = await get_openai_service().process_document(
                         content=content,
                         file_name=metadata.get('file_name'),
                         document_type=metadata.get('document_type', 'unknown'),
                         user_instruction=metadata.get('user_instruction')
                     )
                 elif item_type == 'image_description':
-                    result = await openai_service.process_image_description(
+                    result = await get_openai_service().process_image_description(
                         image_description=content,
                         context=metadata.get('context')
                     )
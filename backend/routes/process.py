@@ -1,23 +1,39 @@
 """Processing routes for batch document and image analysis."""
 
+import json
 import logging
 import os
 import asyncio
 import uuid
 from datetime import datetime
+from pydantic import ValidationError
 from quart import Blueprint, request, jsonify
 
-from backend.config.database import get_metadata_pool
-from backend.config.client_factory import create_openai_client
+from backend.config.database import background_connection, get_metadata_pool
+from backend.config.manager import config_manager
+from backend.services import get_openai_client
 from backend.services.processor import create_processor_factory
 from backend.services.storage.manager import storage_manager
-from backend.task_manager import task_manager
+from backend.utils.responses import dumps
+from backend.utils.schemas import ProcessFilesRequest, parse_body, validation_details
+
+try:
+    from arq import create_pool
+    from arq.connections import RedisSettings
+except ImportError:
+    create_pool = None
+    RedisSettings = None
 
 logger = logging.getLogger(__name__)
 process_bp = Blueprint('process', __name__)
 
-# Initialize OpenAI client safely
-openai_client = create_openai_client()
+# Redis-backed job queue, created on first use when REDIS_URL is set
+_job_queue = None
+
+# In-process fallback: batches run concurrently up to the worker's job limit,
+# and task handles are kept so they are not garbage collected mid-run
+_background_slots = asyncio.Semaphore(config_manager.get_int("WORKER_MAX_JOBS", 4))
+_background_tasks = set()
 
 @process_bp.route('/api/process', methods=['POST'])
 async def process_files():
@@ -28,77 +44,92 @@ async def process_files():
         if not user_id:
             return jsonify({"error": "User ID required"}), 400
             
-        # Parse request data
-        data = await request.get_json()
-        files = data.get('files', [])
-        instruction = data.get('instruction', '')
-        
-        if not files:
-            return jsonify({"error": "No files provided"}), 400
-            
-        if len(files) > 10:
-            return jsonify({"error": "Maximum 10 files allowed"}), 400
-        
-        # Get DB pool for processors
-        pool = await get_metadata_pool()
-        
-        # Create processor factory
-        processor_factory = create_processor_factory(pool, openai_client)
-        
-        # Get batch processor
-        batch_processor = processor_factory.create_batch_processor(instruction)
+        # Decode and validate the request body in one pass
+        body = await parse_body(ProcessFilesRequest)
+        files = [file.model_dump() for file in body.files]
+        instruction = body.instruction
         
         # Process files
         task_id = f"process-{datetime.now().strftime('%Y%m%d%H%M%S')}-{uuid.uuid4()}"
         
-        # Track files for processing
-        file_objects = []
-        for file in files:
-            blob_url = file.get("blobUrl")
-            file_type = file.get("fileType")
-            original_name = file.get("originalName")
-            
-            if not all([blob_url, file_type, original_name]):
-                return jsonify({"error": "Missing file information"}), 400
-                
-            # Download file content
-            content = await storage_manager.get_file(blob_url)
-            if not content:
-                logger.error("Failed to retrieve file content for %s", original_name)
-                continue
-                
-            file_objects.append({
-                "url": blob_url,
-                "content": content,
-                "type": file_type,
-                "name": original_name
-            })
-        
-        # Add task to task manager
-        task_manager.add_task(task_id)
+        # Record the task in Postgres so any worker can answer status polls
+        await store_task_status(task_id, "queued", 0, int(user_id))
         
-        # Start asynchronous processing
-        asyncio.create_task(
-            process_batch_async(task_id, batch_processor, file_objects, int(user_id))
-        )
+        await enqueue_processing(task_id, files, instruction, int(user_id))
         
         return jsonify({
             "message": "Processing started",
             "task_id": task_id
         })
         
+    except ValidationError as e:
+        return jsonify({"error": "Invalid request body", "details": validation_details(e)}), 400
     except Exception as e:
         logger.error("Error processing files: %s", e)
         return jsonify({"error": str(e)}), 500
 
-async def process_batch_async(task_id, processor, files, user_id):
+async def get_job_queue():
+    """Return the shared arq queue, or None when no Redis queue is configured."""
+    global _job_queue
+    if _job_queue is None and create_pool is not None:
+        redis_url = config_manager.get("REDIS_URL")
+        if redis_url:
+            _job_queue = await create_pool(RedisSettings.from_dsn(redis_url))
+    return _job_queue
+
+async def enqueue_processing(task_id, files, instruction, user_id):
+    """Hand a processing job to the worker queue, or run it in-process as a fallback."""
+    queue = await get_job_queue()
+    if queue is not None:
+        await queue.enqueue_job(
+            "process_files_job", task_id, files, instruction, user_id, _job_id=task_id
+        )
+        return
+    task = asyncio.create_task(
+        run_in_background_slot(task_id, files, instruction, user_id)
+    )
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+async def run_in_background_slot(task_id, files, instruction, user_id):
+    """Run an in-process batch once one of the bounded background slots is free."""
+    async with _background_slots:
+        await process_batch_async(task_id, files, instruction, user_id)
+
+async def load_file_objects(files):
+    """Download file content for each uploaded file descriptor."""
+    file_objects = []
+    for file in files:
+        original_name = file.get("originalName")
+        content = await storage_manager.get_file(file.get("blobUrl"))
+        if not content:
+            logger.error("Failed to retrieve file content for %s", original_name)
+            continue
+            
+        file_objects.append({
+            "url": file.get("blobUrl"),
+            "content": content,
+            "type": file.get("fileType"),
+            "name": original_name
+        })
+    return file_objects
+
+async def process_batch_async(task_id, files, instruction, user_id):
     """Process a batch of files asynchronously."""
     try:
         # Store task status
         await store_task_status(task_id, "processing", 0, user_id)
         
+        # Get DB pool for processors
+        pool = await get_metadata_pool()
+        
+        # Create processor factory and batch processor
+        processor_factory = create_processor_factory(pool, get_openai_client())
+        processor = processor_factory.create_batch_processor(instruction)
+        
         # Process files
-        result = await processor.process_batch(files, user_id)
+        file_objects = await load_file_objects(files)
+        result = await processor.process_batch(file_objects, user_id)
         
         # Update task status on completion
         status = "completed" if result.failed_files == 0 else "completed_with_errors"
@@ -111,8 +142,7 @@ async def process_batch_async(task_id, processor, files, user_id):
 async def store_task_status(task_id, status, progress, user_id, result=None, error=None):
     """Store processing task status in the database."""
     try:
-        pool = await get_metadata_pool()
-        async with pool.acquire() as conn:
+        async with background_connection() as conn:
             # Create status record if it doesn't exist
             await conn.execute(
                 """
@@ -132,7 +162,7 @@ async def store_task_status(task_id, status, progress, user_id, result=None, err
                     SET result_data = $1
                     WHERE task_id = $2
                     """,
-                    result, task_id
+                    dumps(result).decode(), task_id
                 )
                 
             # Store error if available
@@ -167,7 +197,10 @@ async def get_task_status(task_id, user_id):
             )
             
             if result:
-                return dict(result)
+                status = dict(result)
+                if isinstance(status['result_data'], str):
+                    status['result_data'] = json.loads(status['result_data'])
+                return status
             return None
             
     except Exception as e:
@@ -0,0 +1,15 @@
+-- Weighted full-text search column for user_documents
+-- Title/author rank above thesis/summary, which rank above body text
+ALTER TABLE user_documents
+    ADD COLUMN IF NOT EXISTS search_tsv tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', COALESCE(title, '') || ' ' || COALESCE(author, '')), 'A') ||
+        setweight(to_tsvector('english', COALESCE(thesis, '') || ' ' || COALESCE(summary, '')), 'B') ||
+        setweight(to_tsvector('english', COALESCE(extracted_text, '')), 'C')
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_user_documents_search_tsv ON user_documents
+USING gin(search_tsv);
+
+-- Superseded by idx_user_documents_search_tsv
+DROP INDEX IF EXISTS idx_user_documents_text_search;
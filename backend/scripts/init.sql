@@ -33,12 +33,18 @@ CREATE INDEX IF NOT EXISTS idx_frontend_cache_key ON frontend_cache(cache_key);
 CREATE INDEX IF NOT EXISTS idx_frontend_cache_expires ON frontend_cache(expires_at);
 
 -- Create text search indexes
-CREATE INDEX IF NOT EXISTS idx_user_documents_text_search ON user_documents 
-USING gin(to_tsvector('english', COALESCE(title, '') || ' ' || 
-                                COALESCE(author, '') || ' ' || 
-                                COALESCE(summary, '') || ' ' || 
-                                COALESCE(thesis, '') || ' ' || 
-                                COALESCE(extracted_text, '')));
+-- Weighted search column used by the document search routes; existing
+-- databases get it from document_search_tsv.sql
+ALTER TABLE user_documents
+    ADD COLUMN IF NOT EXISTS search_tsv tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', COALESCE(title, '') || ' ' || COALESCE(author, '')), 'A') ||
+        setweight(to_tsvector('english', COALESCE(thesis, '') || ' ' || COALESCE(summary, '')), 'B') ||
+        setweight(to_tsvector('english', COALESCE(extracted_text, '')), 'C')
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_user_documents_search_tsv ON user_documents
+USING gin(search_tsv);
 
 CREATE INDEX IF NOT EXISTS idx_user_inventory_text_search ON user_inventory 
 USING gin(to_tsvector('english', COALESCE(name, '') || ' ' || 
@@ -46,6 +46,13 @@ CREATE TABLE IF NOT EXISTS user_documents (
     influenced_by TEXT[],
     file_path TEXT NOT NULL,
     file_type TEXT,
+    extracted_text TEXT,
+    -- Weighted full-text search: title/author, then thesis/summary, then body
+    search_tsv tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', COALESCE(title, '') || ' ' || COALESCE(author, '')), 'A') ||
+        setweight(to_tsvector('english', COALESCE(thesis, '') || ' ' || COALESCE(summary, '')), 'B') ||
+        setweight(to_tsvector('english', COALESCE(extracted_text, '')), 'C')
+    ) STORED,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
 );
@@ -73,6 +80,7 @@ CREATE INDEX IF NOT EXISTS idx_document_access_user ON document_access(user_id);
 -- Add GIN indexes for array fields
 CREATE INDEX IF NOT EXISTS idx_documents_hashtags ON user_documents USING gin(hashtags);
 CREATE INDEX IF NOT EXISTS idx_documents_influenced_by ON user_documents USING gin(influenced_by);
+CREATE INDEX IF NOT EXISTS idx_user_documents_search_tsv ON user_documents USING gin(search_tsv);
 
 -- Update trigger for timestamps
 CREATE OR REPLACE FUNCTION update_updated_at_column()
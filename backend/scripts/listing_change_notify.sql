@@ -0,0 +1,27 @@
+-- Notify listeners when inventory or document listings change so each app
+-- process can drop its cached listings (see backend/services/listing_cache.py)
+CREATE OR REPLACE FUNCTION notify_listing_change()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM pg_notify(TG_ARGV[0], '');
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+DROP TRIGGER IF EXISTS user_inventory_notify ON user_inventory;
+CREATE TRIGGER user_inventory_notify
+    AFTER INSERT OR UPDATE OR DELETE ON user_inventory
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION notify_listing_change('inventory_changed');
+
+DROP TRIGGER IF EXISTS inventory_assets_notify ON inventory_assets;
+CREATE TRIGGER inventory_assets_notify
+    AFTER INSERT OR UPDATE OR DELETE ON inventory_assets
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION notify_listing_change('inventory_changed');
+
+DROP TRIGGER IF EXISTS user_documents_notify ON user_documents;
+CREATE TRIGGER user_documents_notify
+    AFTER INSERT OR UPDATE OR DELETE ON user_documents
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION notify_listing_change('documents_changed');
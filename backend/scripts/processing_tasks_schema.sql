@@ -0,0 +1,20 @@
+-- Shared processing task state so any web worker can answer status polls
+CREATE TABLE IF NOT EXISTS processing_tasks (
+    task_id TEXT PRIMARY KEY,
+    user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
+    status TEXT NOT NULL,
+    progress INTEGER DEFAULT 0,
+    result_data JSONB,
+    error_message TEXT,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_processing_tasks_user_id ON processing_tasks(user_id);
+CREATE INDEX IF NOT EXISTS idx_processing_tasks_updated ON processing_tasks(updated_at);
+
+DROP TRIGGER IF EXISTS update_processing_tasks_timestamp ON processing_tasks;
+CREATE TRIGGER update_processing_tasks_timestamp
+    BEFORE UPDATE ON processing_tasks
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
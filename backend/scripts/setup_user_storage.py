@@ -38,6 +38,45 @@ load_dotenv()
 storage_config = get_storage_config()
 STORAGE_BACKEND = storage_config.storage_backend
 
+# Schema for user_storage. The updated_at trigger function is shared with the
+# other tables, so it is only created when no definition exists yet.
+USER_STORAGE_DDL = """
+    CREATE TABLE IF NOT EXISTS user_storage (
+        id SERIAL PRIMARY KEY,
+        user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
+        storage_type TEXT NOT NULL,
+        storage_path TEXT NOT NULL,
+        created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE(user_id, storage_type)
+    );
+
+    DO $do$
+    BEGIN
+        IF NOT EXISTS (
+            SELECT FROM pg_proc WHERE proname = 'update_updated_at_column'
+        ) THEN
+            CREATE FUNCTION update_updated_at_column()
+            RETURNS TRIGGER AS $$
+            BEGIN
+                NEW.updated_at = CURRENT_TIMESTAMP;
+                RETURN NEW;
+            END;
+            $$ LANGUAGE plpgsql;
+        END IF;
+    END
+    $do$;
+
+    DROP TRIGGER IF EXISTS update_user_storage_updated_at ON user_storage;
+    CREATE TRIGGER update_user_storage_updated_at
+    BEFORE UPDATE ON user_storage
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
+
+    CREATE INDEX IF NOT EXISTS idx_user_storage_user_id ON user_storage(user_id);
+    CREATE INDEX IF NOT EXISTS idx_user_storage_type ON user_storage(storage_type);
+"""
+
 async def ensure_user_storage_exists():
     """
     Ensure all users have storage paths configured in the database.
@@ -60,51 +99,9 @@ async def ensure_user_storage_exists():
             
             if not table_exists:
                 logger.info("Creating user_storage table...")
-                await conn.execute("""
-                    CREATE TABLE IF NOT EXISTS user_storage (
-                        id SERIAL PRIMARY KEY,
-                        user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
-                        storage_type TEXT NOT NULL,
-                        storage_path TEXT NOT NULL,
-                        created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-                        UNIQUE(user_id, storage_type)
-                    )
-                """)
-                
-                # Create updated_at trigger function if it doesn't exist
-                function_exists = await conn.fetchval("""
-                    SELECT EXISTS (
-                        SELECT FROM pg_proc
-                        WHERE proname = 'update_updated_at_column'
-                    )
-                """)
-                
-                if not function_exists:
-                    logger.info("Creating update_updated_at_column function...")
-                    await conn.execute("""
-                        CREATE OR REPLACE FUNCTION update_updated_at_column()
-                        RETURNS TRIGGER AS $$
-                        BEGIN
-                            NEW.updated_at = CURRENT_TIMESTAMP;
-                            RETURN NEW;
-                        END;
-                        $$ LANGUAGE plpgsql;
-                    """)
-                
-                # Create trigger
-                await conn.execute("""
-                    CREATE TRIGGER update_user_storage_updated_at
-                    BEFORE UPDATE ON user_storage
-                    FOR EACH ROW
-                    EXECUTE FUNCTION update_updated_at_column();
-                """)
-                
-                # Create indexes
-                await conn.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_user_storage_user_id ON user_storage(user_id);
-                    CREATE INDEX IF NOT EXISTS idx_user_storage_type ON user_storage(storage_type);
-                """)
+                # Table, trigger and indexes go in one round trip and one transaction
+                async with conn.transaction():
+                    await conn.execute(USER_STORAGE_DDL)
             
             # Get all users without storage configurations for the current backend
             rows = await conn.fetch("""
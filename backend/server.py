@@ -5,19 +5,23 @@ Main ASGI application server for the Bartleby backend.
 import asyncio
 import logging
 import os
-from datetime import datetime
 
 from quart import Quart, jsonify, request
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Import centralized configuration manager
 from backend.config.manager import config_manager
+from backend.services.listing_cache import listing_cache
+from backend.services.storage.manager import storage_manager
+from backend.utils.clock import iso_now
+from backend.utils.responses import setup_json_provider
 
-# Configure logging using config manager
-server_config = config_manager.get_server_config()
-logging.basicConfig(
-    level=getattr(logging, server_config["log_level"]),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+# Root handlers (queued console/file output at LOG_LEVEL) are installed by
+# backend.config.logging when the config package is imported
 logger = logging.getLogger(__name__)
 
 
@@ -43,6 +47,19 @@ def create_app():
         }
     )
 
+    # Encode jsonify() responses with orjson
+    setup_json_provider(app)
+
+    # Set up response compression. Registered before the security middleware so
+    # its after_request hook runs last and compresses the final response body.
+    try:
+        from backend.middleware.compression import setup_compression
+
+        setup_compression(app)
+        logger.info("✅ Response compression middleware configured successfully")
+    except Exception as e:
+        logger.error("❌ Error configuring response compression: %s", str(e))
+
     # Set up combined auth security middleware
     try:
         from backend.middleware.auth_security import setup_auth_security
@@ -181,31 +198,22 @@ def create_app():
 
         logger.info("%d/10 blueprints registered successfully", blueprints_registered)
 
-        # Debug: List all registered routes
-        logger.info("=== DEBUG: Registered Routes ===")
-        for rule in app.url_map.iter_rules():
-            logger.info(
-                f"Route: {rule.rule} -> {rule.endpoint} [{','.join(rule.methods)}]"
-            )
-        logger.info("=== END DEBUG: Registered Routes ===")
-
-        # Additional debug for auth endpoints specifically
-        auth_routes = [
-            rule for rule in app.url_map.iter_rules() if "/auth" in rule.rule
-        ]
-        logger.info(f"=== DEBUG: Auth Routes Found ({len(auth_routes)}) ===")
-        for rule in auth_routes:
-            logger.info(
-                f"Auth Route: {rule.rule} -> {rule.endpoint} [{','.join(rule.methods)}]"
-            )
-        logger.info("=== END DEBUG: Auth Routes ===")
+        # Route dumps are only built when debug logging is enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            for rule in app.url_map.iter_rules():
+                logger.debug(
+                    "Route: %s -> %s [%s]",
+                    rule.rule, rule.endpoint, ",".join(rule.methods),
+                )
+            auth_routes = [
+                rule for rule in app.url_map.iter_rules() if "/auth" in rule.rule
+            ]
+            logger.debug("Auth routes found: %d", len(auth_routes))
 
-        # Test auth blueprint registration specifically
         if auth_bp:
-            logger.info("✅ Auth blueprint is available and should be registered")
-            logger.info(f"Auth blueprint name: {auth_bp.name}")
-            logger.info(
-                f"Auth blueprint url_prefix: {getattr(auth_bp, 'url_prefix', 'None')}"
+            logger.debug(
+                "Auth blueprint %s registered at %s",
+                auth_bp.name, getattr(auth_bp, "url_prefix", None),
             )
         else:
             logger.error("❌ Auth blueprint is None - this will cause 404 errors!")
@@ -275,7 +283,7 @@ def create_app():
         return jsonify(
             {
                 "status": "healthy",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": iso_now(),
                 "service": "Bartleby API",
             }
         )
@@ -287,7 +295,7 @@ def create_app():
             {
                 "status": "healthy",
                 "api_version": "1.0",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": iso_now(),
             }
         )
 
@@ -309,64 +317,124 @@ def create_app():
         # Don't let database issues prevent startup
         database_initialized = False
 
-        # Initialize database schemas with timeout - but don't fail startup if it fails
-        try:
-            from backend.config.database import get_metadata_pool, get_vector_pool
+        async def warm_database():
+            # Initialize database schemas with timeout - but don't fail startup if it fails
+            try:
+                from backend.config.database import get_metadata_pool, get_vector_pool
 
-            # Set a reasonable timeout for database operations
-            async def init_database_with_timeout():
-                nonlocal database_initialized
-                try:
-                    # Initialize metadata database
+                # Set a reasonable timeout for database operations
+                async def init_database_with_timeout():
+                    nonlocal database_initialized
                     try:
-                        logger.info("Attempting to initialize metadata database...")
-                        metadata_pool = await asyncio.wait_for(
-                            get_metadata_pool(), timeout=5.0
+                        # Initialize metadata database
+                        try:
+                            logger.info("Attempting to initialize metadata database...")
+                            metadata_pool = await asyncio.wait_for(
+                                get_metadata_pool(), timeout=5.0
+                            )
+                            if metadata_pool:
+                                # Test the connection quickly
+                                async with metadata_pool.acquire(timeout=3.0) as conn:
+                                    # Just test the connection, skip schema for now
+                                    await conn.fetchval("SELECT 1")
+                                    logger.info("Metadata database connection successful")
+                                    database_initialized = True
+                                try:
+                                    await listing_cache.start(metadata_pool)
+                                except Exception as e:
+                                    logger.warning(
+                                        "Listing cache disabled, LISTEN failed: %s", str(e)
+                                    )
+                            else:
+                                logger.warning("Metadata database pool not available")
+                        except asyncio.TimeoutError:
+                            logger.error("Timeout while initializing metadata database")
+                        except Exception as e:
+                            logger.error("Error initializing metadata database: %s", str(e))
+
+                        # Skip vector database initialization for now to speed up startup
+                        logger.info(
+                            "Skipping vector database initialization for fast startup"
                         )
-                        if metadata_pool:
-                            # Test the connection quickly
-                            async with asyncio.wait_for(
-                                metadata_pool.acquire(), timeout=3.0
-                            ) as conn:
-                                # Just test the connection, skip schema for now
-                                await conn.fetchval("SELECT 1")
-                                logger.info("Metadata database connection successful")
-                                database_initialized = True
-                        else:
-                            logger.warning("Metadata database pool not available")
-                    except asyncio.TimeoutError:
-                        logger.error("Timeout while initializing metadata database")
+
                     except Exception as e:
-                        logger.error("Error initializing metadata database: %s", str(e))
+                        logger.error("Error during database initialization: %s", str(e))
 
-                    # Skip vector database initialization for now to speed up startup
-                    logger.info(
-                        "Skipping vector database initialization for fast startup"
-                    )
+                # Run database initialization with overall timeout
+                try:
+                    await asyncio.wait_for(init_database_with_timeout(), timeout=10.0)
+                except asyncio.TimeoutError:
+                    logger.error("Database initialization timed out after 10 seconds")
 
-                except Exception as e:
-                    logger.error("Error during database initialization: %s", str(e))
+            except Exception as e:
+                logger.error("Error importing database configuration: %s", str(e))
+
+        async def build_services():
+            # Service construction does blocking imports (OpenAI, Qdrant,
+            # Pillow), so it runs in a thread while the DB handshake proceeds
+            try:
+                from backend.services import create_services
+
+                await asyncio.to_thread(create_services)
+                return True
+            except Exception as e:
+                logger.warning("Service construction failed: %s", str(e))
+                return False
 
-            # Run database initialization with overall timeout
+        async def warm_processor():
+            # Needs the open metadata pool, so it waits for warm_database
             try:
-                await asyncio.wait_for(init_database_with_timeout(), timeout=10.0)
-            except asyncio.TimeoutError:
-                logger.error("Database initialization timed out after 10 seconds")
+                from backend.services import aget_document_processor
 
-        except Exception as e:
-            logger.error("Error importing database configuration: %s", str(e))
+                await aget_document_processor()
+            except Exception as e:
+                logger.warning("Document processor warmup failed: %s", str(e))
 
-        # Set up background tasks
-        try:
-            logger.info("Background tasks setup completed")
-        except Exception as e:
-            logger.error("Error setting up background tasks: %s", str(e))
+        async def warm_clients():
+            try:
+                from backend.services import warm_connections
+
+                await warm_connections()
+                logger.info("Services initialized")
+            except Exception as e:
+                logger.warning("Service warmup incomplete: %s", str(e))
+
+        # Warm pools and clients before the first request arrives; each
+        # TaskGroup holds its tasks and waits for all of them before
+        # setup moves on
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(warm_database())
+            services_task = tg.create_task(build_services())
+
+        async with asyncio.TaskGroup() as tg:
+            if database_initialized:
+                tg.create_task(warm_processor())
+            if services_task.result():
+                tg.create_task(warm_clients())
+
+        # Background health probes and pool-usage logging; the services
+        # module keeps the task handle so shutdown can stop and await it
+        from backend.services import start_monitoring
+
+        start_monitoring()
 
         if database_initialized:
             logger.info("Application setup completed successfully with database")
         else:
             logger.warning("Application setup completed without database connection")
 
+    @app.after_serving
+    async def shutdown_app():
+        from backend.config.database import db_config
+        from backend.services import cleanup_services, stop_monitoring
+
+        await stop_monitoring()
+        await listing_cache.stop()
+        await storage_manager.close()
+        # Closes the service singletons (Qdrant, OpenAI, storage sessions)
+        await cleanup_services()
+        await db_config.close_pools()
+
     return app
 
 
@@ -380,6 +448,11 @@ def main():
     try:
         logger.info("Starting Bartleby application...")
 
+        # uvicorn selects uvloop itself; app.run needs the policy set first
+        if uvloop is not None:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+            logger.info("Using uvloop event loop")
+
         # Get server configuration
         server_config = config_manager.get_server_config()
 
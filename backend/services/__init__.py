@@ -1,30 +1,141 @@
 """Centralized service management for the Instantory backend. Provides singleton access to all services to eliminate duplication."""
 
 import asyncio
+import importlib
 import logging
-from typing import Any, Dict, Optional
-
-from asyncpg.exceptions import ConnectionDoesNotExistError, ConnectionFailureError
-from openai import AsyncOpenAI
-
-from backend.config.database import get_db_pool
+import random
+import threading
+import time
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from backend.config.client_factory import (
+    close_shared_http_client,
+    create_openai_client,
+    discard_shared_http_client,
+    get_shared_http_client,
+)
+from backend.config.manager import config_manager
+from backend.utils.lazy_import import lazy_import
 
 logger = logging.getLogger(__name__)
 
+# Service classes, imported on first construction
+StorageManager = lazy_import("backend.services.storage.manager.StorageManager")
+DocumentProcessor = lazy_import(
+    "backend.services.processor.document_processor.DocumentProcessor"
+)
+QdrantService = lazy_import("backend.services.vector.qdrant_service.QdrantService")
+OpenAIService = lazy_import("backend.services.openai_service.OpenAIService")
+
+# Database helpers are imported where they are used; these names stay
+# reachable as module attributes for callers that imported them from here
+_LAZY_ATTRIBUTES = {
+    "DatabaseType": "backend.config.database",
+    "db_config": "backend.config.database",
+    "get_db_pool": "backend.config.database",
+    "ConnectionDoesNotExistError": "asyncpg.exceptions",
+    "ConnectionFailureError": "asyncpg.exceptions",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve deferred attributes on first access (PEP 562)."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+# Upper bound (seconds) for any single health probe
+HEALTH_PROBE_TIMEOUT = 2.0
+# Upper bound (seconds) for a whole probe, covering acquire plus query
+HEALTH_PROBE_DEADLINE = 5.0
+# Probe results younger than this (seconds) are reused instead of re-probed
+HEALTH_CACHE_TTL = 10.0
+
 # Global service instances (singletons)
 _storage_manager = None
 _document_processor = None
 _qdrant_service = None
 _openai_client = None
+_openai_service = None
+# Weak reference to the event loop the OpenAI client is bound to
+_openai_loop_ref: Optional[weakref.ref] = None
+
+# Creation locks (double-checked) so concurrent first calls, including from
+# worker threads, build each singleton exactly once
+_openai_lock = threading.Lock()
+_storage_lock = threading.Lock()
+_document_processor_lock = threading.Lock()
+_qdrant_lock = threading.Lock()
+_openai_service_lock = threading.Lock()
+# Async construction awaits the pool, so it is serialized on the event loop
+# rather than by holding a thread lock across an await
+_document_processor_async_lock = asyncio.Lock()
+
+# Singletons to close at cleanup, by name, with their close method names.
+# Weak values: the module globals own the instances, so a replaced one (an
+# OpenAI client rebuilt for a new loop) drops out instead of being pinned
+_registry: "weakref.WeakValueDictionary[str, Any]" = weakref.WeakValueDictionary()
+_close_attrs: Dict[str, str] = {}
+
+
+def _register(name: str, obj: Any, close_attr: str = "close") -> None:
+    """Record a newly created singleton for cleanup_services."""
+    _registry[name] = obj
+    _close_attrs[name] = close_attr
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """Return the running event loop, or None when called from a plain thread."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
 
 
-def get_openai_client():
-    """Get the singleton OpenAI client instance."""
-    global _openai_client
+def _openai_client_usable(loop: Optional[asyncio.AbstractEventLoop]) -> bool:
+    """Whether the cached OpenAI client can serve ``loop``, binding it on first use.
+
+    Its pooled connections belong to the first loop that uses it; after a
+    loop is replaced (sequential asyncio.run calls, worker recycling) they
+    are unusable and the client has to be rebuilt.
+    """
+    global _openai_loop_ref
     if _openai_client is None:
+        return False
+    if loop is None:
+        return True
+    if _openai_loop_ref is None:
+        _openai_loop_ref = weakref.ref(loop)
+        return True
+    return _openai_loop_ref() is loop
+
+
+def get_openai_client():
+    """Get the singleton OpenAI client instance for the running event loop."""
+    global _openai_client, _openai_loop_ref
+    loop = _running_loop()
+    client = _openai_client
+    if client is not None:
+        loop_ref = _openai_loop_ref
+        if loop is None or (loop_ref is not None and loop_ref() is loop):
+            return client
+    with _openai_lock:
+        if _openai_client_usable(loop):
+            return _openai_client
+        if _openai_client is not None:
+            # Bound to a loop that is gone; it cannot be closed from here
+            logger.info("Event loop changed, rebuilding OpenAI client")
+            discard_shared_http_client()
         try:
             # Initialize OpenAI client with API key from environment variables
-            _openai_client = AsyncOpenAI()
+            _openai_client = create_openai_client()
+            _openai_loop_ref = weakref.ref(loop) if loop is not None else None
+            _register("openai", _openai_client)
             logger.info("OpenAI client instance created")
         except Exception as e:
             logger.error("Failed to create OpenAI client: %s", e)
@@ -32,14 +143,35 @@ def get_openai_client():
     return _openai_client
 
 
+def get_openai_service():
+    """Get the singleton OpenAIService.
+
+    It owns no client of its own and borrows ``get_openai_client``'s on each
+    call, so constructing it only reads configuration.
+    """
+    global _openai_service
+    service = _openai_service
+    if service is not None:
+        return service
+    with _openai_service_lock:
+        if _openai_service is None:
+            _openai_service = OpenAIService()
+            logger.info("OpenAI service instance created")
+    return _openai_service
+
+
 def get_storage_manager():
     """Get the singleton storage manager instance."""
     global _storage_manager
-    if _storage_manager is None:
+    service = _storage_manager
+    if service is not None:
+        return service
+    with _storage_lock:
+        if _storage_manager is not None:
+            return _storage_manager
         try:
-            from backend.services.storage.manager import StorageManager
-
             _storage_manager = StorageManager()
+            _register("storage_manager", _storage_manager)
             logger.info("Storage manager instance created")
         except ImportError as e:
             logger.error("Failed to import storage manager: %s", e)
@@ -50,49 +182,105 @@ def get_storage_manager():
     return _storage_manager
 
 
-def get_document_processor():
-    """Get the singleton document processor instance."""
+def _create_document_processor(db_pool):
+    """Build the document processor singleton for ``db_pool`` (caller holds the lock)."""
     global _document_processor
-    if _document_processor is None:
-        try:
-            from backend.services.processor.document_processor import DocumentProcessor
+    try:
+        # Get the required dependencies
+        storage_manager = get_storage_manager()
+        openai_client = get_openai_client()
 
-            # Get the required dependencies
-            storage_manager = get_storage_manager()
-            openai_client = get_openai_client()
+        # Check if dependencies are available
+        if storage_manager is None or openai_client is None:
+            logger.error(
+                "Required dependencies not available for document processor"
+            )
+            return None
+
+        # Create document processor with required arguments
+        _document_processor = DocumentProcessor(
+            db_pool=db_pool, openai_client=openai_client
+        )
+        logger.info("Document processor instance created")
+    except ImportError as e:
+        logger.error("Failed to import document processor: %s", e)
+        _document_processor = None
+    except Exception as e:
+        logger.error("Failed to create document processor: %s", e)
+        _document_processor = None
+    return _document_processor
 
-            # Check if dependencies are available
-            if storage_manager is None or openai_client is None:
-                logger.error(
-                    "Required dependencies not available for document processor"
-                )
-                return None
 
-            # Get db_pool from storage manager
-            db_pool = get_db_pool()
+def get_document_processor():
+    """Get the singleton document processor instance.
+
+    Synchronous callers cannot open the pool, so this only builds the
+    processor once the shared metadata pool exists; code on the event loop
+    should use ``aget_document_processor``.
+    """
+    service = _document_processor
+    if service is not None:
+        return service
+    with _document_processor_lock:
+        if _document_processor is not None:
+            return _document_processor
+        from backend.config.database import DatabaseType, db_config
+
+        # Share the one metadata pool rather than opening another
+        db_pool = db_config.open_pool(DatabaseType.METADATA)
+        if db_pool is None:
+            logger.warning("Metadata pool not open yet; document processor deferred")
+            return None
+        return _create_document_processor(db_pool)
+
+
+async def aget_document_processor():
+    """Get the singleton document processor, awaiting the metadata pool first.
+
+    Concurrent first callers wait on one construction instead of each
+    building a processor.
+    """
+    service = _document_processor
+    if service is not None:
+        return service
+    async with _document_processor_async_lock:
+        if _document_processor is not None:
+            return _document_processor
+        from backend.config.database import get_db_pool
 
-            # Create document processor with required arguments
-            _document_processor = DocumentProcessor(
-                db_pool=db_pool, openai_client=openai_client
-            )
-            logger.info("Document processor instance created")
-        except ImportError as e:
-            logger.error("Failed to import document processor: %s", e)
-            _document_processor = None
+        try:
+            db_pool = await get_db_pool()
         except Exception as e:
-            logger.error("Failed to create document processor: %s", e)
-            _document_processor = None
-    return _document_processor
+            logger.error("Failed to get pool for document processor: %s", e)
+            return None
+        with _document_processor_lock:
+            if _document_processor is not None:
+                return _document_processor
+            return _create_document_processor(db_pool)
+
+
+def qdrant_enabled() -> bool:
+    """Whether Qdrant is configured; QdrantService cannot start without an API key."""
+    return bool(config_manager.get_qdrant_config()["api_key"])
 
 
 def get_qdrant_service():
-    """Get the singleton Qdrant vector database service instance."""
+    """Get the singleton Qdrant vector database service instance.
+
+    Returns None without importing the Qdrant client when it is not configured.
+    """
     global _qdrant_service
-    if _qdrant_service is None:
+    service = _qdrant_service
+    if service is not None:
+        return service
+    if not qdrant_enabled():
+        return None
+    with _qdrant_lock:
+        if _qdrant_service is not None:
+            return _qdrant_service
         try:
-            from backend.services.vector.qdrant_service import QdrantService
-
             _qdrant_service = QdrantService()
+            _register("qdrant", _qdrant_service)
             logger.info("Qdrant service instance created")
         except ImportError as e:
             logger.error("Failed to import Qdrant service: %s", e)
@@ -103,44 +291,248 @@ def get_qdrant_service():
     return _qdrant_service
 
 
-async def check_services_health() -> Dict[str, Dict[str, Any]]:
-    """Check the health of all services."""
-    health_results: Dict[str, Dict[str, Any]] = {}
-
-    # Check storage service
+async def _probe_storage() -> Dict[str, Any]:
+    """Report storage manager availability."""
     storage_manager = get_storage_manager()
-    if storage_manager:
+    if storage_manager is None:
+        return {"status": "unavailable", "service": "storage_manager"}
+    return {"status": "healthy", "service": "storage_manager"}
+
+
+async def _probe_metadata_db() -> Dict[str, Any]:
+    """Run a trivial query against the metadata pool."""
+    from backend.config.database import DatabaseType, db_config
+
+    # Report on the pool the app is using; a probe never opens one itself
+    pool = db_config.open_pool(DatabaseType.METADATA)
+    if pool is None:
+        return {"status": "unavailable", "service": "metadata_db"}
+    async with pool.acquire(timeout=HEALTH_PROBE_TIMEOUT) as conn:
+        await conn.fetchval("SELECT 1", timeout=HEALTH_PROBE_TIMEOUT)
+    return {"status": "healthy", "service": "metadata_db"}
+
+
+async def _probe_qdrant() -> Dict[str, Any]:
+    """Ask an already-created Qdrant service for its health."""
+    if not qdrant_enabled():
+        return {"status": "disabled", "service": "qdrant"}
+    if _qdrant_service is None:
+        return {"status": "unavailable", "service": "qdrant"}
+    health = await asyncio.wait_for(
+        _qdrant_service.health_check(), timeout=HEALTH_PROBE_TIMEOUT
+    )
+    return {**health, "service": "qdrant"}
+
+
+async def _probe_openai() -> Dict[str, Any]:
+    """List models with the shared client: one cheap authenticated round-trip."""
+    from openai import APIError
+
+    client = get_openai_client()
+    if client is None:
+        return {"status": "unavailable", "service": "openai"}
+    try:
+        await client.models.list(timeout=HEALTH_PROBE_TIMEOUT)
+    except APIError as e:
+        # Rejected key, rate limit or unreachable API
+        return {"status": "unhealthy", "service": "openai", "error": str(e) or type(e).__name__}
+    return {"status": "healthy", "service": "openai"}
+
+
+# Probe statuses that need no attention; "disabled" services are off by config
+HEALTHY_STATUSES = frozenset({"healthy", "disabled"})
+
+HEALTH_PROBES = {
+    "storage": _probe_storage,
+    "metadata_db": _probe_metadata_db,
+    "qdrant": _probe_qdrant,
+    "openai": _probe_openai,
+}
+
+
+# Last result per probe as (monotonic timestamp, result)
+_health_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+
+async def _cached_probe(
+    name: str, probe: Callable[[], Awaitable[Dict[str, Any]]], max_age: float
+) -> Dict[str, Any]:
+    """Return a probe's cached result if fresh enough, else run and store it."""
+    cached = _health_cache.get(name)
+    if cached is not None and time.monotonic() - cached[0] < max_age:
+        return cached[1]
+    from asyncpg.exceptions import ConnectionDoesNotExistError, ConnectionFailureError
+
+    try:
+        result = await asyncio.wait_for(probe(), timeout=HEALTH_PROBE_DEADLINE)
+    except asyncio.TimeoutError:
+        result = {"status": "unhealthy", "error": f"timed out after {HEALTH_PROBE_DEADLINE}s"}
+    except (OSError, RuntimeError, ConnectionDoesNotExistError, ConnectionFailureError) as e:
+        # Expected outages: the service is unreachable or not set up
+        result = {"status": "unhealthy", "error": str(e) or type(e).__name__}
+    except Exception as e:
+        # Anything else is a bug in the probe; keep the traceback
+        logger.exception("Health probe %s raised unexpectedly", name)
+        result = {"status": "unhealthy", "error": str(e) or type(e).__name__}
+    _health_cache[name] = (time.monotonic(), result)
+    return result
+
+
+async def check_services_health(
+    max_age: float = HEALTH_CACHE_TTL,
+) -> Dict[str, Dict[str, Any]]:
+    """Check the health of all services, running every stale probe concurrently.
+
+    Results younger than ``max_age`` seconds are served from the cache; pass
+    ``max_age=0`` to force fresh probes.
+    """
+    results = await asyncio.gather(
+        *(_cached_probe(name, probe, max_age) for name, probe in HEALTH_PROBES.items())
+    )
+    return dict(zip(HEALTH_PROBES, results))
+
+
+async def check_service_health(
+    name: str, max_age: float = HEALTH_CACHE_TTL
+) -> Dict[str, Any]:
+    """Check one service from ``HEALTH_PROBES``, sharing the probe cache."""
+    return await _cached_probe(name, HEALTH_PROBES[name], max_age)
+
+
+# Seconds between background refreshes per probe: cheap local checks run
+# often, network round-trips less so
+MONITOR_INTERVALS = {
+    "storage": 30.0,
+    "metadata_db": 120.0,
+    "qdrant": 600.0,
+    "openai": 600.0,
+}
+# Fractional jitter so replicas started together do not probe in lockstep
+MONITOR_JITTER = 0.1
+
+
+# The running monitor task and the stop event that belongs to it
+_monitor: Optional[Tuple[asyncio.Task, asyncio.Event]] = None
+
+
+async def _monitor_probe(name: str, interval: float, stop: asyncio.Event) -> None:
+    """Refresh one probe's cached result every ``interval`` seconds.
+
+    Runs are scheduled against monotonic deadlines, so probe time does not
+    push later runs back; a run that overshoots skips the missed slots.
+    """
+    probe = HEALTH_PROBES[name]
+    next_run = time.monotonic()
+    while not stop.is_set():
         try:
-            # Test storage connectivity
-            health_results["storage"] = {
-                "status": "healthy",
-                "service": "storage_manager",
-            }
+            result = await _cached_probe(name, probe, max_age=0)
+            if result.get("status") not in HEALTHY_STATUSES:
+                logger.warning("Service %s health: %s", name, result)
+            if name == "metadata_db":
+                from backend.config.database import db_config
+
+                logger.info("Database pool usage: %s", db_config.pool_stats())
         except Exception as e:
-            health_results["storage"] = {
-                "status": "unhealthy",
-                "error": str(e),
-                "service": "storage_manager",
-            }
-    else:
-        health_results["storage"] = {
-            "status": "unavailable",
-            "service": "storage_manager",
-        }
-
-    return health_results
-
-
-async def monitor_services():
-    """Periodic service health monitoring."""
-    while True:
+            logger.error("Service monitoring error for %s: %s", name, e)
+        next_run += interval * random.uniform(1 - MONITOR_JITTER, 1 + MONITOR_JITTER)
+        now = time.monotonic()
+        if next_run < now:
+            next_run = now
         try:
-            health_status = await check_services_health()
-            logger.info("Service health check completed: %s", health_status)
-            await asyncio.sleep(300)  # Check every 5 minutes
-        except Exception as e:
-            logger.error("Service monitoring error: %s", e)
-            await asyncio.sleep(60)  # Retry in 1 minute on error
+            await asyncio.wait_for(stop.wait(), timeout=next_run - now)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def monitor_services(stop: asyncio.Event) -> None:
+    """Periodic service health monitoring, one loop per probe.
+
+    Each loop writes into the health cache, so ``check_services_health``
+    callers get the background-refreshed results. Returns once ``stop`` is
+    set; each run has its own event, so stopping one never affects another.
+    """
+    await asyncio.gather(
+        *(
+            _monitor_probe(name, MONITOR_INTERVALS.get(name, 300.0), stop)
+            for name in HEALTH_PROBES
+        )
+    )
+
+
+def start_monitoring() -> asyncio.Task:
+    """Start ``monitor_services`` on the running loop, keeping its handle."""
+    global _monitor
+    if _monitor is not None and not _monitor[0].done():
+        return _monitor[0]
+    stop = asyncio.Event()
+    task = asyncio.get_running_loop().create_task(
+        monitor_services(stop), name="monitor_services"
+    )
+    _monitor = (task, stop)
+    return task
+
+
+async def stop_monitoring() -> None:
+    """Stop the monitor started by ``start_monitoring`` and wait for it to exit."""
+    global _monitor
+    if _monitor is None:
+        return
+    (task, stop), _monitor = _monitor, None
+    stop.set()
+    try:
+        # A probe in flight finishes within its deadline; wait_for cancels
+        # the task if it does not
+        await asyncio.wait_for(task, timeout=HEALTH_PROBE_DEADLINE)
+    except asyncio.TimeoutError:
+        logger.warning("Service monitor did not stop in time; cancelled")
+    except Exception as e:
+        logger.error("Service monitor failed: %s", e)
+
+
+def create_services() -> None:
+    """Build the service singletons that need no database pool, raising if one is unavailable.
+
+    Blocking (module imports and client construction), so call it from the
+    event loop through ``asyncio.to_thread``. The document processor needs
+    the metadata pool and is built by ``aget_document_processor``.
+    """
+    # Initialize services in order of dependencies
+    if get_storage_manager() is None:
+        raise RuntimeError("Failed to initialize storage manager")
+
+    if get_openai_client() is None:
+        raise RuntimeError("Failed to initialize OpenAI client")
+
+    if qdrant_enabled() and get_qdrant_service() is None:
+        raise RuntimeError("Failed to initialize Qdrant service")
+
+
+async def _warm(name: str, call: Callable[[], Awaitable[Any]]) -> None:
+    """Run one warmup call under the probe deadline, logging any failure."""
+    try:
+        await asyncio.wait_for(call(), timeout=HEALTH_PROBE_DEADLINE)
+    except Exception as e:
+        logger.warning("%s warmup failed: %s", name, str(e) or type(e).__name__)
+
+
+async def warm_connections() -> None:
+    """Open outbound connections before the first request needs them.
+
+    asyncpg already opens ``min_size`` connections when a pool is created,
+    so this covers the HTTP services: ensuring the Qdrant collection exists
+    and listing OpenAI models each complete the TLS handshake and leave a
+    keep-alive connection in the pool. The tokenizer encoding used to trim
+    documents is loaded as well.
+    """
+    warmups = []
+    if _qdrant_service is not None:
+        warmups.append(_warm("Qdrant", _qdrant_service.initialize_collection))
+    openai_client = get_openai_client()
+    if openai_client is not None:
+        warmups.append(_warm("OpenAI", openai_client.models.list))
+        # tiktoken fetches its encoding on first use; do that here too
+        warmups.append(_warm("tiktoken", get_openai_service().warm))
+    await asyncio.gather(*warmups)
 
 
 async def initialize_services():
@@ -148,29 +540,20 @@ async def initialize_services():
     logger.info("Initializing all services...")
 
     try:
-        # Initialize services in order of dependencies
-        storage_manager = get_storage_manager()
-        if storage_manager is None:
-            raise RuntimeError("Failed to initialize storage manager")
-
-        openai_client = get_openai_client()
-        if openai_client is None:
-            raise RuntimeError("Failed to initialize OpenAI client")
-
-        document_processor = get_document_processor()
-        if document_processor is None:
+        await asyncio.to_thread(create_services)
+        # Both must finish (or fail loudly) before services count as ready
+        async with asyncio.TaskGroup() as tg:
+            processor_task = tg.create_task(aget_document_processor())
+            tg.create_task(warm_connections())
+        if processor_task.result() is None:
             raise RuntimeError("Failed to initialize document processor")
 
-        qdrant_service = get_qdrant_service()
-        if qdrant_service is None:
-            raise RuntimeError("Failed to initialize Qdrant service")
-
         # Verify service health
         health_status = await check_services_health()
         unhealthy_services = [
             service
             for service, status in health_status.items()
-            if status.get("status") != "healthy"
+            if status.get("status") not in HEALTHY_STATUSES
         ]
 
         if unhealthy_services:
@@ -188,39 +571,43 @@ async def initialize_services():
 async def cleanup_services():
     """Clean up all service resources."""
     global _storage_manager, _document_processor, _qdrant_service, _openai_client
+    global _openai_service
+    global _openai_loop_ref
 
     logger.info("Cleaning up services...")
+    await stop_monitoring()
 
     try:
-        # Clean up storage manager connections
-        if _storage_manager:
-            try:
-                await _storage_manager.cleanup()
-                logger.info("Storage manager cleaned up")
-            except Exception as e:
-                logger.error("Error cleaning up storage manager: %s", e)
-
-        # Clean up Qdrant service
-        if _qdrant_service:
-            try:
-                await _qdrant_service.close()
-                logger.info("Qdrant service cleaned up")
-            except Exception as e:
-                logger.error("Error cleaning up Qdrant service: %s", e)
-
-        # Clean up OpenAI client
-        if _openai_client:
-            try:
-                await _openai_client.close()
-                logger.info("OpenAI client cleaned up")
-            except Exception as e:
-                logger.error("Error cleaning up OpenAI client: %s", e)
+        # Close every registered service concurrently
+        entries = [
+            (name, obj, _close_attrs[name])
+            for name, obj in list(_registry.items())
+            if hasattr(obj, _close_attrs[name])
+        ]
+        _registry.clear()
+        results = await asyncio.gather(
+            *(getattr(obj, attr)() for _, obj, attr in entries), return_exceptions=True
+        )
+        for (name, _, _), result in zip(entries, results):
+            if isinstance(result, Exception):
+                logger.error("Error cleaning up %s: %s", name, result)
+            else:
+                logger.info("%s cleaned up", name)
+
+        # The OpenAI client's pool is the shared httpx client
+        try:
+            await close_shared_http_client()
+        except Exception as e:
+            logger.error("Error closing shared HTTP client: %s", e)
 
         # Reset global instances
         _storage_manager = None
         _document_processor = None
         _qdrant_service = None
         _openai_client = None
+        _openai_service = None
+        _openai_loop_ref = None
+        _health_cache.clear()
 
         logger.info("All services cleaned up successfully")
 
@@ -229,11 +616,20 @@ async def cleanup_services():
 
 
 __all__ = [
+    "get_openai_client",
+    "get_openai_service",
+    "get_shared_http_client",
     "get_storage_manager",
     "get_document_processor",
+    "aget_document_processor",
     "get_qdrant_service",
     "check_services_health",
+    "check_service_health",
+    "create_services",
     "initialize_services",
+    "warm_connections",
     "cleanup_services",
     "monitor_services",
+    "start_monitoring",
+    "stop_monitoring",
 ]
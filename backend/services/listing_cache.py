@@ -0,0 +1,168 @@
+"""In-process cache for per-user inventory and document listings.
+
+Entries are invalidated by Postgres LISTEN/NOTIFY (see
+``scripts/listing_change_notify.sql``), so every app process drops its copy as
+soon as any process changes the underlying tables. Writes through this
+process also invalidate locally, without waiting for the notification. While
+no listener is connected, or the notify triggers are missing, the cache is
+bypassed entirely rather than risk serving stale data.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Hashable, Optional, Tuple
+
+import asyncpg
+
+logger = logging.getLogger(__name__)
+
+INVENTORY_CHANNEL = "inventory_changed"
+DOCUMENTS_CHANNEL = "documents_changed"
+
+NOTIFY_SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "listing_change_notify.sql"
+# Triggers created by NOTIFY_SCRIPT, as (table, trigger name)
+NOTIFY_TRIGGERS = (
+    ("user_inventory", "user_inventory_notify"),
+    ("inventory_assets", "inventory_assets_notify"),
+    ("user_documents", "user_documents_notify"),
+)
+
+
+class ListingCache:
+    """Encoded listing payloads keyed by channel and per-user listing key."""
+
+    CHANNELS = (INVENTORY_CHANNEL, DOCUMENTS_CHANNEL)
+    # Upper bound on an entry's age, in case a notification is ever missed
+    TTL = 60.0
+    # Keys are client-chosen (user, limit, offset), so each channel is an
+    # LRU capped at this many payloads
+    MAX_ENTRIES = 1024
+
+    def __init__(self):
+        self._entries: Dict[str, "OrderedDict[Hashable, Tuple[float, bytes]]"] = {
+            channel: OrderedDict() for channel in self.CHANNELS
+        }
+        self._generations: Dict[str, int] = dict.fromkeys(self.CHANNELS, 0)
+        self._conn: Optional[asyncpg.Connection] = None
+        self._pool: Optional[asyncpg.Pool] = None
+
+    @property
+    def listening(self) -> bool:
+        """Whether change notifications are currently being received."""
+        return self._conn is not None and not self._conn.is_closed()
+
+    def generation(self, channel: str) -> int:
+        """Return the channel's invalidation count; take it before fetching."""
+        return self._generations[channel]
+
+    def get(self, channel: str, key: Hashable) -> Optional[bytes]:
+        """Return a cached payload, or None on a miss, expiry or when not listening."""
+        if not self.listening:
+            return None
+        entries = self._entries[channel]
+        entry = entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() >= entry[0]:
+            del entries[key]
+            return None
+        entries.move_to_end(key)
+        return entry[1]
+
+    def set(self, channel: str, key: Hashable, payload: bytes, generation: int) -> None:
+        """Store an encoded payload fetched at ``generation``.
+
+        The payload is dropped if the channel was invalidated since then: the
+        rows may predate a change whose notification has already arrived.
+        """
+        if not self.listening or generation != self._generations[channel]:
+            return
+        entries = self._entries[channel]
+        entries[key] = (time.monotonic() + self.TTL, payload)
+        entries.move_to_end(key)
+        while len(entries) > self.MAX_ENTRIES:
+            entries.popitem(last=False)
+
+    def invalidate(self, channel: Optional[str] = None) -> None:
+        """Drop cached payloads for one channel, or all channels."""
+        for name in (channel,) if channel else self.CHANNELS:
+            self._generations[name] += 1
+            self._entries[name].clear()
+
+    def _on_notify(self, connection, pid, channel, payload) -> None:
+        logger.debug("Listing change notification on %s", channel)
+        self.invalidate(channel)
+
+    def _on_terminate(self, connection) -> None:
+        logger.warning("Listing cache listener connection lost, cache disabled")
+        self._conn = None
+        self.invalidate()
+
+    async def _ensure_triggers(self, conn: asyncpg.Connection) -> bool:
+        """Check the notify triggers exist, creating them from NOTIFY_SCRIPT if not."""
+        query = """
+            SELECT count(*) FROM pg_trigger t
+            JOIN pg_class c ON c.oid = t.tgrelid
+            WHERE (c.relname, t.tgname) IN (SELECT * FROM unnest($1::text[], $2::text[]))
+              AND NOT t.tgisinternal
+        """
+        tables, names = (list(column) for column in zip(*NOTIFY_TRIGGERS))
+        if await conn.fetchval(query, tables, names) == len(NOTIFY_TRIGGERS):
+            return True
+        try:
+            script = await asyncio.to_thread(NOTIFY_SCRIPT.read_text)
+            async with conn.transaction():
+                await conn.execute(script)
+        except (OSError, asyncpg.PostgresError) as e:
+            logger.warning("Could not create listing notify triggers: %s", e)
+            return False
+        logger.info("Created listing notify triggers from %s", NOTIFY_SCRIPT.name)
+        return True
+
+    async def start(self, pool: asyncpg.Pool) -> None:
+        """Hold a dedicated pool connection and LISTEN on the change channels.
+
+        Without the notify triggers nothing would ever invalidate the cache,
+        so it stays disabled when they are missing and cannot be created.
+        """
+        if self.listening:
+            return
+        conn = await pool.acquire()
+        try:
+            ready = await self._ensure_triggers(conn)
+            if ready:
+                for channel in self.CHANNELS:
+                    await conn.add_listener(channel, self._on_notify)
+                conn.add_termination_listener(self._on_terminate)
+        except Exception:
+            await pool.release(conn)
+            raise
+        if not ready:
+            logger.warning("Listing cache disabled, notify triggers missing")
+            await pool.release(conn)
+            return
+        self._conn = conn
+        self._pool = pool
+        logger.info("Listing cache listening for %s", ", ".join(self.CHANNELS))
+
+    async def stop(self) -> None:
+        """Stop listening and release the connection."""
+        conn, pool = self._conn, self._pool
+        self._conn = None
+        self._pool = None
+        self.invalidate()
+        if conn is None or conn.is_closed():
+            return
+        try:
+            for channel in self.CHANNELS:
+                await conn.remove_listener(channel, self._on_notify)
+            conn.remove_termination_listener(self._on_terminate)
+        finally:
+            await pool.release(conn)
+
+
+# Global instance
+listing_cache = ListingCache()
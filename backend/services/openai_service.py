@@ -3,46 +3,298 @@ OpenAI Service for document processing and inventory analysis.
 Provides centralized OpenAI API integration for the Bartleby application.
 """
 
+import asyncio
 import json
 import logging
+import time
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from pydantic import BaseModel, ConfigDict, ValidationError
 
 try:
     from openai import AsyncOpenAI
 except ImportError:
     AsyncOpenAI = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
 from backend.config.manager import config_manager
+from backend.services import get_openai_client
 
 logger = logging.getLogger(__name__)
 
+
+def _dumps(obj: Any) -> str:
+    """Encode a prompt payload as JSON text, with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(
+            obj, default=str, option=orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
+    return json.dumps(obj, default=str)
+
+
+def _loads(text: str) -> Any:
+    """Decode a model response; orjson's decode error subclasses json's."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _looks_like_json(text: str, openers: str = "{[") -> bool:
+    """Whether a reply starts like a JSON value opened by one of ``openers``.
+
+    Free-form replies are common, so they are turned away by their first
+    character instead of by raising and catching a decode error.
+    """
+    text = text.lstrip()
+    return bool(text) and text[0] in openers
+
+
+def _maybe_json(text: str) -> Any:
+    """Decode a reply that looks like a JSON object or array, else None."""
+    if not _looks_like_json(text):
+        return None
+    try:
+        return _loads(text)
+    except json.JSONDecodeError:
+        # Started like JSON but was cut off or malformed
+        return None
+
+
+# Document text sent to the model: a token budget when tiktoken is
+# available, otherwise a character cut
+MAX_INPUT_TOKENS = 6000
+MAX_INPUT_CHARS = 8000
+# Text beyond this many characters cannot fit the token budget in practice,
+# so it is never encoded
+MAX_ENCODE_CHARS = MAX_INPUT_TOKENS * 10
+
+
+# Seconds before a failed encoding load is attempted again
+ENCODING_RETRY_SECONDS = 60.0
+
+# Loaded tiktoken encodings by model, and when a load last failed; failures
+# are retried after ENCODING_RETRY_SECONDS rather than remembered for good
+_encodings: Dict[str, Any] = {}
+_encoding_failed_at: Dict[str, float] = {}
+
+
+def _load_encoding(model: str):
+    """Load the tiktoken encoding for ``model``, or None if unavailable.
+
+    Blocking: tiktoken downloads the BPE file on first use, so call this
+    through ``asyncio.to_thread``.
+    """
+    encoding = _encodings.get(model)
+    if encoding is not None or tiktoken is None:
+        return encoding
+    failed_at = _encoding_failed_at.get(model)
+    if failed_at is not None and time.monotonic() - failed_at < ENCODING_RETRY_SECONDS:
+        return None
+    try:
+        try:
+            encoding = tiktoken.encoding_for_model(model)
+        except KeyError:
+            encoding = tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        # Offline or download failed; callers fall back to a character cut
+        logger.warning("tiktoken encoding unavailable for %s: %s", model, e)
+        _encoding_failed_at[model] = time.monotonic()
+        return None
+    _encodings[model] = encoding
+    _encoding_failed_at.pop(model, None)
+    return encoding
+
+
+def _cut_tokens(encoding: Any, content: str) -> str:
+    """Cut ``content`` to MAX_INPUT_TOKENS tokens of ``encoding`` (CPU-bound)."""
+    tokens = encoding.encode(content, disallowed_special=())
+    if len(tokens) <= MAX_INPUT_TOKENS:
+        return content
+    return encoding.decode(tokens[:MAX_INPUT_TOKENS])
+
+
+async def _trim_to_tokens(content: str, model: str) -> str:
+    """Cut ``content`` to MAX_INPUT_TOKENS tokens of ``model``'s encoding.
+
+    Loading the encoding and the encode/decode round-trip both run in a
+    worker thread so they never stall the event loop.
+    """
+    # Every token covers at least one character
+    if len(content) <= MAX_INPUT_TOKENS:
+        return content
+    encoding = _encodings.get(model)
+    if encoding is None:
+        encoding = await asyncio.to_thread(_load_encoding, model)
+    if encoding is None:
+        return content[:MAX_INPUT_CHARS]
+    return await asyncio.to_thread(_cut_tokens, encoding, content[:MAX_ENCODE_CHARS])
+
+
+class DocumentExtraction(BaseModel):
+    """The JSON object process_document asks the model for.
+
+    Decoded and validated in one pass by pydantic-core; missing keys get
+    empty defaults and unexpected ones are kept.
+    """
+
+    model_config = ConfigDict(extra="allow")
+
+    summary: str = ""
+    key_entities: List[Any] = []
+    dates: List[Any] = []
+    amounts: List[Any] = []
+    contacts: List[Any] = []
+    actionable_items: List[Any] = []
+    metadata: Dict[str, Any] = {}
+
+
+# System prompts, built once at import
+DOCUMENT_ANALYST_PROMPT = (
+    "You are an expert document analyst. Extract structured information "
+    "from the following document. Focus on key entities, dates, amounts, "
+    "contact information, and any actionable items."
+)
+
+# Closes every process_document prompt
+DOCUMENT_SCHEMA_SUFFIX = """
+
+Return a JSON object with the following structure:
+{
+    "summary": "Brief summary of the document",
+    "key_entities": ["list", "of", "important", "entities"],
+    "dates": ["extracted dates"],
+    "amounts": ["monetary amounts or quantities"],
+    "contacts": ["contact information"],
+    "actionable_items": ["tasks or actions mentioned"],
+    "metadata": {
+        "confidence": "high/medium/low",
+        "document_category": "category",
+        "language": "detected language"
+    }
+}
+"""
+
+INVENTORY_ANALYSIS_PROMPT = """
+Analyze this inventory data and provide actionable insights. Focus on:
+1. Category distribution and trends
+2. Pricing patterns and recommendations
+3. Inventory optimization suggestions
+4. Missing or incomplete data identification
+5. Business insights and opportunities
+
+Return a JSON object with structured analysis.
+"""
+
+INSIGHTS_PROMPT_TEMPLATE = """
+Analyze this {data_type} data and provide meaningful insights, patterns, 
+and actionable recommendations. Be specific and practical.
+
+Additional context: {context}
+
+Return insights in a structured JSON format.
+"""
+
+IMAGE_DESCRIPTION_PROMPT = """
+From this image description, extract potential inventory item information.
+Focus on identifying products, their attributes, conditions, and any visible text or labels.
+
+Return a JSON object with:
+{
+    "items_identified": [
+        {
+            "name": "item name",
+            "category": "category",
+            "condition": "condition",
+            "estimated_value": "value if determinable",
+            "description": "detailed description",
+            "attributes": ["list", "of", "attributes"]
+        }
+    ],
+    "text_visible": "any visible text or labels",
+    "scene_context": "overall scene description",
+    "inventory_potential": "high/medium/low - likelihood these are inventory items"
+}
+"""
+
+
 class OpenAIService:
     """Service for handling OpenAI API interactions"""
     
     def __init__(self):
         """Initialize OpenAI service with configuration"""
-        self.client = None
         self.config = config_manager.get_openai_config()
+        self._model = self.config.get("model", "gpt-3.5-turbo")
+        # Plain attribute: every public method checks it on entry. Static
+        # config check; a failed client build is retried on the next call
+        self.is_available: bool = bool(AsyncOpenAI and self.config.get("api_key"))
         
-        if AsyncOpenAI and self.config.get("api_key"):
-            try:
-                self.client = AsyncOpenAI(
-                    api_key=self.config["api_key"],
-                    timeout=30.0
-                )
-                logger.info("✅ OpenAI service initialized successfully")
-            except Exception as e:
-                logger.error(f"❌ Failed to initialize OpenAI client: {e}")
-                self.client = None
+        if self.is_available:
+            logger.info("✅ OpenAI service initialized successfully")
         else:
             logger.warning("⚠️ OpenAI not available - missing API key or library")
     
     @property
-    def is_available(self) -> bool:
-        """Check if OpenAI service is available"""
-        return self.client is not None
+    def client(self):
+        """
+        The shared AsyncOpenAI client, or None when OpenAI is not configured.
+        
+        Checked out from the services registry on each use rather than owned
+        here, so every caller reuses one client with warm keep-alive
+        connections, rebuilt only if the event loop changes.
+        """
+        if not self.is_available:
+            return None
+        return get_openai_client()
+    
+    async def warm(self) -> None:
+        """Load the model's tiktoken encoding ahead of the first request."""
+        if self.is_available:
+            await asyncio.to_thread(_load_encoding, self._model)
+    
+    async def _complete(self,
+                        messages: List[Dict[str, str]],
+                        temperature: float,
+                        max_tokens: int) -> Tuple[str, int]:
+        """
+        Run a streamed chat completion and return its text and total tokens.
+        
+        Streaming keeps bytes arriving during long generations, so the read
+        timeout bounds the gap between tokens rather than the whole answer.
+        """
+        client = self.client
+        if client is None:
+            raise RuntimeError("OpenAI client could not be created")
+        stream = await client.chat.completions.create(
+            model=self._model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=True,
+            stream_options={"include_usage": True}
+        )
+        
+        parts = []
+        tokens_used = 0
+        async for chunk in stream:
+            if chunk.choices:
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+            if chunk.usage:
+                tokens_used = chunk.usage.total_tokens
+        return "".join(parts), tokens_used
     
     async def process_document(self, 
                              content: str, 
@@ -69,60 +321,42 @@ class OpenAIService:
             }
         
         try:
-            # Build context-aware prompt
-            base_instruction = (
-                "You are an expert document analyst. Extract structured information "
-                "from the following document. Focus on key entities, dates, amounts, "
-                "contact information, and any actionable items."
-            )
-            
+            # Build context-aware prompt, joined once at the end
+            parts = [DOCUMENT_ANALYST_PROMPT]
             if user_instruction:
-                instruction = f"{base_instruction}\n\nSpecific instructions: {user_instruction}"
-            else:
-                instruction = base_instruction
+                parts.append(f"\n\nSpecific instructions: {user_instruction}")
             
             # Add document type context
             if document_type != "unknown":
-                instruction += f"\n\nDocument type: {document_type}"
+                parts.append(f"\n\nDocument type: {document_type}")
             
             if file_name:
-                instruction += f"\nFile name: {file_name}"
+                parts.append(f"\nFile name: {file_name}")
             
-            instruction += """
-
-Return a JSON object with the following structure:
-{
-    "summary": "Brief summary of the document",
-    "key_entities": ["list", "of", "important", "entities"],
-    "dates": ["extracted dates"],
-    "amounts": ["monetary amounts or quantities"],
-    "contacts": ["contact information"],
-    "actionable_items": ["tasks or actions mentioned"],
-    "metadata": {
-        "confidence": "high/medium/low",
-        "document_category": "category",
-        "language": "detected language"
-    }
-}
-"""
+            parts.append(DOCUMENT_SCHEMA_SUFFIX)
+            instruction = "".join(parts)
+            user_content = await _trim_to_tokens(content, self._model)
             
-            response = await self.client.chat.completions.create(
-                model=self.config.get("model", "gpt-3.5-turbo"),
-                messages=[
+            result_text, tokens_used = await self._complete(
+                [
                     {"role": "system", "content": instruction},
-                    {"role": "user", "content": content[:8000]}  # Limit content size
+                    {"role": "user", "content": user_content}
                 ],
                 temperature=0.1,
                 max_tokens=1500
             )
             
-            result_text = response.choices[0].message.content
-            
-            # Try to parse JSON response
-            try:
-                extracted_data = json.loads(result_text)
-            except json.JSONDecodeError:
-                # If JSON parsing fails, return the raw text
+            # Parse and check the shape of the JSON response together
+            extracted_data = None
+            if _looks_like_json(result_text, "{"):
+                try:
+                    extracted_data = DocumentExtraction.model_validate_json(
+                        result_text
+                    ).model_dump()
+                except ValidationError:
+                    pass
+            if extracted_data is None:
+                # Not JSON, or not the requested object: return the raw text
                 extracted_data = {
                     "summary": result_text,
                     "raw_response": result_text,
@@ -133,8 +367,8 @@ Return a JSON object with the following structure:
                 "success": True,
                 "extracted_data": extracted_data,
                 "processing_time": datetime.utcnow().isoformat(),
-                "model_used": self.config.get("model", "gpt-3.5-turbo"),
-                "tokens_used": response.usage.total_tokens if response.usage else 0
+                "model_used": self._model,
+                "tokens_used": tokens_used
             }
             
         except Exception as e:
@@ -145,6 +379,16 @@ Return a JSON object with the following structure:
                 "extracted_data": {}
             }
     
+    @staticmethod
+    def _item_price(item: Dict[str, Any]) -> Optional[float]:
+        """Return an item's price as a float, or None if missing or malformed."""
+        if not item.get('price'):
+            return None
+        try:
+            return float(item['price'])
+        except (ValueError, TypeError):
+            return None
+    
     async def analyze_inventory(self, items: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Analyze inventory data to generate insights and recommendations.
@@ -164,58 +408,37 @@ Return a JSON object with the following structure:
         
         try:
             # Prepare inventory summary for analysis
+            sample = items[:50]  # Limit to first 50 items
             inventory_summary = {
                 "total_items": len(items),
-                "categories": {},
-                "price_ranges": [],
-                "recent_items": []
+                "categories": dict(Counter(
+                    item.get('category', 'uncategorized') for item in sample
+                )),
+                "price_ranges": [
+                    price for price in map(self._item_price, sample) if price is not None
+                ],
+                "recent_items": [
+                    {
+                        "name": item.get('name', 'Unknown'),
+                        "category": item.get('category', 'uncategorized'),
+                        "date": item['date_added']
+                    }
+                    for item in sample if item.get('date_added')
+                ]
             }
             
-            # Analyze items
-            for item in items[:50]:  # Limit to first 50 items
-                category = item.get('category', 'uncategorized')
-                inventory_summary["categories"][category] = inventory_summary["categories"].get(category, 0) + 1
-                
-                if item.get('price'):
-                    try:
-                        price = float(item['price'])
-                        inventory_summary["price_ranges"].append(price)
-                    except (ValueError, TypeError):
-                        pass
-                
-                if item.get('date_added'):
-                    inventory_summary["recent_items"].append({
-                        "name": item.get('name', 'Unknown'),
-                        "category": category,
-                        "date": item.get('date_added')
-                    })
             
-            instruction = """
-Analyze this inventory data and provide actionable insights. Focus on:
-1. Category distribution and trends
-2. Pricing patterns and recommendations
-3. Inventory optimization suggestions
-4. Missing or incomplete data identification
-5. Business insights and opportunities
-
-Return a JSON object with structured analysis.
-"""
-            
-            response = await self.client.chat.completions.create(
-                model=self.config.get("model", "gpt-3.5-turbo"),
-                messages=[
-                    {"role": "system", "content": instruction},
-                    {"role": "user", "content": json.dumps(inventory_summary, default=str)}
+            result_text, _ = await self._complete(
+                [
+                    {"role": "system", "content": INVENTORY_ANALYSIS_PROMPT},
+                    {"role": "user", "content": _dumps(inventory_summary)}
                 ],
                 temperature=0.3,
                 max_tokens=1000
             )
             
-            result_text = response.choices[0].message.content
-            
-            try:
-                insights = json.loads(result_text)
-            except json.JSONDecodeError:
+            insights = _maybe_json(result_text)
+            if insights is None:
                 insights = {"raw_analysis": result_text}
             
             return {
@@ -223,7 +446,7 @@ Return a JSON object with structured analysis.
                 "insights": insights,
                 "analysis_time": datetime.utcnow().isoformat(),
                 "items_analyzed": len(items),
-                "model_used": self.config.get("model", "gpt-3.5-turbo")
+                "model_used": self._model
             }
             
         except Exception as e:
@@ -257,30 +480,23 @@ Return a JSON object with structured analysis.
             }
         
         try:
-            instruction = f"""
-Analyze this {data_type} data and provide meaningful insights, patterns, 
-and actionable recommendations. Be specific and practical.
-
-Additional context: {context or 'None provided'}
-
-Return insights in a structured JSON format.
-"""
+            instruction = INSIGHTS_PROMPT_TEMPLATE.format(
+                data_type=data_type, context=context or 'None provided'
+            )
+            # Dashboard data can be large; encode it off the event loop
+            payload = await asyncio.to_thread(_dumps, data)
             
-            response = await self.client.chat.completions.create(
-                model=self.config.get("model", "gpt-3.5-turbo"),
-                messages=[
+            result_text, _ = await self._complete(
+                [
                     {"role": "system", "content": instruction},
-                    {"role": "user", "content": json.dumps(data, default=str)[:4000]}
+                    {"role": "user", "content": payload[:4000]}
                 ],
                 temperature=0.2,
                 max_tokens=800
             )
             
-            result_text = response.choices[0].message.content
-            
-            try:
-                insights = json.loads(result_text)
-            except json.JSONDecodeError:
+            insights = _maybe_json(result_text)
+            if insights is None:
                 insights = {"analysis": result_text}
             
             return {
@@ -319,47 +535,21 @@ Return insights in a structured JSON format.
             }
         
         try:
-            instruction = """
-From this image description, extract potential inventory item information.
-Focus on identifying products, their attributes, conditions, and any visible text or labels.
-
-Return a JSON object with:
-{
-    "items_identified": [
-        {
-            "name": "item name",
-            "category": "category",
-            "condition": "condition",
-            "estimated_value": "value if determinable",
-            "description": "detailed description",
-            "attributes": ["list", "of", "attributes"]
-        }
-    ],
-    "text_visible": "any visible text or labels",
-    "scene_context": "overall scene description",
-    "inventory_potential": "high/medium/low - likelihood these are inventory items"
-}
-"""
-            
             full_content = f"Image description: {image_description}"
             if context:
                 full_content += f"\nContext: {context}"
             
-            response = await self.client.chat.completions.create(
-                model=self.config.get("model", "gpt-3.5-turbo"),
-                messages=[
-                    {"role": "system", "content": instruction},
+            result_text, _ = await self._complete(
+                [
+                    {"role": "system", "content": IMAGE_DESCRIPTION_PROMPT},
                     {"role": "user", "content": full_content}
                 ],
                 temperature=0.1,
                 max_tokens=1000
             )
             
-            result_text = response.choices[0].message.content
-            
-            try:
-                extracted_info = json.loads(result_text)
-            except json.JSONDecodeError:
+            extracted_info = _maybe_json(result_text)
+            if extracted_info is None:
                 extracted_info = {"raw_description": result_text}
             
             return {
@@ -375,6 +565,3 @@ Return a JSON object with:
                 "error": str(e),
                 "extracted_info": {}
             }
-
-# Global service instance
-openai_service = OpenAIService()
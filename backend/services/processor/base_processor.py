@@ -65,7 +65,7 @@ class BaseProcessor(ABC):
     async def cleanup(self) -> None:
         """Clean up processor resources."""
         if self.temp_dir:
-            cleanup_temp_files  (self.temp_dir)
+            await asyncio.to_thread(cleanup_temp_files, self.temp_dir)
         self.status.end_time = datetime.now()
     
     @abstractmethod
@@ -73,36 +73,53 @@ class BaseProcessor(ABC):
         """Process a single file."""
         pass
     
+    def _record_failure(self, path: Path, error: Exception) -> None:
+        """Record a failed file in the processing status."""
+        self.status.failed_files += 1
+        self.status.errors.append({
+            'file': str(path),
+            'error': str(error),
+            'timestamp': datetime.now().isoformat()
+        })
+        logger.error(f"Failed to process {path}: {error}")
+    
     async def process_batch(self, file_paths: List[Path], batch_size: int = 5) -> ProcessingStatus:
-        """Process a batch of files with concurrency control."""                
+        """Process a batch of files with concurrency control.
+        
+        ``batch_size`` workers drain a shared queue, each taking the next
+        file as soon as it finishes one, so a slow file never holds back
+        the rest of its group.
+        """
         try:
             await self.initialize()
             self.status.total_files = len(file_paths)
             
-            # Process files in batches
-            for i in range(0, len(file_paths), batch_size):
-                batch = file_paths[i:i + batch_size]
-                tasks = [self.process_file(path) for path in batch]
-                
-                # Wait for batch completion
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-                
-                # Update status
-                for path, result in zip(batch, results):
-                    if isinstance(result, Exception):
-                        self.status.failed_files += 1
-                        self.status.errors.append({
-                            'file': str(path),
-                            'error': str(result),
-                            'timestamp': datetime.now().isoformat()
-                        })
-                        logger.error(f"Failed to process {path}: {result}")
-                    elif result:
-                        self.status.processed_files += 1
-                        logger.info(f"Successfully processed {path}")
+            queue: asyncio.Queue = asyncio.Queue()
+            for path in file_paths:
+                queue.put_nowait(path)
+            
+            async def worker() -> None:
+                # Status updates happen between awaits, so workers on the
+                # one event loop never interleave them
+                while True:
+                    try:
+                        path = queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        return
+                    try:
+                        result = await self.process_file(path)
+                    except Exception as e:
+                        self._record_failure(path, e)
                     else:
-                        self.status.failed_files += 1
-                        logger.warning(f"Processing skipped for {path}")
+                        if result:
+                            self.status.processed_files += 1
+                            logger.info(f"Successfully processed {path}")
+                        else:
+                            self.status.failed_files += 1
+                            logger.warning(f"Processing skipped for {path}")
+            
+            workers = max(1, min(batch_size, len(file_paths)))
+            await asyncio.gather(*(worker() for _ in range(workers)))
             
             return self.status
             
@@ -13,6 +13,7 @@ from openai import AsyncOpenAI
 from tenacity import retry, wait_random_exponential, stop_after_attempt
 
 from .base_processor import BaseProcessor
+from backend.config.database import get_metadata_pool, get_vector_pool
 from backend.config.logging import log_config
 from backend.config.storage import get_storage_config
 
@@ -23,6 +24,8 @@ class DocumentProcessor(BaseProcessor):
     """Processor for document files (PDF, DOCX, TXT)."""
     
     SUPPORTED_EXTENSIONS = {'.pdf', '.docx', '.txt'}
+    _CONTROL_CHARS = re.compile(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F-\x9F]')
+    _WHITESPACE = re.compile(r'\s+')
     
     def __init__(self, db_pool: asyncpg.Pool, openai_client: AsyncOpenAI):
         super().__init__()
@@ -228,9 +231,9 @@ class DocumentProcessor(BaseProcessor):
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text content."""
         # Remove control characters
-        text = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F-\x9F]', '', text)
+        text = self._CONTROL_CHARS.sub('', text)
         # Normalize whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = self._WHITESPACE.sub(' ', text)
         # Ensure UTF-8 compatibility
         text = text.encode('utf-8', 'ignore').decode('utf-8')
         return text.strip()
@@ -343,62 +346,60 @@ class DocumentProcessor(BaseProcessor):
             vector_embedding = await self._compute_vector_embedding(full_text)
             
             # 1. Store metadata in the main metadata database
-            from backend.config.database import get_metadata_pool
-            async with (await get_metadata_pool()) as metadata_pool:
-                async with metadata_pool.acquire() as metadata_conn:
-                    document_id = await metadata_conn.fetchval('''
-                        INSERT INTO user_documents
-                        (user_id, title, author, journal_publisher, publication_year, page_length,
-                         thesis, issue, summary, category, field, hashtags, influenced_by,
-                         file_path, file_type)
-                        VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15)
-                        RETURNING id
-                    ''',
-                        1,  # Default user ID for processor (should be passed from actual user context)
-                        doc_info.get('title', ''),
-                        doc_info.get('author', ''),
-                        doc_info.get('journal_publisher', ''),
-                        doc_info.get('publication_year'),
-                        len(full_text.split('\n')),
-                        doc_info.get('thesis', ''),
-                        doc_info.get('issue', ''),
-                        doc_info.get('summary', '')[:400],
-                        doc_info.get('category', ''),
-                        doc_info.get('field', ''),
-                        doc_info.get('hashtags', []),
-                        doc_info.get('influenced_by', []),
-                        str(file_path),
-                        file_path.suffix[1:]
-                    )
-            
+            metadata_pool = await get_metadata_pool()
+            async with metadata_pool.acquire() as metadata_conn:
+                document_id = await metadata_conn.fetchval('''
+                    INSERT INTO user_documents
+                    (user_id, title, author, journal_publisher, publication_year, page_length,
+                     thesis, issue, summary, category, field, hashtags, influenced_by,
+                     file_path, file_type)
+                    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15)
+                    RETURNING id
+                ''',
+                    1,  # Default user ID for processor (should be passed from actual user context)
+                    doc_info.get('title', ''),
+                    doc_info.get('author', ''),
+                    doc_info.get('journal_publisher', ''),
+                    doc_info.get('publication_year'),
+                    len(full_text.split('\n')),
+                    doc_info.get('thesis', ''),
+                    doc_info.get('issue', ''),
+                    doc_info.get('summary', '')[:400],
+                    doc_info.get('category', ''),
+                    doc_info.get('field', ''),
+                    doc_info.get('hashtags', []),
+                    doc_info.get('influenced_by', []),
+                    str(file_path),
+                    file_path.suffix[1:]
+                )
+
             # 2. Store the full text and vector embedding in the vector database
-            from backend.config.database import get_vector_pool
-            async with (await get_vector_pool()) as vector_pool:
-                async with vector_pool.acquire() as vector_conn:
-                    try:
-                        # Try to store in document_vectors table (Neon DB with vector extension)
-                        await vector_conn.execute('''
-                            INSERT INTO document_vectors
-                            (document_id, content_vector, embedding_model)
-                            VALUES ($1, $2, $3)
-                        ''',
-                            document_id,
-                            vector_embedding,
-                            'openai:text-embedding-3-small'
-                        )
-                    except Exception as vector_error:
-                        logger.warning(f"Could not store vector embedding, falling back to text storage: {vector_error}")
-                    
-                    # Store full text for search
+            vector_pool = await get_vector_pool()
+            async with vector_pool.acquire() as vector_conn:
+                try:
+                    # Try to store in document_vectors table (Neon DB with vector extension)
                     await vector_conn.execute('''
-                        INSERT INTO document_content
-                        (document_id, content)
-                        VALUES ($1, $2)
+                        INSERT INTO document_vectors
+                        (document_id, content_vector, embedding_model)
+                        VALUES ($1, $2, $3)
                     ''',
                         document_id,
-                        full_text
+                        vector_embedding,
+                        'openai:text-embedding-3-small'
                     )
-                    
+                except Exception as vector_error:
+                    logger.warning(f"Could not store vector embedding, falling back to text storage: {vector_error}")
+                
+                # Store full text for search
+                await vector_conn.execute('''
+                    INSERT INTO document_content
+                    (document_id, content)
+                    VALUES ($1, $2)
+                ''',
+                    document_id,
+                    full_text
+                )
+                
         except Exception as e:
             logger.error(f"Error storing document data: {e}")
             raise
@@ -416,65 +417,63 @@ class DocumentProcessor(BaseProcessor):
             vector_embedding = await self._compute_vector_embedding(full_text)
             
             # 1. Store metadata in the main metadata database
-            from backend.config.database import get_metadata_pool
-            async with (await get_metadata_pool()) as metadata_pool:
-                async with metadata_pool.acquire() as metadata_conn:
-                    document_id = await metadata_conn.fetchval('''
-                        INSERT INTO user_documents
-                        (user_id, title, author, journal_publisher, publication_year, page_length,
-                         thesis, issue, summary, category, field, hashtags, influenced_by,
-                         file_path, file_type, created_at)
-                        VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16)
-                        RETURNING id
-                    ''',
-                        user_id,
-                        doc_info.get('title', ''),
-                        doc_info.get('author', ''),
-                        doc_info.get('journal_publisher', ''),
-                        doc_info.get('publication_year'),
-                        len(full_text.split('\n')),
-                        doc_info.get('thesis', ''),
-                        doc_info.get('issue', ''),
-                        doc_info.get('summary', '')[:400],
-                        doc_info.get('category', ''),
-                        doc_info.get('field', ''),
-                        doc_info.get('hashtags', []),
-                        doc_info.get('influenced_by', []),
-                        str(file_path),
-                        file_path.suffix[1:],
-                        datetime.now()
-                    )
-            
+            metadata_pool = await get_metadata_pool()
+            async with metadata_pool.acquire() as metadata_conn:
+                document_id = await metadata_conn.fetchval('''
+                    INSERT INTO user_documents
+                    (user_id, title, author, journal_publisher, publication_year, page_length,
+                     thesis, issue, summary, category, field, hashtags, influenced_by,
+                     file_path, file_type, created_at)
+                    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16)
+                    RETURNING id
+                ''',
+                    user_id,
+                    doc_info.get('title', ''),
+                    doc_info.get('author', ''),
+                    doc_info.get('journal_publisher', ''),
+                    doc_info.get('publication_year'),
+                    len(full_text.split('\n')),
+                    doc_info.get('thesis', ''),
+                    doc_info.get('issue', ''),
+                    doc_info.get('summary', '')[:400],
+                    doc_info.get('category', ''),
+                    doc_info.get('field', ''),
+                    doc_info.get('hashtags', []),
+                    doc_info.get('influenced_by', []),
+                    str(file_path),
+                    file_path.suffix[1:],
+                    datetime.now()
+                )
+
             # 2. Store the full text and vector embedding in the vector database
-            from backend.config.database import get_vector_pool
-            async with (await get_vector_pool()) as vector_pool:
-                async with vector_pool.acquire() as vector_conn:
-                    try:
-                        # Try to store in document_vectors table (Neon DB with vector extension)
-                        await vector_conn.execute('''
-                            INSERT INTO document_vectors
-                            (document_id, content_vector, embedding_model, created_at)
-                            VALUES ($1, $2, $3, $4)
-                        ''',
-                            document_id,
-                            vector_embedding,
-                            'openai:text-embedding-3-small',
-                            datetime.now()
-                        )
-                    except Exception as vector_error:
-                        logger.warning(f"Could not store vector embedding, falling back to text storage: {vector_error}")
-                    
-                    # Store full text for search
+            vector_pool = await get_vector_pool()
+            async with vector_pool.acquire() as vector_conn:
+                try:
+                    # Try to store in document_vectors table (Neon DB with vector extension)
                     await vector_conn.execute('''
-                        INSERT INTO document_content
-                        (document_id, content, created_at)
-                        VALUES ($1, $2, $3)
+                        INSERT INTO document_vectors
+                        (document_id, content_vector, embedding_model, created_at)
+                        VALUES ($1, $2, $3, $4)
                     ''',
                         document_id,
-                        full_text,
+                        vector_embedding,
+                        'openai:text-embedding-3-small',
                         datetime.now()
                     )
-            
+                except Exception as vector_error:
+                    logger.warning(f"Could not store vector embedding, falling back to text storage: {vector_error}")
+                
+                # Store full text for search
+                await vector_conn.execute('''
+                    INSERT INTO document_content
+                    (document_id, content, created_at)
+                    VALUES ($1, $2, $3)
+                ''',
+                    document_id,
+                    full_text,
+                    datetime.now()
+                )
+
             return document_id
                     
         except Exception as e:
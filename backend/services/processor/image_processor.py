@@ -1,10 +1,11 @@
 """Image processor for handling image files."""
+import asyncio
 import base64
 import logging
-import json # Add this import
+import json
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import asyncpg
 from PIL import Image
 import io
@@ -12,7 +13,7 @@ import io
 from openai import AsyncOpenAI
 from tenacity import retry, wait_random_exponential, stop_after_attempt
 
-from .base_processor import BaseProcessor
+from .base_processor import BaseProcessor, ProcessingStatus
 from backend.config.logging import log_config
 from backend.config.storage import get_storage_config
 
@@ -20,11 +21,50 @@ from backend.config.storage import get_storage_config
 logger = log_config.get_logger(__name__)
 storage = get_storage_config()
 
+# Concurrent OpenAI image analyses per batch, kept under typical rate limits
+ANALYSIS_CONCURRENCY = 8
+
+# Field spec sent with every product image; built once at import
+PRODUCT_ANALYSIS_PROMPT = (
+    "Given an image of a product we sell, analyze the item and generate a JSON output with the following fields: "
+    "- \"name\": A descriptive name. "
+    "- \"description\": A concise and detailed product description in bullet point formatted as a markdown list. "
+    "- \"category\": One of [\"Beads\", \"Stools\", \"Bowls\", \"Fans\", \"Totebags\", \"Home Decor\"] most applicable to the product, or else \"Other\". "
+    "- \"material\": Primary materials. "
+    "- \"color\": Main colors. "
+    "- \"dimensions\": Approximate dimensions. "
+    "- \"origin_source\": Likely origin based on style. "
+    "- \"import_cost\": Best estimated import price in USD or 'null'. "
+    "- \"retail_price\": Best estimated retail price in USD or 'null'. "
+    "- \"key_tags\": Important keywords/phrases for product discovery."
+)
+
+# Batches larger than this are written with COPY instead of executemany
+COPY_THRESHOLD = 100
+
+# Errors caused by the row data itself: server-side rejections, plus
+# asyncpg's client-side encoding errors, which subclass ValueError
+ROW_ERRORS = (asyncpg.PostgresError, ValueError)
+
+PRODUCT_COLUMNS = (
+    'name', 'description', 'image_url', 'category', 'material', 'color',
+    'dimensions', 'origin_source', 'import_cost', 'retail_price', 'key_tags',
+)
+INSERT_PRODUCT_SQL = '''
+    INSERT INTO products
+    (name, description, image_url, category, material, color, dimensions,
+     origin_source, import_cost, retail_price, key_tags)
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
+'''
+
 class ImageProcessor(BaseProcessor):
     """Processor for image files (PNG, JPG, JPEG, GIF, WEBP)."""
     
     SUPPORTED_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.gif', '.webp', '.heic'}
     MAX_SIZE = (512, 512)  # Maximum dimensions for processed images
+    JPEG_QUALITY = 75
+    # A single low-detail tile is enough to catalog a product photo
+    ANALYSIS_DETAIL = "low"
     
     def __init__(self, db_pool: asyncpg.Pool, openai_client: AsyncOpenAI, instruction: str = None):
         super().__init__()
@@ -39,9 +79,70 @@ class ImageProcessor(BaseProcessor):
     
     async def process_file(self, file_path: Path) -> bool:
         """Process a single image file."""
+        row = await self._analyze_file(file_path)
+        if row is None:
+            return False
+        
+        # Store in database
+        async with self.db_pool.acquire() as conn:
+            await self._store_products(conn, [row])
+        
+        return True
+    
+    async def process_batch(self, file_paths: List[Path],
+                            batch_size: int = ANALYSIS_CONCURRENCY) -> ProcessingStatus:
+        """Analyze all images concurrently, then store the results in one insert.
+        
+        ``batch_size`` bounds how many OpenAI requests are in flight at once.
+        """
+        try:
+            await self.initialize()
+            self.status.total_files = len(file_paths)
+            semaphore = asyncio.Semaphore(batch_size)
+            
+            async def analyze(path: Path) -> Optional[tuple]:
+                async with semaphore:
+                    return await self._analyze_file(path)
+            
+            results = await asyncio.gather(
+                *(analyze(path) for path in file_paths), return_exceptions=True
+            )
+            
+            rows = []
+            for path, result in zip(file_paths, results):
+                if isinstance(result, Exception):
+                    self._record_failure(path, result)
+                elif result is None:
+                    self.status.failed_files += 1
+                    logger.warning(f"Processing skipped for {path}")
+                else:
+                    rows.append((path, result))
+            
+            if rows:
+                try:
+                    async with self.db_pool.acquire() as conn:
+                        stored = await self._store_batch(conn, rows)
+                    self.status.processed_files += stored
+                    logger.info(f"Stored {stored} analyzed images")
+                except Exception as e:
+                    # No connection: nothing in the batch was written
+                    for path, _ in rows:
+                        self._record_failure(path, e)
+            
+            return self.status
+            
+        except Exception as e:
+            logger.error(f"Batch processing error: {e}")
+            raise
+        
+        finally:
+            await self.cleanup()
+    
+    async def _analyze_file(self, file_path: Path) -> Optional[tuple]:
+        """Prepare and analyze one image, returning its products row or None."""
         if not self.is_supported_file(file_path):
             logger.warning(f"Unsupported file type: {file_path}")
-            return False
+            return None
         
         try:
             # Process and optimize image
@@ -55,19 +156,15 @@ class ImageProcessor(BaseProcessor):
                 exists = await self._check_image_exists(conn, processed_path)
                 if exists:
                     logger.info(f"Image already exists: {file_path}")
-                    return False
+                    return None
             
             # Analyze image with GPT-4
             product_info = await self._analyze_image(base64_image)
             if not product_info:
                 logger.error(f"Failed to analyze image: {file_path}")
-                return False
-            
-            # Store in database
-            async with self.db_pool.acquire() as conn:
-                await self._store_product_info(conn, product_info, processed_path)
+                return None
             
-            return True
+            return self._product_row(product_info, processed_path)
             
         except Exception as e:
             logger.error(f"Error processing image {file_path}: {e}")
@@ -76,38 +173,44 @@ class ImageProcessor(BaseProcessor):
     async def _process_image(self, source_path: Path) -> Path:
         """Process and optimize image for storage."""
         try:
-            with Image.open(source_path) as img:
-                # Convert RGBA to RGB if needed
-                if img.mode == 'RGBA':
-                    img = img.convert('RGB')
-                
-                # Resize image maintaining aspect ratio
-                img.thumbnail(self.MAX_SIZE, Image.Resampling.LANCZOS)
-                
-                # Generate new filename with timestamp
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                new_filename = f"{timestamp}_{source_path.stem}.jpg"
-                
-                # Get the base directory path for inventory images
-                inventory_dir = get_storage_config().paths['INVENTORY_IMAGES_DIR']
-                # Combine the directory path with the new filename
-                dest_path = inventory_dir / new_filename
-                
-                # Save the processed image
-                # Save the processed image
-                img.save(dest_path, "JPEG", quality=85, optimize=True)
-                
-                return dest_path
+            # Generate new filename with timestamp
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            new_filename = f"{timestamp}_{source_path.stem}.jpg"
+            
+            # Get the base directory path for inventory images
+            inventory_dir = get_storage_config().paths['INVENTORY_IMAGES_DIR']
+            # Combine the directory path with the new filename
+            dest_path = inventory_dir / new_filename
+            
+            # Decode, resize and encode off the event loop
+            await asyncio.to_thread(self._resize_and_save, source_path, dest_path)
+            
+            return dest_path
                 
         except Exception as e:
             logger.error(f"Error processing image: {e}")
             raise
     
+    @classmethod
+    def _resize_and_save(cls, source_path: Path, dest_path: Path) -> None:
+        """Resize an image to MAX_SIZE and save it as JPEG (blocking)."""
+        with Image.open(source_path) as img:
+            # Convert RGBA to RGB if needed
+            if img.mode == 'RGBA':
+                img = img.convert('RGB')
+            
+            # Resize image maintaining aspect ratio
+            img.thumbnail(cls.MAX_SIZE, Image.Resampling.LANCZOS)
+            
+            # Save the processed image
+            img.save(dest_path, "JPEG", quality=cls.JPEG_QUALITY,
+                     optimize=True, progressive=True)
+    
     async def _image_to_base64(self, image_path: Path) -> str:
         """Convert image to base64 string."""
         try:
-            with open(image_path, "rb") as image_file:
-                return base64.b64encode(image_file.read()).decode("utf-8")
+            image_bytes = await asyncio.to_thread(image_path.read_bytes)
+            return base64.b64encode(image_bytes).decode("utf-8")
         except Exception as e:
             logger.error(f"Error converting image to base64: {e}")
             raise
@@ -140,25 +243,13 @@ class ImageProcessor(BaseProcessor):
                         "content": [
                             {
                                 "type": "text",
-                                "text": (
-                                    "Given an image of a product we sell, analyze the item and generate a JSON output with the following fields: "
-                                    "- \"name\": A descriptive name. "
-                                    "- \"description\": A concise and detailed product description in bullet point formatted as a markdown list. "
-                                    "- \"category\": One of [\"Beads\", \"Stools\", \"Bowls\", \"Fans\", \"Totebags\", \"Home Decor\"] most applicable to the product, or else \"Other\". "
-                                    "- \"material\": Primary materials. "
-                                    "- \"color\": Main colors. "
-                                    "- \"dimensions\": Approximate dimensions. "
-                                    "- \"origin_source\": Likely origin based on style. "
-                                    "- \"import_cost\": Best estimated import price in USD or 'null'. "
-                                    "- \"retail_price\": Best estimated retail price in USD or 'null'. "
-                                    "- \"key_tags\": Important keywords/phrases for product discovery."
-                                )
+                                "text": PRODUCT_ANALYSIS_PROMPT
                             },
                             {
                                 "type": "image_url",
                                 "image_url": {
                                     "url": f"data:image/jpeg;base64,{base64_image}",
-                                    "detail": "high"
+                                    "detail": self.ANALYSIS_DETAIL
                                 }
                             }
                         ]
@@ -191,43 +282,73 @@ class ImageProcessor(BaseProcessor):
             logger.error(f"Error analyzing image: {e}")
             return None
 
-    async def _store_product_info(self, conn: asyncpg.Connection,
-                                product_info: Dict[str, Any],
-                                image_path: Path) -> None:
-        """Store product information in database."""
+    @staticmethod
+    def _product_row(product_info: Dict[str, Any], image_path: Path) -> tuple:
+        """Convert an analysis result into a products row."""
+        # Convert price strings to float or None
+        import_cost = float(product_info['import_cost']) if product_info.get('import_cost') not in (None, 'null') else None
+        retail_price = float(product_info['retail_price']) if product_info.get('retail_price') not in (None, 'null') else None
+        
+        # Handle description formatting
+        description = product_info['description']
+        if isinstance(description, list):
+            description = '. '.join(description)
+        
+        # Handle key tags formatting
+        key_tags = product_info['key_tags']
+        if isinstance(key_tags, list):
+            key_tags = ', '.join(key_tags)
+        
+        return (
+            product_info['name'],
+            description,
+            str(image_path),
+            product_info['category'],
+            product_info['material'],
+            product_info['color'],
+            product_info['dimensions'],
+            product_info['origin_source'],
+            import_cost,
+            retail_price,
+            key_tags
+        )
+
+    async def _store_batch(self, conn: asyncpg.Connection,
+                           rows: List[Tuple[Path, tuple]]) -> int:
+        """Store analyzed rows, returning how many were written.
+
+        The whole batch goes in one statement when it can. If that fails,
+        each row is retried on its own so one bad row costs only its own
+        (already paid for) analysis; rows that still fail are recorded.
+        """
         try:
-            # Convert price strings to float or None
-            import_cost = float(product_info['import_cost']) if product_info.get('import_cost') not in (None, 'null') else None
-            retail_price = float(product_info['retail_price']) if product_info.get('retail_price') not in (None, 'null') else None
-            
-            # Handle description formatting
-            description = product_info['description']
-            if isinstance(description, list):
-                description = '. '.join(description)
-            
-            # Handle key tags formatting
-            key_tags = product_info['key_tags']
-            if isinstance(key_tags, list):
-                key_tags = ', '.join(key_tags)
-            
-            await conn.execute('''
-                INSERT INTO products
-                (name, description, image_url, category, material, color, dimensions,
-                 origin_source, import_cost, retail_price, key_tags)
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
-            ''',
-                product_info['name'],
-                description,
-                str(image_path),
-                product_info['category'],
-                product_info['material'],
-                product_info['color'],
-                product_info['dimensions'],
-                product_info['origin_source'],
-                import_cost,
-                retail_price,
-                key_tags
-            )
+            await self._store_products(conn, [row for _, row in rows])
+            return len(rows)
+        except ROW_ERRORS as e:
+            if len(rows) == 1:
+                self._record_failure(rows[0][0], e)
+                return 0
+            logger.warning(f"Batch insert failed, storing rows one at a time: {e}")
+        
+        stored = 0
+        for path, row in rows:
+            try:
+                await conn.execute(INSERT_PRODUCT_SQL, *row)
+                stored += 1
+            except ROW_ERRORS as e:
+                self._record_failure(path, e)
+        return stored
+
+    async def _store_products(self, conn: asyncpg.Connection, rows: List[tuple]) -> None:
+        """Store product rows in database in a single all-or-nothing batch."""
+        try:
+            async with conn.transaction():
+                if len(rows) > COPY_THRESHOLD:
+                    await conn.copy_records_to_table(
+                        'products', records=rows, columns=PRODUCT_COLUMNS
+                    )
+                else:
+                    await conn.executemany(INSERT_PRODUCT_SQL, rows)
         except Exception as e:
             logger.error(f"Error storing product info: {e}")
             raise
@@ -1,13 +1,17 @@
 """Unified storage manager for handling file operations across different providers."""
 
+import asyncio
 import io
 import logging
 import os
+import time
 from pathlib import Path
 from typing import BinaryIO, Optional, Tuple, Union
 
 from PIL import Image
 
+from backend.services import get_openai_client
+
 # Import with fallbacks to handle different execution contexts
 try:
     # Try relative imports first
@@ -91,6 +95,25 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Mount state of the temp directory rarely changes; re-check it every minute
+LOCAL_CHECK_INTERVAL = 60.0
+
+
+def render_thumbnail(image_data: bytes, size: Tuple[int, int]) -> bytes:
+    """Resize image bytes to fit ``size`` and encode as JPEG (blocking)."""
+    with Image.open(io.BytesIO(image_data)) as img:
+        # Convert RGBA to RGB if needed
+        if img.mode == "RGBA":
+            img = img.convert("RGB")
+
+        # Generate thumbnail
+        img.thumbnail(size, Image.Resampling.LANCZOS)
+
+        # Save thumbnail to bytes
+        output = io.BytesIO()
+        img.save(output, format="JPEG", quality=85, optimize=True)
+        return output.getvalue()
+
 
 class StorageManager:
     """
@@ -103,11 +126,32 @@ class StorageManager:
         self.s3 = s3_service
         self.vercel = vercel_blob_service
         self.max_thumbnail_size = (300, 300)  # Maximum thumbnail dimensions
+        # (checked_at, accessible) for the local temp directory health check
+        self._local_check = (None, False)
 
         # Determine storage type from environment variable, default to Vercel
         # The storage_type is determined once in __init__:
         self.storage_type = os.getenv("STORAGE_TYPE", "vercel").lower()
 
+    async def close(self) -> None:
+        """Release HTTP connections held by storage providers."""
+        if hasattr(self.vercel, "close"):
+            await self.vercel.close()
+
+    async def cleanup_temp_files(self, user_id: Optional[int] = None) -> None:
+        """Remove temporary files for a user, or all users, off the event loop."""
+        await asyncio.to_thread(self.config.cleanup_temp_files, user_id)
+
+    def _local_storage_accessible(self) -> bool:
+        """Whether the temp directory is writable, re-checked at most once a minute."""
+        checked_at, accessible = self._local_check
+        now = time.monotonic()
+        if checked_at is None or now - checked_at > LOCAL_CHECK_INTERVAL:
+            temp_dir = self.config.get_temp_dir()
+            accessible = temp_dir.exists() and os.access(temp_dir, os.W_OK)
+            self._local_check = (now, accessible)
+        return accessible
+
     async def check_storage_health(self) -> dict:
         """
         Check the health of all storage providers.
@@ -168,8 +212,7 @@ class StorageManager:
 
         # Check local storage
         try:
-            temp_dir = self.config.get_temp_dir()
-            if temp_dir.exists() and os.access(temp_dir, os.W_OK):
+            if self._local_storage_accessible():
                 health["providers"]["local"] = {"status": "healthy"}
             else:
                 health["providers"]["local"] = {
@@ -274,31 +317,31 @@ class StorageManager:
 
                             if embedding:
                                 # Store content and embedding in vector database
-                                async with await get_vector_pool() as pool:
-                                    async with pool.acquire() as conn:
-                                        # Store text content
-                                        await conn.execute(
-                                            """
-                                            INSERT INTO document_content (document_id, content)
-                                            VALUES ($1, $2)
-                                            """,
-                                            document_url,
-                                            text_content,
-                                        )
-
-                                        # Store vector embedding
-                                        await conn.execute(
-                                            """
-                                            INSERT INTO document_vectors (
-                                                document_id,
-                                                content_vector,
-                                                embedding_model
-                                            ) VALUES ($1, $2, $3)
-                                            """,
-                                            document_url,
-                                            embedding,
-                                            "text-embedding-ada-002",
-                                        )
+                                pool = await get_vector_pool()
+                                async with pool.acquire() as conn:
+                                    # Store text content
+                                    await conn.execute(
+                                        """
+                                        INSERT INTO document_content (document_id, content)
+                                        VALUES ($1, $2)
+                                        """,
+                                        document_url,
+                                        text_content,
+                                    )
+
+                                    # Store vector embedding
+                                    await conn.execute(
+                                        """
+                                        INSERT INTO document_vectors (
+                                            document_id,
+                                            content_vector,
+                                            embedding_model
+                                        ) VALUES ($1, $2, $3)
+                                        """,
+                                        document_url,
+                                        embedding,
+                                        "text-embedding-ada-002",
+                                    )
                     except Exception as e:
                         logger.error(f"Error storing document content: {e}")
                         # Continue even if vector storage fails
@@ -346,11 +389,12 @@ class StorageManager:
                 return await self.s3.get_document(file_url)
             elif file_url.startswith("https://"):
                 return await self.vercel.get_document(file_url)
-            elif os.path.exists(file_url):
-                return Path(file_url).read_bytes()
-            else:
-                logger.error(f"Unknown storage location: {file_url}")
-                return None
+            # Local path: read off the event loop and let a missing file surface
+            # as FileNotFoundError instead of paying for a separate stat call
+            return await asyncio.to_thread(Path(file_url).read_bytes)
+        except FileNotFoundError:
+            logger.error(f"Unknown storage location: {file_url}")
+            return None
         except Exception as e:
             logger.error(f"Error retrieving file {file_url}: {e}")
             return None
@@ -370,9 +414,9 @@ class StorageManager:
                 return await self.s3.delete_document(file_url)
             elif file_url.startswith("https://"):
                 return await self.vercel.delete_document(file_url)
-            elif os.path.exists(file_url):
-                Path(file_url).unlink()
-                return True
+            await asyncio.to_thread(Path(file_url).unlink)
+            return True
+        except FileNotFoundError:
             return False
         except Exception as e:
             logger.error(f"Error deleting file {file_url}: {e}")
@@ -433,19 +477,10 @@ class StorageManager:
             Thumbnail image bytes if successful, None otherwise
         """
         try:
-            # Open image from bytes
-            with Image.open(io.BytesIO(image_data)) as img:
-                # Convert RGBA to RGB if needed
-                if img.mode == "RGBA":
-                    img = img.convert("RGB")
-
-                # Generate thumbnail
-                img.thumbnail(self.max_thumbnail_size, Image.Resampling.LANCZOS)
-
-                # Save thumbnail to bytes
-                output = io.BytesIO()
-                img.save(output, format="JPEG", quality=85, optimize=True)
-                return output.getvalue()
+            # PIL decode/resize/encode is CPU-bound; keep it off the event loop
+            return await asyncio.to_thread(
+                render_thumbnail, image_data, self.max_thumbnail_size
+            )
 
         except Exception as e:
             logger.error(f"Error generating thumbnail for {filename}: {e}")
@@ -480,8 +515,6 @@ class StorageManager:
                 )
 
             # Update database with URLs
-            from backend.config.database import get_metadata_pool
-
             async with (await get_metadata_pool()).acquire() as conn:
                 await conn.execute(
                     """
@@ -556,10 +589,8 @@ class StorageManager:
             Vector embedding if successful, None otherwise
         """
         try:
-            from openai import AsyncOpenAI
-
-            client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-            response = await client.embeddings.create(
+            # Shared process-wide client, created on first use
+            response = await get_openai_client().embeddings.create(
                 model="text-embedding-ada-002",
                 input=text[:8000],  # Limit text length for API
             )
@@ -596,8 +627,6 @@ class StorageManager:
                 return results
 
             # Fallback to database search
-            from backend.config.database import get_metadata_pool
-
             async with (await get_metadata_pool()).acquire() as conn:
                 documents = await conn.fetch(
                     """
@@ -618,35 +647,6 @@ class StorageManager:
             logger.error(f"Error searching documents: {e}")
             return []
 
-    def _extract_relevant_excerpt(
-        self, content: str, query: str, context_chars: int = 150
-    ) -> str:
-        """Extract relevant excerpt from content based on query."""
-        try:
-            # Find query in content (case insensitive)
-            query_pos = content.lower().find(query.lower())
-
-            if query_pos == -1:
-                # If exact query not found, return start of content
-                return content[:300] + "..."
-
-            # Get surrounding context
-            start = max(0, query_pos - context_chars)
-            end = min(len(content), query_pos + len(query) + context_chars)
-            excerpt = content[start:end]
-
-            # Add ellipsis if excerpt is truncated
-            if start > 0:
-                excerpt = "..." + excerpt
-            if end < len(content):
-                excerpt = excerpt + "..."
-
-            return excerpt
-
-        except Exception as e:
-            logger.error(f"Error extracting excerpt: {e}")
-            return ""
-
 
 # Global instance
 storage_manager = StorageManager()
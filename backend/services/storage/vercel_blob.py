@@ -5,6 +5,10 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Largest blob we will pull into memory (matches the 25MB upload limit)
+MAX_DOWNLOAD_BYTES = 25 * 1024 * 1024
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
 class Blob:
     """
     Represents a document or object stored in Vercel Blob Storage.
@@ -24,6 +28,30 @@ class VercelBlobService:
             logger.warning("BLOB_READ_WRITE_TOKEN environment variable is missing")
         # The upload endpoint per Vercel Blob API documentation.
         self.upload_endpoint = "https://api.vercel.com/v9/blob/upload"
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use.
+
+        Reusing one session keeps DNS results and TLS connections alive
+        across uploads and downloads instead of reconnecting per call.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=50,
+                    limit_per_host=20,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60,
+                )
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the shared HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
 
     async def upload_document(self, file_data: bytes, filename: str, content_type: str) -> Optional[str]:
         """
@@ -50,27 +78,27 @@ class VercelBlobService:
             "contentType": content_type
         }
         try:
+            session = self._get_session()
+
             # Step 1: Request an upload URL from Vercel
-            async with aiohttp.ClientSession() as session:
-                async with session.post(self.upload_endpoint, headers=headers, json=payload) as resp:
-                    if resp.status != 200:
-                        text = await resp.text()
-                        logger.error(f"Failed to get upload URL: {resp.status} {text}")
-                        return None
-                    data = await resp.json()
-                    put_url = data.get("url")
-                    blob_url = data.get("blob", {}).get("url")
-                    if not put_url:
-                        logger.error("Upload URL not provided in response")
-                        return None
+            async with session.post(self.upload_endpoint, headers=headers, json=payload) as resp:
+                if resp.status != 200:
+                    text = await resp.text()
+                    logger.error(f"Failed to get upload URL: {resp.status} {text}")
+                    return None
+                data = await resp.json()
+                put_url = data.get("url")
+                blob_url = data.get("blob", {}).get("url")
+                if not put_url:
+                    logger.error("Upload URL not provided in response")
+                    return None
             
             # Step 2: Upload the file data using the provided PUT URL
-            async with aiohttp.ClientSession() as session:
-                async with session.put(put_url, data=file_data, headers={"Content-Type": content_type}) as put_resp:
-                    if put_resp.status not in [200, 201]:
-                        text = await put_resp.text()
-                        logger.error(f"Failed to upload file: {put_resp.status} {text}")
-                        return None
+            async with session.put(put_url, data=file_data, headers={"Content-Type": content_type}) as put_resp:
+                if put_resp.status not in [200, 201]:
+                    text = await put_resp.text()
+                    logger.error(f"Failed to upload file: {put_resp.status} {text}")
+                    return None
             
             # Return URL for accessing the file
             return blob_url or put_url
@@ -87,14 +115,25 @@ class VercelBlobService:
             document_url: The URL of the stored document.
         
         Returns:
-            The document's binary data, or None if retrieval fails.
+            The document's binary data, or None if retrieval fails or the
+            document is larger than MAX_DOWNLOAD_BYTES.
         """
-        async with aiohttp.ClientSession() as session:
-            async with session.get(document_url) as resp:
-                if resp.status != 200:
-                    logger.error(f"Failed to retrieve document: {resp.status}")
+        async with self._get_session().get(document_url) as resp:
+            if resp.status != 200:
+                logger.error(f"Failed to retrieve document: {resp.status}")
+                return None
+            if resp.content_length and resp.content_length > MAX_DOWNLOAD_BYTES:
+                logger.error(f"Document too large to retrieve: {resp.content_length} bytes")
+                return None
+
+            # Stream with a running cap so an unbounded body cannot exhaust memory
+            buffer = bytearray()
+            async for chunk in resp.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                buffer.extend(chunk)
+                if len(buffer) > MAX_DOWNLOAD_BYTES:
+                    logger.error(f"Document exceeded {MAX_DOWNLOAD_BYTES} bytes while downloading")
                     return None
-                return await resp.read()
+            return bytes(buffer)
 
     async def delete_document(self) -> bool:
         """
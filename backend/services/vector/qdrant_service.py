@@ -1,5 +1,6 @@
 """Qdrant vector database service for document embeddings and similarity search."""
 
+import functools
 import os
 import logging
 from typing import List, Optional, Dict, Any
@@ -41,10 +42,13 @@ class QdrantService:
         
         logger.info("Qdrant client initialized with URL: %s...", self.url[:50])
         
-    async def _run_in_executor(self, func, *args):
+    async def _run_in_executor(self, func, *args, **kwargs):
         """Run synchronous Qdrant operations in thread pool."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(self.executor, func, *args)
+        loop = asyncio.get_running_loop()
+        # run_in_executor only forwards positional arguments
+        return await loop.run_in_executor(
+            self.executor, functools.partial(func, *args, **kwargs)
+        )
     
     async def initialize_collection(self) -> bool:
         """Initialize the document vectors collection if it doesn't exist."""
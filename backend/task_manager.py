@@ -2,6 +2,8 @@
 
 import asyncio
 import logging
+import time
+from collections import OrderedDict
 from typing import Dict, Any, Optional
 
 # Configure logging
@@ -10,18 +12,25 @@ logger = logging.getLogger(__name__)
 class TaskManager:
     """Manages background tasks with TTL."""
     
-    def __init__(self, ttl_seconds: int = 86400):
+    def __init__(self, ttl_seconds: int = 86400, max_tasks: int = 1000):
         """Initialize task manager with TTL in seconds (default: 24 hours)."""
-        self.tasks: Dict[str, Dict[str, Any]] = {}
+        # Kept in insertion order, so the first entry is always the oldest
+        self.tasks: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
         self.ttl_seconds = ttl_seconds
+        self.max_tasks = max_tasks
 
     def add_task(self, task_id: str) -> None:
-        """Add a new task with queued status."""
+        """Add a new task with queued status, evicting the oldest when full."""
+        self.tasks.pop(task_id, None)
+        if len(self.tasks) >= self.max_tasks:
+            self.tasks.popitem(last=False)
+        created_at = time.monotonic()
         self.tasks[task_id] = {
             'status': 'queued',
             'progress': 0,
             'message': 'Task queued',
-            'created_at': asyncio.get_running_loop().time()
+            'created_at': created_at,
+            'expires_at': created_at + self.ttl_seconds
         }
 
     def update_task(self, task_id: str, **kwargs) -> None:
@@ -32,22 +41,22 @@ class TaskManager:
     def get_task(self, task_id: str) -> Optional[Dict[str, Any]]:
         """Get task status, removing expired tasks."""
         task = self.tasks.get(task_id)
-        if task and asyncio.get_running_loop().time() - task['created_at'] <= self.ttl_seconds:
+        if task is None:
+            return None
+        if time.monotonic() <= task['expires_at']:
             return task
-        self.tasks.pop(task_id, None)
+        del self.tasks[task_id]
         return None
 
     def cleanup(self) -> None:
         """Remove expired tasks."""
-        try:
-            current_time = asyncio.get_running_loop().time()
-            expired_tasks = [task_id for task_id, task in self.tasks.items()
-                 if current_time - task['created_at'] > self.ttl_seconds]
-            for task_id in expired_tasks:
-                del self.tasks[task_id]
-        except RuntimeError:
-            # Handle case where there's no running event loop
-            pass
+        current_time = time.monotonic()
+        # Oldest tasks come first, so stop at the first one still live
+        while self.tasks:
+            task_id, task = next(iter(self.tasks.items()))
+            if current_time <= task['expires_at']:
+                break
+            del self.tasks[task_id]
 
 # Global instance
 task_manager = TaskManager()
@@ -186,7 +186,7 @@ class TestCrossServiceIntegration:
         
         # Verify URLs match
         assert backend_url == 'https://bartleby-backend.onrender.com'
-        assert frontend_url == 'https://ibartleby.vercel.app
+        assert frontend_url == 'https://ibartleby.vercel.app'
 
     def test_cors_configuration_match(self):
         # Load both configs
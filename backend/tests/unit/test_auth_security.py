@@ -0,0 +1,46 @@
+import pytest
+from quart import Quart
+
+from backend.middleware.auth_security import setup_auth_security
+
+pytestmark = pytest.mark.asyncio
+
+
+class TestAuthSecurityCors:
+    async def test_allowed_origin_headers(self):
+        app = Quart(__name__)
+        setup_auth_security(app)
+
+        @app.route('/test')
+        async def test_route():
+            return {'message': 'test'}
+
+        async with app.test_client() as client:
+            allowed = await client.get('/test', headers={'Origin': 'https://hocomnia.com'})
+            preview = await client.get('/test', headers={'Origin': 'https://app.hocomnia.com'})
+            denied = await client.get('/test', headers={'Origin': 'https://malicious-site.com'})
+
+            assert allowed.headers.get('Access-Control-Allow-Origin') == 'https://hocomnia.com'
+            assert allowed.headers.get('Vary') == 'Origin'
+            assert allowed.headers.get('Access-Control-Allow-Methods')
+            assert allowed.headers.get('Access-Control-Allow-Credentials') == 'true'
+            assert preview.headers.get('Access-Control-Allow-Origin') == 'https://app.hocomnia.com'
+            assert 'Access-Control-Allow-Origin' not in denied.headers
+
+    async def test_preflight_short_circuit(self):
+        app = Quart(__name__)
+        setup_auth_security(app)
+
+        async with app.test_client() as client:
+            response = await client.options(
+                '/test',
+                headers={
+                    'Origin': 'https://hocomnia.com',
+                    'Access-Control-Request-Method': 'POST',
+                }
+            )
+
+            assert response.status_code == 204
+            assert response.headers.get('Access-Control-Allow-Origin') == 'https://hocomnia.com'
+            assert response.headers.get('Access-Control-Max-Age') == '86400'
+            assert 'Content-Security-Policy' not in response.headers
@@ -0,0 +1,20 @@
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from backend.utils import clock
+from backend.utils.clock import iso_now
+
+class TestIsoNow:
+    def test_formats_utc_second(self):
+        with patch.object(clock.time, 'time', return_value=1700000000.75):
+            assert iso_now() == '2023-11-14T22:13:20+00:00'
+
+    def test_reuses_string_within_a_second(self):
+        with patch.object(clock.time, 'time', return_value=1700000001.1):
+            first = iso_now()
+        with patch.object(clock.time, 'time', return_value=1700000001.9):
+            assert iso_now() is first
+
+    def test_parses_as_aware_datetime(self):
+        parsed = datetime.fromisoformat(iso_now())
+        assert parsed.tzinfo == timezone.utc
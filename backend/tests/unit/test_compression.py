@@ -0,0 +1,38 @@
+import gzip
+
+import pytest
+from quart import Quart
+
+from backend.middleware.compression import setup_compression
+
+pytestmark = pytest.mark.asyncio
+
+
+class TestCompressionMiddleware:
+    async def test_large_json_is_gzipped(self):
+        app = Quart(__name__)
+        setup_compression(app)
+
+        @app.route('/test')
+        async def test_route():
+            return {'items': ['x' * 50] * 100}
+
+        async with app.test_client() as client:
+            response = await client.get('/test', headers={'Accept-Encoding': 'gzip'})
+
+            assert response.headers.get('Content-Encoding') == 'gzip'
+            assert 'Accept-Encoding' in response.headers.get('Vary', '')
+            body = gzip.decompress(await response.get_data())
+            assert b'"items"' in body
+
+    async def test_small_json_not_gzipped(self):
+        app = Quart(__name__)
+        setup_compression(app)
+
+        @app.route('/test')
+        async def test_route():
+            return {'message': 'test'}
+
+        async with app.test_client() as client:
+            response = await client.get('/test', headers={'Accept-Encoding': 'gzip'})
+            assert 'Content-Encoding' not in response.headers
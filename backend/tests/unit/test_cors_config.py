@@ -0,0 +1,22 @@
+from backend.config.security import CORSConfig
+
+
+class TestCorsOriginValidation:
+    def test_valid_origins(self):
+        assert CORSConfig.is_valid_origin('https://hocomnia.com')
+        assert CORSConfig.is_valid_origin('http://localhost:3000')
+
+    def test_fused_origins_rejected(self, monkeypatch):
+        fused = 'https://hocomnia.comhttps://instantory.onrender.com'
+        assert not CORSConfig.is_valid_origin(fused)
+
+        monkeypatch.setenv('CORS_ORIGINS', f'{fused},https://extra.example.com')
+        origins = CORSConfig.get_environment_origins()
+        assert fused not in origins
+        assert 'https://extra.example.com' in origins
+        assert CORSConfig.is_origin_allowed('https://extra.example.com')
+
+    def test_wildcard_origins(self):
+        assert CORSConfig.is_origin_allowed('https://preview.vercel.app')
+        assert not CORSConfig.is_origin_allowed('http://preview.vercel.app')
+        assert not CORSConfig.is_origin_allowed('https://vercel.app.evil.com')
@@ -43,6 +43,23 @@ class TestDatabaseConfig:
         await config.close_pool()
 
 class TestConnectionPool:
+    async def test_jit_stays_off_after_release(self, monkeypatch):
+        from backend.config.database import DatabaseType
+
+        monkeypatch.setenv('ENVIRONMENT', 'test')
+        # One connection, so the second acquire gets the released one back
+        monkeypatch.setenv('DB_POOL_MIN', '1')
+        monkeypatch.setenv('DB_POOL_MAX', '1')
+        config = DatabaseConfig()
+        pool = await config.get_pool(DatabaseType.METADATA)
+        try:
+            async with pool.acquire() as conn:
+                assert await conn.fetchval('SHOW jit') == 'off'
+            async with pool.acquire() as conn:
+                assert await conn.fetchval('SHOW jit') == 'off'
+        finally:
+            await config.close_pools()
+
     async def test_get_db_pool(self):
         pool = await get_db_pool()
         assert isinstance(pool, asyncpg.Pool)
@@ -55,15 +72,17 @@ class TestConnectionPool:
         pool = await get_db_pool()
         connections = []
         
-        # Try to acquire more connections than the pool limit
-        for _ in range(15):  # Pool max_size is 10
+        max_size = pool.get_max_size()
+
+        # Try to acquire up to the pool limit
+        for _ in range(max_size):
             try:
                 conn = await pool.acquire()
                 connections.append(conn)
             except asyncpg.exceptions.TooManyConnectionsError:
                 break
         
-        assert len(connections) <= 10
+        assert len(connections) <= max_size
         
         # Release all connections
         for conn in connections:
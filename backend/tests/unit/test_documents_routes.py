@@ -0,0 +1,40 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from quart import Quart
+
+from backend.routes.documents import documents_bp
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def app():
+    app = Quart(__name__)
+    app.register_blueprint(documents_bp)
+    return app
+
+
+class TestDocumentContent:
+    async def test_rejects_caller_supplied_remote_url(self, app):
+        async with app.test_client() as client:
+            response = await client.get(
+                '/api/documents/content', query_string={'url': 'https://evil.example/x'}
+            )
+
+        assert response.status_code == 400
+        assert 'Location' not in response.headers
+
+    async def test_redirects_stored_blob_url_privately(self, app):
+        conn = MagicMock()
+        conn.fetchrow = AsyncMock(return_value={'file_path': 'https://blob.example/doc.pdf'})
+        pool = MagicMock()
+        pool.acquire.return_value.__aenter__ = AsyncMock(return_value=conn)
+        pool.acquire.return_value.__aexit__ = AsyncMock(return_value=False)
+
+        with patch('backend.routes.documents.get_metadata_pool', AsyncMock(return_value=pool)):
+            async with app.test_client() as client:
+                response = await client.get('/api/documents/content', query_string={'id': '7'})
+
+        assert response.status_code == 302
+        assert response.headers['Location'] == 'https://blob.example/doc.pdf'
+        assert response.headers['Cache-Control'].startswith('private')
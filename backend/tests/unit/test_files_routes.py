@@ -0,0 +1,19 @@
+import os
+
+import pytest
+
+from backend.routes.files import _get_extension, get_file_type, is_allowed_file
+
+
+class TestGetExtension:
+    @pytest.mark.parametrize('filename', [
+        'photo.JPG', 'archive.tar.gz', 'README', '.jpg', '..jpg', 'uploads/.pdf',
+        'uploads/.hidden.pdf', 'dir.v2/notes', 'trailing.',
+    ])
+    def test_matches_splitext(self, filename):
+        assert _get_extension(filename) == os.path.splitext(filename)[1][1:].lower()
+
+    def test_bare_dotfile_is_not_an_upload_type(self):
+        assert get_file_type('.jpg') is None
+        assert not is_allowed_file('.pdf')
+        assert get_file_type('scan.jpg') == 'images'
@@ -0,0 +1,65 @@
+import pytest
+from quart import Quart
+
+import backend.services as services
+from backend.routes.health import health_bp
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def app():
+    app = Quart(__name__)
+    app.register_blueprint(health_bp)
+    return app
+
+
+class TestServicesHealthRoute:
+    async def test_serves_cached_probe_results(self, app, monkeypatch):
+        calls = []
+
+        async def probe():
+            calls.append(1)
+            return {"status": "healthy"}
+
+        monkeypatch.setattr(services, "HEALTH_PROBES", {"storage": probe})
+        monkeypatch.setattr(services, "_health_cache", {})
+
+        async with app.test_client() as client:
+            first = await client.get('/api/health/services')
+            second = await client.get('/api/health/services')
+
+        assert first.status_code == 200
+        assert (await first.get_json())["services"] == {"storage": {"status": "healthy"}}
+        assert (await second.get_json())["status"] == "healthy"
+        assert len(calls) == 1
+
+    async def test_unhealthy_probe_degrades(self, app, monkeypatch):
+        async def probe():
+            raise OSError("unreachable")
+
+        monkeypatch.setattr(services, "HEALTH_PROBES", {"qdrant": probe})
+        monkeypatch.setattr(services, "_health_cache", {})
+
+        async with app.test_client() as client:
+            response = await client.get('/api/health/services')
+
+        body = await response.get_json()
+        assert response.status_code == 207
+        assert body["status"] == "degraded"
+        assert body["services"]["qdrant"] == {"status": "unhealthy", "error": "unreachable"}
+
+
+class TestOpenAIHealthRoute:
+    async def test_reports_probe_status(self, app, monkeypatch):
+        async def probe():
+            return {"status": "unhealthy", "service": "openai", "error": "Connection error."}
+
+        monkeypatch.setattr(services, "HEALTH_PROBES", {"openai": probe})
+        monkeypatch.setattr(services, "_health_cache", {})
+
+        async with app.test_client() as client:
+            response = await client.get('/api/health/openai')
+
+        assert response.status_code == 503
+        assert (await response.get_json())["error"] == "Connection error."
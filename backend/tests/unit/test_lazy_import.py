@@ -0,0 +1,29 @@
+import sys
+
+import pytest
+
+from backend.utils.lazy_import import lazy_import
+
+
+class TestLazyImport:
+    def test_module_is_imported_on_first_use(self):
+        sys.modules.pop('colorsys', None)
+        colorsys = lazy_import('colorsys')
+
+        assert 'colorsys' not in sys.modules
+        assert colorsys.rgb_to_hsv(1, 0, 0) == (0.0, 1.0, 1)
+        assert 'colorsys' in sys.modules
+
+    def test_attribute_can_be_called(self):
+        ordered_dict = lazy_import('collections.OrderedDict')
+
+        assert list(ordered_dict(a=1)) == ['a']
+
+    def test_missing_target_raises_import_error_on_use(self):
+        missing_module = lazy_import('backend.no_such_module')
+        missing_attr = lazy_import('collections.NoSuchThing')
+
+        with pytest.raises(ImportError):
+            missing_module.anything
+        with pytest.raises(ImportError):
+            missing_attr()
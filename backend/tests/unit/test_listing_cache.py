@@ -0,0 +1,131 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+import asyncpg
+
+from backend.services import listing_cache as listing_cache_module
+from backend.services.listing_cache import (
+    DOCUMENTS_CHANNEL,
+    INVENTORY_CHANNEL,
+    NOTIFY_TRIGGERS,
+    ListingCache,
+)
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def listener_pool():
+    conn = MagicMock()
+    conn.is_closed.return_value = False
+    conn.add_listener = AsyncMock()
+    conn.remove_listener = AsyncMock()
+    conn.fetchval = AsyncMock(return_value=len(NOTIFY_TRIGGERS))
+    conn.execute = AsyncMock()
+    conn.transaction.return_value.__aenter__ = AsyncMock()
+    conn.transaction.return_value.__aexit__ = AsyncMock(return_value=False)
+    pool = MagicMock()
+    pool.acquire = AsyncMock(return_value=conn)
+    pool.release = AsyncMock()
+    return pool, conn
+
+
+class TestListingCache:
+    async def test_bypassed_until_listening(self):
+        cache = ListingCache()
+        cache.set(INVENTORY_CHANNEL, 1, b"[]", 0)
+        assert cache.get(INVENTORY_CHANNEL, 1) is None
+
+    async def test_notification_clears_only_its_channel(self, listener_pool):
+        pool, conn = listener_pool
+        cache = ListingCache()
+        await cache.start(pool)
+
+        cache.set(INVENTORY_CHANNEL, 1, b"[1]", cache.generation(INVENTORY_CHANNEL))
+        cache.set(DOCUMENTS_CHANNEL, 1, b"[2]", cache.generation(DOCUMENTS_CHANNEL))
+        assert cache.get(INVENTORY_CHANNEL, 1) == b"[1]"
+
+        cache._on_notify(conn, 123, INVENTORY_CHANNEL, "")
+        assert cache.get(INVENTORY_CHANNEL, 1) is None
+        assert cache.get(DOCUMENTS_CHANNEL, 1) == b"[2]"
+
+    async def test_connection_loss_disables_cache(self, listener_pool):
+        pool, conn = listener_pool
+        cache = ListingCache()
+        await cache.start(pool)
+        cache.set(DOCUMENTS_CHANNEL, 1, b"[]", cache.generation(DOCUMENTS_CHANNEL))
+
+        cache._on_terminate(conn)
+        assert not cache.listening
+        assert cache.get(DOCUMENTS_CHANNEL, 1) is None
+
+    async def test_stop_releases_connection(self, listener_pool):
+        pool, conn = listener_pool
+        cache = ListingCache()
+        await cache.start(pool)
+        await cache.stop()
+
+        pool.release.assert_awaited_once_with(conn)
+        assert conn.remove_listener.await_count == len(ListingCache.CHANNELS)
+
+    async def test_set_after_invalidation_is_dropped(self, listener_pool):
+        pool, conn = listener_pool
+        cache = ListingCache()
+        await cache.start(pool)
+
+        # A reader fetches, a change is notified, then the reader stores
+        generation = cache.generation(INVENTORY_CHANNEL)
+        cache._on_notify(conn, 123, INVENTORY_CHANNEL, "")
+        cache.set(INVENTORY_CHANNEL, 1, b"[stale]", generation)
+        assert cache.get(INVENTORY_CHANNEL, 1) is None
+
+    async def test_entries_expire(self, listener_pool, monkeypatch):
+        pool, conn = listener_pool
+        cache = ListingCache()
+        await cache.start(pool)
+        now = [100.0]
+        monkeypatch.setattr(listing_cache_module.time, "monotonic", lambda: now[0])
+
+        cache.set(DOCUMENTS_CHANNEL, 1, b"[]", cache.generation(DOCUMENTS_CHANNEL))
+        now[0] += ListingCache.TTL - 1
+        assert cache.get(DOCUMENTS_CHANNEL, 1) == b"[]"
+        now[0] += 1
+        assert cache.get(DOCUMENTS_CHANNEL, 1) is None
+
+    async def test_creates_missing_triggers(self, listener_pool):
+        pool, conn = listener_pool
+        conn.fetchval.return_value = 0
+        cache = ListingCache()
+        await cache.start(pool)
+
+        script = conn.execute.await_args.args[0]
+        assert "CREATE TRIGGER user_documents_notify" in script
+        assert cache.listening
+
+    async def test_disabled_without_triggers(self, listener_pool):
+        pool, conn = listener_pool
+        conn.fetchval.return_value = 0
+        conn.execute.side_effect = asyncpg.InsufficientPrivilegeError("denied")
+        cache = ListingCache()
+        await cache.start(pool)
+
+        assert not cache.listening
+        conn.add_listener.assert_not_awaited()
+        pool.release.assert_awaited_once_with(conn)
+
+    async def test_channel_size_is_capped(self, listener_pool, monkeypatch):
+        pool, conn = listener_pool
+        cache = ListingCache()
+        await cache.start(pool)
+        monkeypatch.setattr(ListingCache, "MAX_ENTRIES", 2)
+        generation = cache.generation(INVENTORY_CHANNEL)
+
+        cache.set(INVENTORY_CHANNEL, (1, 50, 0), b"a", generation)
+        cache.set(INVENTORY_CHANNEL, (1, 50, 50), b"b", generation)
+        assert cache.get(INVENTORY_CHANNEL, (1, 50, 0)) == b"a"
+        cache.set(INVENTORY_CHANNEL, (1, 50, 100), b"c", generation)
+
+        # The least recently used page is the one evicted
+        assert cache.get(INVENTORY_CHANNEL, (1, 50, 50)) is None
+        assert cache.get(INVENTORY_CHANNEL, (1, 50, 0)) == b"a"
+        assert len(cache._entries[INVENTORY_CHANNEL]) == 2
@@ -0,0 +1,40 @@
+import logging
+from unittest.mock import patch
+
+import pytest
+
+from backend.config.logging import LogConfig
+
+
+@pytest.fixture
+def restore_root_logger():
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    for handler in handlers:
+        root.addHandler(handler)
+    root.setLevel(level)
+
+
+class TestLogConfig:
+    def test_repeated_setup_replaces_listener(self, tmp_path, monkeypatch, restore_root_logger):
+        monkeypatch.setenv("LOG_DIR", str(tmp_path))
+        with patch("atexit.register") as register:
+            config = LogConfig()
+            config.setup_logging()
+            first = config._listener
+            config.setup_logging()
+            config.setup_logging()
+
+        try:
+            assert register.call_count == 1
+            assert first is not config._listener
+            assert first._thread is None
+            assert all(getattr(h, "stream", None) is None
+                       for h in first.handlers if isinstance(h, logging.FileHandler))
+            assert len(logging.getLogger().handlers) == 1
+        finally:
+            config._stop_listener()
+        assert config._listener is None
@@ -0,0 +1,16 @@
+from backend.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, get_pagination
+
+
+class TestGetPagination:
+    def test_defaults(self):
+        assert get_pagination({}) == (DEFAULT_PAGE_SIZE, 0)
+
+    def test_explicit_values(self):
+        assert get_pagination({'limit': '20', 'offset': '40'}) == (20, 40)
+
+    def test_clamps_out_of_range_values(self):
+        assert get_pagination({'limit': '100000', 'offset': '-5'}) == (MAX_PAGE_SIZE, 0)
+        assert get_pagination({'limit': '0'}) == (1, 0)
+
+    def test_invalid_values_fall_back(self):
+        assert get_pagination({'limit': 'abc', 'offset': 'x'}) == (DEFAULT_PAGE_SIZE, 0)
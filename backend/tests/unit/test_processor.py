@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -27,6 +29,33 @@ class TestBaseProcessor:
         with pytest.raises(ValueError):
             await processor.validate_file("test.exe", b"test content")
 
+    async def test_process_batch_keeps_workers_busy(self):
+        class SleepyProcessor(BaseProcessor):
+            def __init__(self):
+                super().__init__()
+                self.active = 0
+                self.peak = 0
+
+            async def process_file(self, file_path):
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+                await asyncio.sleep(0.05 if file_path == 'slow' else 0)
+                self.active -= 1
+                if file_path == 'broken':
+                    raise ValueError('unreadable')
+                return file_path != 'skipped'
+
+        processor = SleepyProcessor()
+        files = ['slow', 'a', 'b', 'broken', 'skipped', 'c']
+        with patch.object(BaseProcessor, 'cleanup', AsyncMock()), \
+                patch('backend.services.processor.base_processor.storage'):
+            status = await processor.process_batch(files, batch_size=2)
+
+        assert status.processed_files == 4
+        assert status.failed_files == 2
+        assert [error['file'] for error in status.errors] == ['broken']
+        assert processor.peak == 2
+
 class TestDocumentProcessor:
     async def test_process_pdf_document(self, db_pool, openai_client, mock_processor_response):
         processor = DocumentProcessor(db_pool, openai_client)
@@ -150,6 +179,26 @@ class TestImageProcessor:
                 user_id=1
             )
 
+    async def test_store_batch_keeps_good_rows(self):
+        import asyncpg
+
+        conn = MagicMock()
+        conn.transaction.return_value.__aenter__ = AsyncMock()
+        conn.transaction.return_value.__aexit__ = AsyncMock(return_value=False)
+        conn.executemany = AsyncMock(side_effect=asyncpg.CheckViolationError('bad row'))
+        conn.execute = AsyncMock(
+            side_effect=[None, asyncpg.StringDataRightTruncationError('too long'), None]
+        )
+        processor = ImageProcessor(MagicMock(), MagicMock())
+        rows = [('a.jpg', ('a',)), ('b.jpg', ('b',)), ('c.jpg', ('c',))]
+
+        stored = await processor._store_batch(conn, rows)
+
+        assert stored == 2
+        assert conn.execute.await_count == 3
+        assert processor.status.failed_files == 1
+        assert [error['file'] for error in processor.status.errors] == ['b.jpg']
+
 class TestBatchProcessor:
     async def test_process_batch(self, db_pool, openai_client, mock_processor_response):
         processor = BatchProcessor(db_pool, openai_client)
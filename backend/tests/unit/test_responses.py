@@ -0,0 +1,51 @@
+import json
+from decimal import Decimal
+
+import pytest
+from quart import Quart, jsonify
+
+from backend.utils.responses import dumps, ojson_rows, setup_json_provider
+
+pytestmark = pytest.mark.asyncio
+
+
+class TestDumps:
+    def test_encodes_decimal_as_number(self):
+        assert json.loads(dumps({'price': Decimal('9.50')})) == {'price': 9.5}
+
+
+class TestJsonProvider:
+    async def test_jsonify_uses_installed_provider(self):
+        app = Quart(__name__)
+        setup_json_provider(app)
+
+        @app.route('/test')
+        async def test_route():
+            return jsonify({'price': Decimal('1.25'), 'name': 'bowl'})
+
+        async with app.test_client() as client:
+            response = await client.get('/test')
+            assert await response.get_json() == {'price': 1.25, 'name': 'bowl'}
+
+    async def test_jsonify_accepts_non_string_keys(self):
+        app = Quart(__name__)
+        setup_json_provider(app)
+
+        @app.route('/test')
+        async def test_route():
+            return jsonify({1: 'one', 'counts': {2: 3}})
+
+        async with app.test_client() as client:
+            response = await client.get('/test')
+            assert await response.get_json() == {'1': 'one', 'counts': {'2': 3}}
+            assert json.loads(dumps({1: 'one'})) == {'1': 'one'}
+
+
+class TestOjsonRows:
+    async def test_large_result_set_encoded(self):
+        app = Quart(__name__)
+        rows = [{'id': i} for i in range(1000)]
+
+        async with app.app_context():
+            response = await ojson_rows(rows)
+            assert json.loads(await response.get_data()) == rows
@@ -0,0 +1,35 @@
+import pytest
+from pydantic import ValidationError
+
+from backend.utils.schemas import ProcessFilesRequest, SearchDocumentsRequest
+
+
+class TestProcessFilesRequest:
+    def test_valid_body(self):
+        body = ProcessFilesRequest.model_validate_json(
+            '{"files": [{"blobUrl": "https://blob/x.jpg", "fileType": "image", "originalName": "x.jpg"}]}'
+        )
+        assert body.files[0].originalName == 'x.jpg'
+        assert body.instruction == ''
+
+    def test_rejects_empty_and_oversized_batches(self):
+        file = {'blobUrl': 'u', 'fileType': 'image', 'originalName': 'n'}
+        with pytest.raises(ValidationError):
+            ProcessFilesRequest.model_validate({'files': []})
+        with pytest.raises(ValidationError):
+            ProcessFilesRequest.model_validate({'files': [file] * 11})
+
+    def test_rejects_missing_file_information(self):
+        with pytest.raises(ValidationError):
+            ProcessFilesRequest.model_validate({'files': [{'blobUrl': 'u', 'fileType': 'image'}]})
+
+
+class TestSearchDocumentsRequest:
+    def test_strips_query(self):
+        body = SearchDocumentsRequest.model_validate_json('{"user_id": 1, "query": "  bowls "}')
+        assert body.query == 'bowls'
+        assert body.field == 'all'
+
+    def test_blank_query_rejected(self):
+        with pytest.raises(ValidationError):
+            SearchDocumentsRequest.model_validate({'user_id': 1, 'query': '   '})
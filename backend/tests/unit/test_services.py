@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+
+import backend.services as services
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def probes(monkeypatch):
+    """Two stub probes on short intervals, counting their runs."""
+    runs = {"fast": 0, "slow": 0}
+
+    def make(name):
+        async def probe():
+            runs[name] += 1
+            return {"status": "healthy"}
+        return probe
+
+    monkeypatch.setattr(services, "HEALTH_PROBES", {name: make(name) for name in runs})
+    monkeypatch.setattr(services, "MONITOR_INTERVALS", {"fast": 0.01, "slow": 60.0})
+    monkeypatch.setattr(services, "_health_cache", {})
+    monkeypatch.setattr(services, "_monitor", None)
+    return runs
+
+
+class TestMonitoring:
+    async def test_loops_start_and_stop(self, probes):
+        task = services.start_monitoring()
+        assert services.start_monitoring() is task
+
+        await asyncio.sleep(0.1)
+        assert probes["fast"] > 2
+        assert probes["slow"] == 1
+        assert set(services._health_cache) == {"fast", "slow"}
+
+        await services.stop_monitoring()
+        assert task.done() and not task.cancelled()
+        assert services._monitor is None
+
+        runs = dict(probes)
+        await asyncio.sleep(0.05)
+        assert probes == runs
+
+    async def test_restart_uses_fresh_event(self, probes):
+        first = services.start_monitoring()
+        await services.stop_monitoring()
+
+        second = services.start_monitoring()
+        assert second is not first
+        await asyncio.sleep(0.05)
+        assert not second.done()
+
+        await services.stop_monitoring()
+        assert second.done()
@@ -0,0 +1,43 @@
+import pytest
+
+from backend.task_manager import TaskManager
+
+pytestmark = pytest.mark.asyncio
+
+class TestTaskManager:
+    async def test_evicts_oldest_when_full(self):
+        manager = TaskManager(max_tasks=2)
+        manager.add_task('a')
+        manager.add_task('b')
+        manager.add_task('c')
+
+        assert list(manager.tasks) == ['b', 'c']
+        assert manager.get_task('a') is None
+        assert manager.get_task('c')['status'] == 'queued'
+
+    async def test_readding_task_refreshes_its_age(self):
+        manager = TaskManager(max_tasks=2)
+        manager.add_task('a')
+        manager.add_task('b')
+        manager.add_task('a')
+        manager.add_task('c')
+
+        assert list(manager.tasks) == ['a', 'c']
+
+    async def test_cleanup_removes_only_expired_prefix(self):
+        manager = TaskManager(ttl_seconds=60)
+        manager.add_task('old')
+        manager.add_task('new')
+        manager.tasks['old']['expires_at'] -= 120
+
+        manager.cleanup()
+
+        assert list(manager.tasks) == ['new']
+
+    async def test_expired_task_is_dropped_on_lookup(self):
+        manager = TaskManager(ttl_seconds=60)
+        manager.add_task('old')
+        manager.tasks['old']['expires_at'] -= 120
+
+        assert manager.get_task('old') is None
+        assert 'old' not in manager.tasks
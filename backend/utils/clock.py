@@ -0,0 +1,20 @@
+"""Cheap wall-clock timestamps for response payloads."""
+
+import time
+from datetime import datetime, timezone
+
+# (epoch second, ISO-8601 string) for the most recent call
+_iso_cache = [0, ""]
+
+
+def iso_now() -> str:
+    """Return the current UTC time as an ISO-8601 string at second precision.
+
+    The string is formatted at most once per second; calls within the same
+    second return the cached value.
+    """
+    now = int(time.time())
+    if now != _iso_cache[0]:
+        _iso_cache[1] = datetime.fromtimestamp(now, tz=timezone.utc).isoformat()
+        _iso_cache[0] = now
+    return _iso_cache[1]
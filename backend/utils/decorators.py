@@ -6,6 +6,8 @@ from typing import Callable, Any, Optional, Dict
 from quart import request, jsonify
 from datetime import datetime
 
+from backend.utils.clock import iso_now
+
 logger = logging.getLogger(__name__)
 
 def handle_errors(func: Callable) -> Callable:
@@ -19,7 +21,7 @@ def handle_errors(func: Callable) -> Callable:
             return jsonify({
                 'error': 'Resource not found',
                 'status': 404,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': iso_now()
             }), 404
         except ValueError as e:
             logger.warning(f"Invalid input in {func.__name__}: {e}")
@@ -27,21 +29,21 @@ def handle_errors(func: Callable) -> Callable:
                 'error': 'Invalid input',
                 'details': str(e),
                 'status': 400,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': iso_now()
             }), 400
         except PermissionError as e:
             logger.warning(f"Permission denied in {func.__name__}: {e}")
             return jsonify({
                 'error': 'Permission denied',
                 'status': 403,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': iso_now()
             }), 403
         except Exception as e:
             logger.error(f"Unexpected error in {func.__name__}: {e}", exc_info=True)
             return jsonify({
                 'error': 'Internal server error',
                 'status': 500,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': iso_now()
             }), 500
     return wrapper
 
@@ -56,7 +58,7 @@ def validate_json(*required_fields: str) -> Callable:
                     return jsonify({
                         'error': 'JSON data required',
                         'status': 400,
-                        'timestamp': datetime.now().isoformat()
+                        'timestamp': iso_now()
                     }), 400
                 missing_fields = [field for field in required_fields if not data.get(field)]
                 if missing_fields:
@@ -64,7 +66,7 @@ def validate_json(*required_fields: str) -> Callable:
                         'error': 'Missing required fields',
                         'missing_fields': missing_fields,
                         'status': 400,
-                        'timestamp': datetime.now().isoformat()
+                        'timestamp': iso_now()
                     }), 400
                 # Pass validated data as keyword argument
                 return await func(*args, data=data, **kwargs)
@@ -73,7 +75,7 @@ def validate_json(*required_fields: str) -> Callable:
                 return jsonify({
                     'error': 'Invalid JSON data',
                     'status': 400,
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': iso_now()
                 }), 400
         return wrapper
     return decorator
@@ -95,7 +97,7 @@ def auth_required(func: Callable) -> Callable:
             return jsonify({
                 'error': 'Authentication required',
                 'status': 401,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': iso_now()
             }), 401
         # Pass user_id as keyword argument
         return await func(*args, user_id=user_id, **kwargs)
@@ -119,7 +121,7 @@ def auth_and_db(db_type: str = 'metadata') -> Callable:
                 return jsonify({
                     'error': 'Authentication required',
                     'status': 401,
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': iso_now()
                 }), 401
             # Database connection
             try:
@@ -136,7 +138,7 @@ def auth_and_db(db_type: str = 'metadata') -> Callable:
                     return jsonify({
                         'error': 'Database connection failed',
                         'status': 503,
-                        'timestamp': datetime.now().isoformat()
+                        'timestamp': iso_now()
                     }), 503
                 async with pool.acquire() as db_conn:
                     # Pass both user_id and db_conn as keyword arguments
@@ -146,7 +148,7 @@ def auth_and_db(db_type: str = 'metadata') -> Callable:
                 return jsonify({
                     'error': 'Database operation failed',
                     'status': 500,
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': iso_now()
                 }), 500
         return wrapper
     return decorator
@@ -173,7 +175,7 @@ def rate_limit(max_requests: int = 100, window_seconds: int = 60) -> Callable:
                     'error': 'Rate limit exceeded',
                     'status': 429,
                     'retry_after': window_seconds,
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': iso_now()
                 }), 429
             # Increment counter
             request_counts[client_ip]['count'] += 1
@@ -0,0 +1,57 @@
+"""Deferred imports for optional or heavy service backends."""
+
+import importlib
+from typing import Any
+
+
+class _LazyProxy:
+    """Stand-in for a module or attribute that is imported on first use."""
+
+    __slots__ = ("_dotted", "_target")
+
+    def __init__(self, dotted: str):
+        self._dotted = dotted
+        self._target = None
+
+    def _resolve(self) -> Any:
+        target = self._target
+        if target is None:
+            try:
+                target = importlib.import_module(self._dotted)
+            except ModuleNotFoundError as e:
+                # "pkg.mod.Attr": import pkg.mod and take Attr from it. Only
+                # when the dotted name itself is missing, so a module that
+                # fails on its own imports still reports that error.
+                module_name, _, attr = self._dotted.rpartition(".")
+                if not module_name or e.name != self._dotted:
+                    raise
+                module = importlib.import_module(module_name)
+                try:
+                    target = getattr(module, attr)
+                except AttributeError as e:
+                    raise ImportError(
+                        f"cannot import name {attr!r} from {module_name!r}"
+                    ) from e
+            self._target = target
+        return target
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resolve(), name)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._resolve()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        state = "resolved" if self._target is not None else "unresolved"
+        return f"<lazy_import {self._dotted!r} ({state})>"
+
+
+def lazy_import(dotted: str) -> Any:
+    """Return a proxy that imports ``dotted`` when first used.
+
+    ``dotted`` names a module ("pkg.mod") or an attribute of one
+    ("pkg.mod.Attr"). A missing dependency raises ImportError at first use
+    rather than at import time, so callers keep their usual
+    ``except ImportError`` fallbacks.
+    """
+    return _LazyProxy(dotted)
@@ -0,0 +1,22 @@
+"""
+Pagination helpers for listing endpoints.
+"""
+
+from typing import Mapping, Tuple
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def _parse_int(value, default: int) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def get_pagination(args: Mapping) -> Tuple[int, int]:
+    """Read ``limit`` and ``offset`` from query args, clamped to sane bounds."""
+    limit = _parse_int(args.get('limit'), DEFAULT_PAGE_SIZE)
+    offset = _parse_int(args.get('offset'), 0)
+    return min(max(limit, 1), MAX_PAGE_SIZE), max(offset, 0)
@@ -0,0 +1,98 @@
+"""
+JSON response helpers for route handlers.
+Serializes with orjson when available and falls back to the stdlib encoder.
+"""
+
+import asyncio
+import json
+import logging
+from decimal import Decimal
+from typing import Any, Iterable, Mapping
+
+from quart import Response
+from quart.json.provider import DefaultJSONProvider
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    logger.warning("orjson not available, falling back to stdlib json for responses")
+
+JSON_MIMETYPE = 'application/json'
+
+# Result sets larger than this are materialized and encoded in a worker thread
+LARGE_RESULT_THRESHOLD = 500
+
+
+# Shared by dumps() and the jsonify provider. OPT_NON_STR_KEYS keeps dicts
+# with int/UUID keys encodable, as they were under the stdlib encoder.
+ORJSON_OPTIONS = (orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+
+def _default(obj: Any) -> Any:
+    """Serialize types orjson does not handle natively (e.g. NUMERIC columns)."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    return str(obj)
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode an object to JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default, option=ORJSON_OPTIONS)
+    return json.dumps(obj, default=_default).encode('utf-8')
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Quart JSON provider backed by orjson, so ``jsonify`` shares the fast encoder."""
+
+    # Key order carries no meaning for clients; skip the per-response sort
+    sort_keys = False
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        option = ORJSON_OPTIONS
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=_default, option=option).decode("utf-8")
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
+def setup_json_provider(app) -> None:
+    """Install the orjson provider on an app when orjson is available."""
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
+
+
+def ojson(obj: Any, status: int = 200) -> Response:
+    """Build a JSON response without going through jsonify."""
+    return Response(dumps(obj), status=status, mimetype=JSON_MIMETYPE)
+
+
+def _encode_rows(rows: Iterable[Mapping]) -> bytes:
+    """Convert database records to dicts and encode them as a JSON array."""
+    return dumps([dict(row) for row in rows])
+
+
+async def encode_rows(rows: list) -> bytes:
+    """Encode database records as a JSON array.
+
+    Large result sets are converted off the event loop so a big listing does
+    not stall other requests; small ones stay inline to skip the thread hand-off.
+    """
+    if len(rows) > LARGE_RESULT_THRESHOLD:
+        return await asyncio.to_thread(_encode_rows, rows)
+    return _encode_rows(rows)
+
+
+def raw_json(payload: bytes, status: int = 200) -> Response:
+    """Build a JSON response from already-encoded bytes."""
+    return Response(payload, status=status, mimetype=JSON_MIMETYPE)
+
+
+async def ojson_rows(rows: list, status: int = 200) -> Response:
+    """Build a JSON array response from database records."""
+    return raw_json(await encode_rows(rows), status)
@@ -0,0 +1,47 @@
+"""
+Request body schemas for JSON routes.
+Bodies are decoded and validated in one pass by pydantic-core instead of
+json.loads plus manual dict checks.
+"""
+
+from typing import List, Type, TypeVar
+
+from pydantic import BaseModel, Field, ValidationError
+from quart import request
+
+ModelT = TypeVar('ModelT', bound=BaseModel)
+
+
+class FileIn(BaseModel):
+    """An uploaded file descriptor sent to the processing endpoint."""
+
+    blobUrl: str = Field(min_length=1)
+    fileType: str = Field(min_length=1)
+    originalName: str = Field(min_length=1)
+
+
+class ProcessFilesRequest(BaseModel):
+    """Body of ``POST /api/process``."""
+
+    files: List[FileIn] = Field(min_length=1, max_length=10)
+    instruction: str = ''
+
+
+class SearchDocumentsRequest(BaseModel):
+    """Body of ``POST /api/documents/search``."""
+
+    user_id: int
+    query: str = Field(min_length=1)
+    field: str = 'all'  # options: 'all', 'content', 'metadata'
+
+    model_config = {'str_strip_whitespace': True}
+
+
+async def parse_body(model: Type[ModelT]) -> ModelT:
+    """Decode and validate the request body, raising ``ValidationError`` on bad input."""
+    return model.model_validate_json(await request.get_data())
+
+
+def validation_details(error: ValidationError) -> list:
+    """JSON-safe summary of a validation failure for the error response."""
+    return error.errors(include_url=False, include_context=False, include_input=False)
@@ -0,0 +1,47 @@
+"""Background worker for file processing jobs.
+
+Run separately from the web process, with the repository root on
+``PYTHONPATH`` like the web service::
+
+    arq backend.worker.WorkerSettings
+
+``render.yaml`` deploys it as the ``bartleby-worker`` service next to the
+Redis queue; without a running worker, jobs queued via ``REDIS_URL`` wait.
+
+Jobs are enqueued by ``routes/process.py`` when ``REDIS_URL`` is set; task
+status is written to ``processing_tasks`` so the web process can report it.
+"""
+
+import logging
+
+from arq.connections import RedisSettings
+
+from backend.config.database import db_config
+from backend.config.manager import config_manager
+from backend.routes.process import process_batch_async
+
+logger = logging.getLogger(__name__)
+
+
+async def process_files_job(ctx, task_id, files, instruction, user_id):
+    """Analyze and store a batch of uploaded files."""
+    logger.info("Worker picked up processing task %s", task_id)
+    await process_batch_async(task_id, files, instruction, user_id)
+
+
+async def shutdown(ctx):
+    """Close database pools held by the worker."""
+    await db_config.close_pools()
+
+
+class WorkerSettings:
+    """arq worker configuration."""
+
+    functions = [process_files_job]
+    on_shutdown = shutdown
+    redis_settings = RedisSettings.from_dsn(
+        config_manager.get("REDIS_URL", "redis://localhost:6379")
+    )
+    # Batches make many OpenAI and DB round-trips; keep concurrency modest
+    max_jobs = config_manager.get_int("WORKER_MAX_JOBS", 4)
+    job_timeout = 1800
@@ -103,7 +103,8 @@ class StreamlinedValidator:
             
             # Try to import OpenAI service
             try:
-                from backend.services.openai_service import openai_service
+                from backend.services import get_openai_service
+                openai_service = get_openai_service()
                 self.results["phase_2_openai"]["details"].append("✅ OpenAI service imports successfully")
                 
                 # Check if service is configured